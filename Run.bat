@@ -3,5 +3,8 @@ call venv\scripts\activate
 rem pytest -s -v -m "ui" --html .\Reports\LoginReport.html .\testCases\test_Home_Page.py --browser chrome --headless -n3
 rem pytest -s -v -m "smoke" --html .\Reports\TableHandle.html .\testCases\test_Handle_Table.py --browser chrome -n3
 rem pytest -s -v -m "smoke" --html .\Reports\LinkTest.html .\testCases\test_Links.py --browser chrome -n3
+rem pytest -s -v -m "smoke" --html .\Reports\SmokePooled.html .\testCases --browser chrome --driver-pool --pool-max-reuse 50 -n3
+rem pytest -s -v -m "smoke" --html .\Reports\SmokeLPT.html .\testCases --browser chrome --lpt-schedule -n3
+rem pytest -s -v -m "smoke" --html .\Reports\SmokeReplay.html .\testCases --browser chrome --traffic replay -n3
 pytest -s -v -m "smoke" --html .\Reports\Browser_Window_Handles.html .\testCases\test_Browser_Window_Handles.py --browser chrome
 pause
\ No newline at end of file
@@ -0,0 +1,637 @@
+import time
+
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from selenium.common.exceptions import JavascriptException, ScriptTimeoutException
+from selenium.common.exceptions import (StaleElementReferenceException, ElementClickInterceptedException,
+                                        ElementNotInteractableException)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from unititlies.eventLog import timed
+from unititlies.linkChecker import LinkChecker
+
+
+# Resolves as soon as the element reaches the requested state. A MutationObserver
+# (plus an animation-frame check for CSS-driven visibility) replaces the 500 ms
+# polling of WebDriverWait, so the whole wait is a single WebDriver command.
+DOM_WAIT_SCRIPT = """
+var strategy = arguments[0], locator = arguments[1], state = arguments[2], timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+var finished = false;
+
+function lookup() {
+    if (strategy === 'xpath') {
+        return document.evaluate(locator, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return document.querySelector(locator);
+}
+
+function isVisible(el) {
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && el.getClientRects().length > 0;
+}
+
+function check() {
+    var el = lookup();
+    if (!el) return null;
+    if (state === 'present') return el;
+    if (!isVisible(el)) return null;
+    if (state === 'clickable' && el.disabled) return null;
+    return el;
+}
+
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    done(result);
+}
+
+var observer = new MutationObserver(function () {
+    var el = check();
+    if (el) finish(el);
+});
+var timer = setTimeout(function () { finish(null); }, timeoutMs);
+
+var found = check();
+if (found) {
+    finish(found);
+} else {
+    observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+    if (state !== 'present') {
+        (function frame() {
+            if (finished) return;
+            var el = check();
+            if (el) { finish(el); return; }
+            window.requestAnimationFrame(frame);
+        })();
+    }
+}
+"""
+
+
+# Counts the fetch/XHR calls in flight in window.__pageReadyTracker (installed once per document).
+# BasePage.open registers it through CDP before navigating (Chromium), so it also sees the
+# requests a page sends while loading; elsewhere PAGE_READY_SCRIPT installs it on first use.
+REQUEST_TRACKER_SCRIPT = """
+(function () {
+    if (window.__pageReadyTracker) return;
+    var tracker = window.__pageReadyTracker = {inflight: {}, next: 0};
+    var track = function (url) {
+        var id = tracker.next++;
+        tracker.inflight[id] = {url: url, started: Date.now()};
+        return function () { delete tracker.inflight[id]; };
+    };
+    if (window.fetch) {
+        var nativeFetch = window.fetch;
+        window.fetch = function (input) {
+            var settle = track(String(input && input.url || input));
+            return nativeFetch.apply(this, arguments).then(
+                function (response) { settle(); return response; },
+                function (error) { settle(); throw error; });
+        };
+    }
+    var nativeOpen = XMLHttpRequest.prototype.open, nativeSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__pageReadyUrl = String(url);
+        return nativeOpen.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.send = function () {
+        this.addEventListener('loadend', track(this.__pageReadyUrl));
+        return nativeSend.apply(this, arguments);
+    };
+})();
+"""
+
+
+# Resolves once the page is usable: the document has loaded, no tracked fetch/XHR or image is
+# still loading, and neither the DOM structure nor the resource timeline has changed for
+# quietMs. Requests open longer than longRequestMs (long polling, streaming) do not hold the
+# page up but are reported. Otherwise resolves at timeoutMs with what was pending.
+PAGE_READY_SCRIPT = REQUEST_TRACKER_SCRIPT + """
+var quietMs = arguments[0], timeoutMs = arguments[1], longRequestMs = arguments[2];
+var done = arguments[arguments.length - 1];
+var start = Date.now();
+var tracker = window.__pageReadyTracker;
+
+// Last network or DOM activity; starts at the end of the last resource that already finished
+var origin = performance.timeOrigin || performance.timing.navigationStart;
+var finishedEntries = performance.getEntriesByType('resource');
+var lastActivity = origin, lastCause = 'page load';
+finishedEntries.forEach(function (entry) {
+    if (origin + entry.responseEnd > lastActivity) {
+        lastActivity = origin + entry.responseEnd;
+        lastCause = 'resource ' + entry.name;
+    }
+});
+var loaded = performance.getEntriesByType('navigation')[0];
+if (loaded && origin + loaded.loadEventEnd > lastActivity) {
+    lastActivity = origin + loaded.loadEventEnd;
+    lastCause = 'page load';
+}
+
+function touch(cause) {
+    lastActivity = Date.now();
+    lastCause = cause;
+}
+
+var observer = new MutationObserver(function (records) {
+    touch('DOM change in <' + records[records.length - 1].target.nodeName.toLowerCase() + '>');
+});
+observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+
+var resources = null;
+if (typeof PerformanceObserver === 'function') {
+    resources = new PerformanceObserver(function (list) {
+        var entries = list.getEntries();
+        touch('resource ' + entries[entries.length - 1].name);
+    });
+    try { resources.observe({type: 'resource'}); } catch (e) { resources = null; }
+}
+
+function pending(now) {
+    var waiting = [], longRunning = [];
+    if (document.readyState !== 'complete') waiting.push('document (' + document.readyState + ')');
+    Object.keys(tracker.inflight).forEach(function (id) {
+        var request = tracker.inflight[id];
+        (now - request.started < longRequestMs ? waiting : longRunning).push(request.url);
+    });
+    Array.prototype.forEach.call(document.images, function (img) {
+        if (!img.complete && img.loading !== 'lazy') waiting.push(img.currentSrc || img.src);
+    });
+    return {waiting: waiting, longRunning: longRunning};
+}
+
+function finish(ready, state, now) {
+    observer.disconnect();
+    if (resources) resources.disconnect();
+    done({
+        ready: ready,
+        elapsedMs: now - start,
+        pending: state.waiting,
+        longRequests: state.longRunning,
+        quietMs: now - lastActivity,
+        lastActivity: lastCause
+    });
+}
+
+(function check() {
+    var now = Date.now(), state = pending(now);
+    if (!state.waiting.length && now - lastActivity >= quietMs) return finish(true, state, now);
+    if (now - start >= timeoutMs) return finish(false, state, now);
+    setTimeout(check, 50);
+})();
+"""
+
+
+# Sets every (xpath, value) pair through the native value setter and fires input/change,
+# so React-controlled inputs update their state. Returns the XPaths that were not found.
+FILL_FORM_SCRIPT = """
+var missing = [];
+arguments[0].forEach(function (field) {
+    var el = document.evaluate(field[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (!el) {
+        missing.push(field[0]);
+        return;
+    }
+    var proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, field[1]);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+});
+return missing;
+"""
+
+
+# State of every <img> on the page in one call. An image is broken when it has
+# finished loading (complete) but has no intrinsic size (naturalWidth 0).
+IMAGE_AUDIT_SCRIPT = """
+return Array.prototype.map.call(document.images, function (img) {
+    return {
+        src: img.currentSrc || img.src,
+        alt: img.alt,
+        complete: img.complete,
+        naturalWidth: img.naturalWidth,
+        naturalHeight: img.naturalHeight,
+        displayed: img.getClientRects().length > 0 && window.getComputedStyle(img).visibility !== 'hidden'
+    };
+});
+"""
+
+
+# Every <a> on the page in one call. Links without a real href (href="javascript:...")
+# are the demoqa API links, which call /<id> on the same origin.
+COLLECT_LINKS_SCRIPT = """
+return Array.prototype.map.call(document.querySelectorAll('a'), function (a) {
+    var href = a.getAttribute('href') || '';
+    var isApiLink = a.id && (href === '' || href.indexOf('javascript') === 0);
+    return {id: a.id, text: a.innerText.trim(), url: isApiLink ? location.origin + '/' + a.id : a.href};
+});
+"""
+
+
+class BasePage:
+    """
+    Shared wait engine for all page objects.
+
+    The driver runs with implicit wait at zero, so every wait in the page
+    objects is explicit and happens here. Lookups that expect an element
+    wait up to DEFAULT_TIMEOUT; presence/absence checks return immediately.
+    """
+
+    DEFAULT_TIMEOUT = 10
+
+    # Use the single round-trip MutationObserver wait for presence/visibility/clickable
+    EVENT_DRIVEN_WAITS = True
+
+    # Page-ready detection (wait_until_ready): how long the network and DOM must stay quiet,
+    # and the age after which an open request counts as long polling rather than loading
+    PAGE_QUIET_MS = 300
+    LONG_REQUEST_MS = 5000
+
+    # Form field name -> XPath of the text input, used by fill_form (set by each page)
+    FORM_FIELDS = {}
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    # ---------- Explicit waits ----------
+    def wait_for(self, condition, timeout=None):
+        """
+        Wait until `condition` (an expected condition) returns a truthy value.
+        """
+        return WebDriverWait(self.driver, self.DEFAULT_TIMEOUT if timeout is None else timeout).until(condition)
+
+    def wait_for_presence(self, by, locator, timeout=None):
+        if self.EVENT_DRIVEN_WAITS:
+            return self.wait_for_dom(by, locator, "present", timeout)
+        return self.wait_for(EC.presence_of_element_located((by, locator)), timeout)
+
+    def wait_for_visibility(self, by, locator, timeout=None):
+        if self.EVENT_DRIVEN_WAITS:
+            return self.wait_for_dom(by, locator, "visible", timeout)
+        return self.wait_for(EC.visibility_of_element_located((by, locator)), timeout)
+
+    def wait_for_clickable(self, by, locator, timeout=None):
+        if self.EVENT_DRIVEN_WAITS:
+            return self.wait_for_dom(by, locator, "clickable", timeout)
+        return self.wait_for(EC.element_to_be_clickable((by, locator)), timeout)
+
+    def wait_for_invisibility(self, by, locator, timeout=None):
+        return self.wait_for(EC.invisibility_of_element_located((by, locator)), timeout)
+
+    @timed
+    def wait_for_dom(self, by, locator, state="present", timeout=None):
+        """
+        Event-driven wait: inject a MutationObserver and return the element as soon as
+        it is present, visible or clickable (`state`). Costs one WebDriver command.
+        Falls back to the polling WebDriverWait for locator types the script cannot
+        evaluate, or when the page navigates away while waiting.
+        """
+        timeout = self.DEFAULT_TIMEOUT if timeout is None else timeout
+        conditions = {
+            "present": EC.presence_of_element_located,
+            "visible": EC.visibility_of_element_located,
+            "clickable": EC.element_to_be_clickable,
+        }
+        polling_condition = conditions[state]((by, locator))
+
+        strategy, selector = self._to_script_locator(by, locator)
+        if strategy is None:
+            return self.wait_for(polling_condition, timeout)
+
+        try:
+            element = self.driver.execute_async_script(DOM_WAIT_SCRIPT, strategy, selector, state, int(timeout * 1000))
+        except TimeoutException:
+            raise
+        except WebDriverException:
+            # e.g. the document was unloaded mid-wait; finish with the polling wait
+            return self.wait_for(polling_condition, timeout)
+
+        if element is None:
+            raise TimeoutException(f"Element '{locator}' was not {state} after {timeout} seconds.")
+        return element
+
+    @staticmethod
+    def _to_script_locator(by, locator):
+        """
+        Translate a Selenium locator into ('xpath' | 'css', selector) for DOM_WAIT_SCRIPT.
+        Returns (None, None) when the locator type is not supported by the script.
+        """
+        if by == By.XPATH:
+            return "xpath", locator
+        if by == By.CSS_SELECTOR:
+            return "css", locator
+        if by == By.ID:
+            return "css", f'[id="{locator}"]'
+        if by == By.NAME:
+            return "css", f'[name="{locator}"]'
+        if by == By.TAG_NAME:
+            return "css", locator
+        if by == By.CLASS_NAME:
+            return "css", f".{locator}"
+        return None, None
+
+    def wait_for_page_load(self, timeout=None):
+        """
+        Wait until the current document has finished loading and gone quiet (see wait_until_ready).
+        Without EVENT_DRIVEN_WAITS only readyState 'complete' is polled for.
+        """
+        if self.EVENT_DRIVEN_WAITS:
+            self.wait_until_ready(timeout)
+            return
+        self.wait_for(lambda driver: driver.execute_script("return document.readyState") == "complete", timeout)
+
+    @timed
+    def wait_until_ready(self, timeout=None, quiet_ms=None):
+        """
+        Wait until the page is usable: the document has loaded, no tracked fetch/XHR or
+        image is in flight, and the network and DOM have been quiet for `quiet_ms`.
+        Returns as soon as that holds, in one WebDriver command on the happy path.
+
+        fetch/XHR calls are tracked from the moment REQUEST_TRACKER_SCRIPT runs in the
+        document: from its start when the page was loaded through open() in Chromium,
+        otherwise from the first wait. Untracked requests the page sent while loading
+        still end the quiet window when they finish, but cannot hold the page up.
+
+        Returns:
+            dict: Diagnostics from PAGE_READY_SCRIPT (elapsedMs, lastActivity, longRequests, ...).
+
+        Raises:
+            TimeoutException: The page was not ready within `timeout` seconds; the message
+                names the requests that were still pending or the last DOM/network activity.
+        """
+        timeout = self.DEFAULT_TIMEOUT if timeout is None else timeout
+        quiet_ms = self.PAGE_QUIET_MS if quiet_ms is None else quiet_ms
+        deadline = time.monotonic() + timeout
+
+        while True:
+            remaining_ms = int(max(0.0, deadline - time.monotonic()) * 1000)
+            try:
+                state = self.driver.execute_async_script(PAGE_READY_SCRIPT, quiet_ms, remaining_ms,
+                                                         self.LONG_REQUEST_MS)
+            except ScriptTimeoutException:
+                # `timeout` is longer than the driver's script timeout
+                raise TimeoutException(f"Page was not ready after {timeout} seconds: "
+                                       "the driver's script timeout expired first.")
+            except JavascriptException as e:
+                if not self._is_navigation_error(e):
+                    raise
+                # The document was replaced mid-wait (redirect, reload): wait on the new one
+                if time.monotonic() >= deadline:
+                    raise TimeoutException(f"Page was not ready after {timeout} seconds: it kept navigating.")
+                time.sleep(0.05)
+                continue
+            if state["ready"]:
+                return state
+            raise TimeoutException(self._describe_not_ready(state, timeout))
+
+    @staticmethod
+    def _is_navigation_error(error):
+        # How Chromium and Firefox report a script whose document went away
+        message = (error.msg or "").lower()
+        return any(text in message for text in ("unloaded", "context was destroyed", "cannot find context"))
+
+    @staticmethod
+    def _describe_not_ready(state, timeout):
+        if state["pending"]:
+            shown = ", ".join(state["pending"][:5])
+            more = f" and {len(state['pending']) - 5} more" if len(state["pending"]) > 5 else ""
+            return f"Page was not ready after {timeout} seconds, still loading: {shown}{more}"
+        return (f"Page was not ready after {timeout} seconds, never quiet for long enough: "
+                f"last activity {state['quietMs']} ms earlier ({state['lastActivity']})")
+
+    def open(self, url, timeout=None):
+        """
+        Load `url` and wait until the page is ready (see wait_until_ready).
+        """
+        self.track_requests()
+        self.driver.get(url)
+        return self.wait_until_ready(timeout)
+
+    def track_requests(self):
+        """
+        Register REQUEST_TRACKER_SCRIPT for every document the current tab loads from
+        now on (Chromium, through CDP), so wait_until_ready also sees the requests a
+        page sends while loading. Done once per tab.
+
+        Returns:
+            bool: False when the browser has no CDP (the tracker is then installed on first wait).
+        """
+        if not hasattr(self.driver, "execute_cdp_cmd"):
+            return False
+        # CDP commands reach the current tab only, so remember which tabs have the tracker
+        tracked_tabs = self.driver.__dict__.setdefault("_request_tracking", set())
+        tab = self.driver.current_window_handle
+        if tab not in tracked_tabs:
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": REQUEST_TRACKER_SCRIPT})
+            tracked_tabs.add(tab)
+        return True
+
+    def wait_for_new_window(self, known_handles, timeout=None):
+        """
+        Wait until a window/tab that is not in `known_handles` opens and return its handle.
+        Returns None if no new window opens within `timeout` seconds.
+        """
+        try:
+            self.wait_for(EC.new_window_is_opened(list(known_handles)), timeout)
+        except TimeoutException:
+            return None
+        new_handles = [handle for handle in self.driver.window_handles if handle not in known_handles]
+        return new_handles[0] if new_handles else None
+
+    # ---------- Lookups ----------
+    @timed
+    def find(self, by, locator, timeout=None):
+        """
+        Find a single element, waiting for it to be present.
+        Raises NoSuchElementException (like driver.find_element) when it never shows up.
+        """
+        try:
+            return self.wait_for_presence(by, locator, timeout)
+        except TimeoutException:
+            raise NoSuchElementException(f"Element not found: {locator}")
+
+    def find_all(self, by, locator):
+        """
+        Return all matching elements right now, without waiting.
+        """
+        return self.driver.find_elements(by, locator)
+
+    def wait_for_all(self, by, locator, timeout=None):
+        """
+        Wait until at least one element matches, then return all of them.
+        Returns an empty list if none appear within `timeout` seconds.
+        """
+        try:
+            self.wait_for_presence(by, locator, timeout)
+        except TimeoutException:
+            return []
+        return self.find_all(by, locator)
+
+    # ---------- Fast presence / absence checks ----------
+    def is_present(self, by, locator):
+        """
+        Check if the element is in the DOM right now (returns in one round-trip).
+        """
+        return len(self.find_all(by, locator)) > 0
+
+    def is_visible(self, by, locator, timeout=None):
+        """
+        Check if the element becomes visible within `timeout` seconds.
+        """
+        try:
+            self.wait_for_visibility(by, locator, timeout)
+            return True
+        except TimeoutException:
+            return False
+
+    def wait_for_absence(self, by, locator, timeout=None):
+        """
+        Wait until no element matches the locator. Returns True as soon as it is gone.
+        """
+        try:
+            self.wait_for(lambda driver: len(driver.find_elements(by, locator)) == 0, timeout)
+            return True
+        except TimeoutException:
+            return False
+
+    # ---------- Actions ----------
+    @timed
+    def scroll_and_click(self, xpath, element_name, timeout=10, scroll_attempts=5):
+        """
+        Scroll to the element and click it. The element is located once; retries
+        work on that reference and re-locate it only if it went stale.
+        Returns the clicked element, or None if it could not be clicked.
+        """
+        try:
+            element = self.wait_for_presence(By.XPATH, xpath, timeout)
+        except TimeoutException:
+            print(f"{element_name} not found.")
+            return None
+        return self.click_element(element, element_name, relocate=lambda: self.wait_for_presence(By.XPATH, xpath, timeout),
+                                  timeout=timeout, attempts=scroll_attempts)
+
+    @timed
+    def fill_form(self, mapping, real_typing=False, timeout=10):
+        """
+        Fill several text inputs at once.
+
+        Args:
+            mapping (dict): Field name (a key of FORM_FIELDS) -> value.
+            real_typing (bool): Type with clear() + send_keys() field by field, for tests
+                that exercise keystrokes. By default all fields are set in one script call.
+            timeout (int): Seconds to wait for a field that is not rendered yet.
+        """
+        unknown = [name for name in mapping if name not in self.FORM_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown form field(s): {', '.join(unknown)}. Known fields: {', '.join(self.FORM_FIELDS)}")
+
+        fields = [(self.FORM_FIELDS[name], "" if value is None else str(value)) for name, value in mapping.items()]
+
+        if real_typing:
+            for xpath, value in fields:
+                element = self.find(By.XPATH, xpath, timeout)
+                element.clear()
+                element.send_keys(value)
+            return
+
+        missing = self.driver.execute_script(FILL_FORM_SCRIPT, fields)
+        if missing:
+            # The form is still rendering (e.g. a modal opening): wait once, then fill what was missed
+            self.find(By.XPATH, missing[0], timeout)
+            missing = self.driver.execute_script(FILL_FORM_SCRIPT, [field for field in fields if field[0] in missing])
+            if missing:
+                raise NoSuchElementException(f"Form field(s) not found: {', '.join(missing)}")
+
+    @timed
+    def collect_links(self):
+        """
+        Get id, text and target URL of every link on the page with a single script call.
+        """
+        return self.driver.execute_script(COLLECT_LINKS_SCRIPT)
+
+    @timed
+    def audit_images(self, check_urls=False, checker=None):
+        """
+        Check every image on the page with a single script call.
+
+        Args:
+            check_urls (bool): Also request every image URL concurrently (HEAD) and report its HTTP status.
+            checker (LinkChecker): Checker to use for check_urls; by default one with the browser's cookies.
+
+        Returns:
+            dict: {"total", "loaded", "broken": [src, ...], "images": [per-image dict]}. Each image has
+            src, alt, complete, naturalWidth, naturalHeight, displayed, broken and, with check_urls,
+            http_status / http_error.
+        """
+        images = self.driver.execute_script(IMAGE_AUDIT_SCRIPT)
+        for image in images:
+            image["broken"] = image["complete"] and image["naturalWidth"] == 0
+
+        if check_urls and images:
+            own_checker = checker is None
+            if own_checker:
+                checker = LinkChecker.from_driver(self.driver, method="HEAD")
+            try:
+                results = checker.check(image["src"] for image in images if image["src"])
+            finally:
+                if own_checker:
+                    checker.close()
+            for image in images:
+                result = results.get(image["src"], {})
+                image["http_status"] = result.get("status")
+                image["http_error"] = result.get("error")
+
+        return {
+            "total": len(images),
+            "loaded": sum(1 for image in images if image["complete"] and not image["broken"]),
+            "broken": [image["src"] for image in images if image["broken"]],
+            "images": images,
+        }
+
+    @timed
+    def click_element(self, element, element_name, relocate=None, timeout=10, attempts=5):
+        """
+        Scroll to an element we already hold and click it (two commands on the happy path).
+
+        Args:
+            element (WebElement): The element to click.
+            element_name (str): Name used in the failure message.
+            relocate (callable): Returns a fresh reference when `element` goes stale
+                (e.g. the row was re-rendered); without it a stale element is not retried.
+            timeout (int): Seconds to wait for the element to become clickable between attempts.
+            attempts (int): Number of click attempts.
+
+        Returns:
+            WebElement: The clicked element, or None if it could not be clicked.
+        """
+        for attempt in range(attempts):
+            if element is None:
+                break
+            try:
+                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+                element.click()
+                return element
+            except StaleElementReferenceException:
+                if relocate is None:
+                    break
+                try:
+                    element = relocate()
+                except TimeoutException:
+                    element = None
+            except ElementClickInterceptedException:
+                # Covered by another element (e.g. an ad banner): use JavaScript as a fallback
+                self.driver.execute_script("arguments[0].click();", element)
+                return element
+            except ElementNotInteractableException:
+                # Still animating or hidden: wait on the reference we already hold
+                try:
+                    self.wait_for(EC.element_to_be_clickable(element), timeout)
+                except TimeoutException:
+                    continue
+
+        print(f"{element_name} could not be clicked after {attempts} attempts.")
+        return None
@@ -1,8 +1,10 @@
-from selenium.common import NoSuchElementException
+from selenium.common import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.by import By
 
+from pageObjects.BasePage import BasePage
 
-class BrowserWindowHandle:
+
+class BrowserWindowHandle(BasePage):
 
     # LOCATORS
     # Handle for the Browser Windows section
@@ -56,16 +58,12 @@ class BrowserWindowHandle:
     PARENT_FRAME_XPATH = "//iframe[@id='frame1']"
     CHILD_FRAME_XPATH = "//iframe[@srcdoc='<p>Child Iframe</p>']"
 
-    def __init__(self, driver):
-        # Initialize with a Selenium WebDriver instance
-        self.driver = driver
-
     def click_on_browser_window_option(self):
         """
         Click on the 'Browser Windows' option.
         """
         try:
-            browser_window_option = self.driver.find_element(By.XPATH, self.OPTION_BROWSER_WINDOW_XPATH)
+            browser_window_option = self.find(By.XPATH, self.OPTION_BROWSER_WINDOW_XPATH)
             browser_window_option.click()
         except NoSuchElementException:
             print("Browser Windows option not found.")
@@ -75,7 +73,7 @@ class BrowserWindowHandle:
         Click on the 'New Tab' button to open a new browser tab.
         """
         try:
-            new_tab_button = self.driver.find_element(By.XPATH, self.BUTTON_NEW_TAB_XPATH)
+            new_tab_button = self.find(By.XPATH, self.BUTTON_NEW_TAB_XPATH)
             new_tab_button.click()
         except NoSuchElementException:
             print("New Tab button not found.")
@@ -85,7 +83,7 @@ class BrowserWindowHandle:
         Get the text from the new tab to verify it opened correctly.
         """
         try:
-            new_tab_text = self.driver.find_element(By.XPATH, self.TEXT_NEW_TAB_XPATH).text
+            new_tab_text = self.find(By.XPATH, self.TEXT_NEW_TAB_XPATH).text
             return new_tab_text
         except NoSuchElementException:
             print("Text in the new tab not found.")
@@ -96,7 +94,7 @@ class BrowserWindowHandle:
         Click on the 'New Window' button to open a new browser window.
         """
         try:
-            new_window_button = self.driver.find_element(By.XPATH, self.BUTTON_NEW_WINDOW_XPATH)
+            new_window_button = self.find(By.XPATH, self.BUTTON_NEW_WINDOW_XPATH)
             new_window_button.click()
         except NoSuchElementException:
             print("New Window button not found.")
@@ -106,7 +104,7 @@ class BrowserWindowHandle:
         Get the text from the new window to verify it opened correctly.
         """
         try:
-            new_window_text = self.driver.find_element(By.XPATH, self.TEXT_NEW_WINDOW_XPATH).text
+            new_window_text = self.find(By.XPATH, self.TEXT_NEW_WINDOW_XPATH).text
             return new_window_text
         except NoSuchElementException:
             print("Text in the new window not found.")
@@ -117,7 +115,7 @@ class BrowserWindowHandle:
         Click on the 'New Window Message' button to open a new browser window with a message.
         """
         try:
-            new_window_message_button = self.driver.find_element(By.XPATH, self.BUTTON_NEW_WINDOW_MESSAGE_XPATH)
+            new_window_message_button = self.find(By.XPATH, self.BUTTON_NEW_WINDOW_MESSAGE_XPATH)
             new_window_message_button.click()
         except NoSuchElementException:
             print("New Window Message button not found.")
@@ -127,7 +125,7 @@ class BrowserWindowHandle:
         Get the text content from the new window (plain page, no DOM structure).
         """
         try:
-            body_text = self.driver.find_element(By.TAG_NAME, "body").text
+            body_text = self.find(By.TAG_NAME, "body").text
             return body_text.strip()
         except Exception as e:
             print(f"Failed to get text from new window: {e}")
@@ -138,7 +136,7 @@ class BrowserWindowHandle:
         Click on the 'Alerts' option to navigate to the Alerts page.
         """
         try:
-            alerts_option = self.driver.find_element(By.XPATH, self.OPTION_ALERTS_XPATH)
+            alerts_option = self.find(By.XPATH, self.OPTION_ALERTS_XPATH)
             alerts_option.click()
         except NoSuchElementException:
             print("Alerts option not found.")
@@ -148,7 +146,7 @@ class BrowserWindowHandle:
         Click on the 'Click Me and See Alert' button to trigger an alert.
         """
         try:
-            alert_button = self.driver.find_element(By.XPATH, self.BUTTON_CLICK_ME_AND_SEE_ALERT_XPATH)
+            alert_button = self.find(By.XPATH, self.BUTTON_CLICK_ME_AND_SEE_ALERT_XPATH)
             alert_button.click()
         except NoSuchElementException:
             print("Click Me and See Alert button not found.")
@@ -158,7 +156,7 @@ class BrowserWindowHandle:
         Click on the 'After Five Seconds' button to trigger a delayed alert.
         """
         try:
-            delayed_alert_button = self.driver.find_element(By.XPATH, self.BUTTON_AFTER_FIVE_SECONDS_XPATH)
+            delayed_alert_button = self.find(By.XPATH, self.BUTTON_AFTER_FIVE_SECONDS_XPATH)
             delayed_alert_button.click()
         except NoSuchElementException:
             print("After Five Seconds button not found.")
@@ -169,7 +167,7 @@ class BrowserWindowHandle:
         Scrolls until the element is visible before clicking.
         """
         try:
-            confirm_box_button = self.driver.find_element(By.XPATH, self.BUTTON_CONFIRM_BOX_XPATH)
+            confirm_box_button = self.find(By.XPATH, self.BUTTON_CONFIRM_BOX_XPATH)
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", confirm_box_button)
             confirm_box_button.click()
         except NoSuchElementException:
@@ -180,7 +178,7 @@ class BrowserWindowHandle:
         Get the text from the confirmation result element.
         """
         try:
-            confirm_result_text = self.driver.find_element(By.XPATH, self.TEXT_CONFIRM_RESULT_XPATH).text
+            confirm_result_text = self.find(By.XPATH, self.TEXT_CONFIRM_RESULT_XPATH).text
             return confirm_result_text
         except NoSuchElementException:
             print("Confirm Result text not found.")
@@ -192,7 +190,7 @@ class BrowserWindowHandle:
         Scrolls until the element is visible before clicking.
         """
         try:
-            prompt_box_button = self.driver.find_element(By.XPATH, self.BUTTON_PROMPT_BOX_XPATH)
+            prompt_box_button = self.find(By.XPATH, self.BUTTON_PROMPT_BOX_XPATH)
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", prompt_box_button)
             prompt_box_button.click()
         except NoSuchElementException:
@@ -203,7 +201,7 @@ class BrowserWindowHandle:
         Get the text from the prompt result element.
         """
         try:
-            prompt_result_text = self.driver.find_element(By.XPATH, self.TEXT_PROMPT_RESULT_XPATH).text
+            prompt_result_text = self.find(By.XPATH, self.TEXT_PROMPT_RESULT_XPATH).text
             return prompt_result_text
         except NoSuchElementException:
             print("Prompt Result text not found.")
@@ -215,7 +213,7 @@ class BrowserWindowHandle:
         Scrolls until the element is visible before clicking.
         """
         try:
-            modal_option = self.driver.find_element(By.XPATH, self.OPTION_MODAL_XPATH)
+            modal_option = self.find(By.XPATH, self.OPTION_MODAL_XPATH)
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", modal_option)
             modal_option.click()
         except NoSuchElementException:
@@ -226,7 +224,7 @@ class BrowserWindowHandle:
         Click on the 'Small Modal' button to open a small modal dialog.
         """
         try:
-            small_modal_button = self.driver.find_element(By.XPATH, self.BUTTON_SMALL_MODAL_XPATH)
+            small_modal_button = self.find(By.XPATH, self.BUTTON_SMALL_MODAL_XPATH)
             small_modal_button.click()
         except NoSuchElementException:
             print("Small Modal button not found.")
@@ -236,7 +234,7 @@ class BrowserWindowHandle:
         Get the text content from the modal dialog.
         """
         try:
-            modal_content_text = self.driver.find_element(By.XPATH, self.TEXT_MODAL_CONTENT_XPATH).text
+            modal_content_text = self.find(By.XPATH, self.TEXT_MODAL_CONTENT_XPATH).text
             return modal_content_text
         except NoSuchElementException:
             print("Modal content text not found.")
@@ -247,7 +245,7 @@ class BrowserWindowHandle:
         Get the name of the small modal dialog.
         """
         try:
-            small_modal_name = self.driver.find_element(By.XPATH, self.TEXT_NAME_OF_SMALL_MODAL_XPATH).text
+            small_modal_name = self.find(By.XPATH, self.TEXT_NAME_OF_SMALL_MODAL_XPATH).text
             return small_modal_name
         except NoSuchElementException:
             print("Name of small modal text not found.")
@@ -258,7 +256,7 @@ class BrowserWindowHandle:
         Close the small modal dialog.
         """
         try:
-            close_button = self.driver.find_element(By.XPATH, self.BUTTON_CLOSE_SMALL_MODAL_XPATH)
+            close_button = self.find(By.XPATH, self.BUTTON_CLOSE_SMALL_MODAL_XPATH)
             close_button.click()
         except NoSuchElementException:
             print("Close Small Modal button not found.")
@@ -268,7 +266,7 @@ class BrowserWindowHandle:
         Get the name of the page from the modal dialogs section.
         """
         try:
-            page_name = self.driver.find_element(By.XPATH, self.TEXT_NAME_OF_THE_PAGE_XPATH).text
+            page_name = self.find(By.XPATH, self.TEXT_NAME_OF_THE_PAGE_XPATH).text
             return page_name
         except NoSuchElementException:
             print("Name of the page text not found.")
@@ -280,7 +278,7 @@ class BrowserWindowHandle:
         Click on the 'Large Modal' button to open a large modal dialog.
         """
         try:
-            large_modal_button = self.driver.find_element(By.XPATH, self.BUTTON_LARGE_MODAL_XPATH)
+            large_modal_button = self.find(By.XPATH, self.BUTTON_LARGE_MODAL_XPATH)
             large_modal_button.click()
         except NoSuchElementException:
             print("Large Modal button not found.")
@@ -290,7 +288,7 @@ class BrowserWindowHandle:
         Get the name of the large modal dialog.
         """
         try:
-            large_modal_name = self.driver.find_element(By.XPATH, self.NAME_OF_THE_LARGE_MODAL_XPATH).text
+            large_modal_name = self.find(By.XPATH, self.NAME_OF_THE_LARGE_MODAL_XPATH).text
             return large_modal_name
         except NoSuchElementException:
             print("Name of large modal text not found.")
@@ -301,7 +299,7 @@ class BrowserWindowHandle:
         Get the content text from the large modal dialog.
         """
         try:
-            large_modal_content = self.driver.find_element(By.XPATH, self.TEXT_CONTENT_OF_THE_LARGE_MODAL_XPATH).text
+            large_modal_content = self.find(By.XPATH, self.TEXT_CONTENT_OF_THE_LARGE_MODAL_XPATH).text
             return large_modal_content
         except NoSuchElementException:
             print("Content of large modal text not found.")
@@ -312,7 +310,7 @@ class BrowserWindowHandle:
         Close the large modal dialog.
         """
         try:
-            close_button = self.driver.find_element(By.XPATH, self.BUTTON_LARGE_MODAL_CLOSE_XPATH)
+            close_button = self.find(By.XPATH, self.BUTTON_LARGE_MODAL_CLOSE_XPATH)
             close_button.click()
         except NoSuchElementException:
             print("Close Large Modal button not found.")
@@ -322,7 +320,7 @@ class BrowserWindowHandle:
         Click on the 'Frames' option to navigate to the Frames page.
         """
         try:
-            frames_option = self.driver.find_element(By.XPATH, self.OPTION_FRAMES_XPATH)
+            frames_option = self.find(By.XPATH, self.OPTION_FRAMES_XPATH)
             frames_option.click()
         except NoSuchElementException:
             print("Frames option not found.")
@@ -332,7 +330,7 @@ class BrowserWindowHandle:
         Switch to the iframe with id 'frame1'.
         """
         try:
-            frame = self.driver.find_element(By.XPATH, self.SWITCH_FRAME_XPATH)
+            frame = self.find(By.XPATH, self.SWITCH_FRAME_XPATH)
             self.driver.switch_to.frame(frame)
         except NoSuchElementException:
             print("Frame not found.")
@@ -344,7 +342,7 @@ class BrowserWindowHandle:
         Get the text from the iframe after switching to it.
         """
         try:
-            iframe_text = self.driver.find_element(By.XPATH, self.TEXT_OF_IFRAME_XPATH).text
+            iframe_text = self.find(By.XPATH, self.TEXT_OF_IFRAME_XPATH).text
             return iframe_text
         except NoSuchElementException:
             print("Text in the iframe not found.")
@@ -368,17 +366,29 @@ class BrowserWindowHandle:
         Click on the 'Nested Frames' option.
         """
         try:
-            nested_iframe_option = self.driver.find_element(By.XPATH, self.OPTION_NESTED_IFRAME_XPATH)
+            nested_iframe_option = self.find(By.XPATH, self.OPTION_NESTED_IFRAME_XPATH)
             nested_iframe_option.click()
         except NoSuchElementException:
             print("Nested Frames option not found.")
 
+    def wait_for_nested_frames_page(self, timeout=10):
+        """
+        Wait until the 'Nested Frames' page has loaded: heading visible and parent frame present.
+        """
+        try:
+            self.wait_for_visibility(By.XPATH, self.TEXT_OF_THR_MAIN_NESTED_FRAME_XPATH, timeout)
+            self.wait_for_presence(By.XPATH, self.PARENT_FRAME_XPATH, timeout)
+            return True
+        except TimeoutException:
+            print("Timeout: Nested Frames page did not load.")
+            return False
+
     def get_main_nested_frame_text(self):
         """
         Get the text of the main nested frame heading.
         """
         try:
-            heading = self.driver.find_element(By.XPATH, self.TEXT_OF_THR_MAIN_NESTED_FRAME_XPATH)
+            heading = self.find(By.XPATH, self.TEXT_OF_THR_MAIN_NESTED_FRAME_XPATH)
             return heading.text
         except NoSuchElementException:
             print("Main nested frame heading not found.")
@@ -389,7 +399,7 @@ class BrowserWindowHandle:
         Switch to the parent iframe.
         """
         try:
-            parent_frame = self.driver.find_element(By.XPATH, self.PARENT_FRAME_XPATH)
+            parent_frame = self.find(By.XPATH, self.PARENT_FRAME_XPATH)
             self.driver.switch_to.frame(parent_frame)
         except NoSuchElementException:
             print("Parent iframe not found.")
@@ -399,7 +409,7 @@ class BrowserWindowHandle:
         Switch to the child iframe inside the parent.
         """
         try:
-            child_frame = self.driver.find_element(By.XPATH, self.CHILD_FRAME_XPATH)
+            child_frame = self.find(By.XPATH, self.CHILD_FRAME_XPATH)
             self.driver.switch_to.frame(child_frame)
         except NoSuchElementException:
             print("Child iframe not found.")
\ No newline at end of file
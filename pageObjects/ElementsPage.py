@@ -1,13 +1,18 @@
+import base64
+import io
+import urllib.request
+
 from selenium.common.exceptions import ElementNotInteractableException
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
 from selenium.common import NoSuchElementException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver import ActionChains
 
+from pageObjects.BasePage import BasePage
+from unititlies.fileHash import cached_digest, stream_digest
+
 
-class ElementsPage:
+class ElementsPage(BasePage):
 
     # Locators for elements on the Elements page
     TEXT_ELEMENT_PAGE_CSS_SELECTOR = ".col-12.mt-4.col-md-6"
@@ -30,6 +35,7 @@ class ElementsPage:
     CHECK_BOX_HOME_XPATH = "//span[text()='Home']"
     BUTTON_PLUE_XPATH = "//button[@title = 'Expand all']"
     CHECK_BOX_WORKSPACE_XPATH = "//span[@class='rct-checkbox' and @xpath='6']"
+    TREE_EXPANDED_NODE_XPATH = "//li[contains(@class, 'rct-node-expanded')]"
 
     # TESTING RADIO BUTTON ELEMENTS
     OPTION_RADIO_BUTTON_XPATH = "//span[normalize-space()='Radio Button']"
@@ -64,6 +70,16 @@ class ElementsPage:
     LINK_FORBIDDEN_XPATH = "//a[@id='forbidden']"
     LINK_NOT_FOUND_XPATH = "//a[@id='invalid-url']"
     RESPONSE_STATUS_CODE_XPATH = "//p[@id='linkResponse']"
+    # API link id -> key of its expected response in TestData/elements_page.json ("linksTest")
+    API_LINK_STATUS_KEYS = {
+        "created": "Created",
+        "no-content": "NoContent",
+        "moved": "Moved",
+        "bad-request": "BadRequest",
+        "unauthorized": "Unauthorized",
+        "forbidden": "Forbidden",
+        "invalid-url": "NotFound",
+    }
     OPTION_BROKEN_LINKS_XPATH = "//span[normalize-space()='Broken Links - Images']"
     IMG_IS_DISPLAYED_XPATH = "//div /img[@src='/images/Toolsqa.jpg']"
     IMG_BROKEN_LINKS_XPATH = "//img[@src='/images/Toolsqa_1.jpg']"
@@ -75,20 +91,19 @@ class ElementsPage:
     INPUT_UPLOAD_FILE_XPATH = "//input[@id='uploadFile']"
     TEXT_SUCCESS_MESSAGE_PATH_XPATH = "//p[@id='uploadedFilePath']"
     BTN_DOWNLOAD_FILE_XPATH = "//a[@id='downloadButton']"
+    # SHA-256 of the file passed to the last upload_file call
+    last_upload_digest = None
 
     # TESTING DYNAMIC PROPERTIES ELEMENTS
     OPTION_DYNAMIC_PROPERTIES_XPATH = "//span[normalize-space()='Dynamic Properties']"
     BTN_AFTER_5_SECONDS_XPATH = "//button[@id='visibleAfter']"
 
-    def __init__(self, driver):
-        self.driver = driver
-
     def get_text_element_page(self):
         """
         Get the text of the element on the Elements page.
         """
         try:
-            text_element = self.driver.find_element(By.CSS_SELECTOR, self.TEXT_ELEMENT_PAGE_CSS_SELECTOR)
+            text_element = self.find(By.CSS_SELECTOR, self.TEXT_ELEMENT_PAGE_CSS_SELECTOR)
             return text_element.text
         except NoSuchElementException:
             return None
@@ -99,7 +114,7 @@ class ElementsPage:
         Click on the 'Text Box' option.
         """
         try:
-            text_box_option = self.driver.find_element(By.XPATH, self.OPTION_TEXT_BOX_XPATH)
+            text_box_option = self.find(By.XPATH, self.OPTION_TEXT_BOX_XPATH)
             text_box_option.click()
         except NoSuchElementException:
             print("Text Box option not found.")
@@ -109,7 +124,7 @@ class ElementsPage:
         Enter the user name in the text box.
         """
         try:
-            user_name_field = self.driver.find_element(By.XPATH, self.TXT_INPUT_USER_NAME_XPATH)
+            user_name_field = self.find(By.XPATH, self.TXT_INPUT_USER_NAME_XPATH)
             user_name_field.send_keys(user_name)
         except NoSuchElementException:
             print("User Name field not found.")
@@ -119,7 +134,7 @@ class ElementsPage:
         Enter the user email in the text box.
         """
         try:
-            user_email_field = self.driver.find_element(By.XPATH, self.TXT_INPUT_USER_EMAIL_XPATH)
+            user_email_field = self.find(By.XPATH, self.TXT_INPUT_USER_EMAIL_XPATH)
             user_email_field.send_keys(user_email)
         except NoSuchElementException:
             print("User Email field not found.")
@@ -129,7 +144,7 @@ class ElementsPage:
         Enter the current address in the text box.
         """
         try:
-            current_address_field = self.driver.find_element(By.XPATH, self.TXT_INPUT_CURRENT_ADDRESS_XPATH)
+            current_address_field = self.find(By.XPATH, self.TXT_INPUT_CURRENT_ADDRESS_XPATH)
             current_address_field.send_keys(current_address)
         except NoSuchElementException:
             print("Current Address field not found.")
@@ -139,7 +154,7 @@ class ElementsPage:
         Enter the permanent address in the text box.
         """
         try:
-            permanent_address_field = self.driver.find_element(By.XPATH, self.TXT_INPUT_PERMANENT_ADDRESS_XPATH)
+            permanent_address_field = self.find(By.XPATH, self.TXT_INPUT_PERMANENT_ADDRESS_XPATH)
             permanent_address_field.send_keys(permanent_address)
         except NoSuchElementException:
             print("Permanent Address field not found.")
@@ -149,7 +164,7 @@ class ElementsPage:
         Click on the 'Submit' button.
         """
         try:
-            submit_button = self.driver.find_element(By.XPATH, self.BUTTON_SUBMIT_XPATH)
+            submit_button = self.find(By.XPATH, self.BUTTON_SUBMIT_XPATH)
             submit_button.click()
         except NoSuchElementException:
             print("Submit button not found.")
@@ -160,10 +175,10 @@ class ElementsPage:
         Strips label prefixes like 'Name:', 'Email:' etc.
         """
         try:
-            name_output = self.driver.find_element(By.XPATH, self.TXT_OUTPUT_NAME_XPATH).text
-            email_output = self.driver.find_element(By.XPATH, self.TXT_OUTPUT_EMAIL_XPATH).text
-            current_address_output = self.driver.find_element(By.XPATH, self.TXT_OUTPUT_CURRENT_ADDRESS_XPATH).text
-            permanent_address_output = self.driver.find_element(By.XPATH, self.TXT_OUTPUT_PERMANENT_ADDRESS_XPATH).text
+            name_output = self.find(By.XPATH, self.TXT_OUTPUT_NAME_XPATH).text
+            email_output = self.find(By.XPATH, self.TXT_OUTPUT_EMAIL_XPATH).text
+            current_address_output = self.find(By.XPATH, self.TXT_OUTPUT_CURRENT_ADDRESS_XPATH).text
+            permanent_address_output = self.find(By.XPATH, self.TXT_OUTPUT_PERMANENT_ADDRESS_XPATH).text
 
             return {
                 "fullName": name_output.replace("Name:", "").strip(),
@@ -181,7 +196,7 @@ class ElementsPage:
         Click on the 'Check Box' option.
         """
         try:
-            check_box_option = self.driver.find_element(By.XPATH, self.OPTION_CHECK_BOX_XPATH)
+            check_box_option = self.find(By.XPATH, self.OPTION_CHECK_BOX_XPATH)
             check_box_option.click()
         except NoSuchElementException:
             print("Check Box option not found.")
@@ -191,7 +206,7 @@ class ElementsPage:
         Click on the 'Check Box' option if it is displayed.
         """
         try:
-            check_box_option = self.driver.find_element(By.XPATH, self.CHECK_BOX_HOME_XPATH)
+            check_box_option = self.find(By.XPATH, self.CHECK_BOX_HOME_XPATH)
             if check_box_option.is_displayed():
                 check_box_option.click()
             else:
@@ -204,18 +219,39 @@ class ElementsPage:
         Click on the plus button to expand the checkbox options.
         """
         try:
-            plus_button = self.driver.find_element(By.XPATH, self.BUTTON_PLUE_XPATH)
+            plus_button = self.find(By.XPATH, self.BUTTON_PLUE_XPATH)
             plus_button.click()
         except NoSuchElementException:
             print("Plus button not found.")
 
+    def wait_for_check_box_tree(self, timeout=10):
+        """
+        Wait until the check box tree is rendered (the 'Home' node is visible).
+        """
+        try:
+            self.wait_for_visibility(By.XPATH, self.CHECK_BOX_HOME_XPATH, timeout)
+            return True
+        except TimeoutException:
+            print("Timeout: Check box tree not rendered.")
+            return False
+
+    def wait_for_tree_expanded(self, timeout=10):
+        """
+        Wait until the check box tree shows an expanded node after clicking 'Expand all'.
+        """
+        try:
+            self.wait_for_visibility(By.XPATH, self.TREE_EXPANDED_NODE_XPATH, timeout)
+            return True
+        except TimeoutException:
+            print("Timeout: Check box tree did not expand.")
+            return False
+
     def click_workspace_check_box(self):
         """
         Clicks the 'Workspace' checkbox.
         """
         try:
-            wait = WebDriverWait(self.driver, 10)
-            checkbox = wait.until(EC.element_to_be_clickable((By.XPATH, self.CHECK_BOX_WORKSPACE_XPATH)))
+            checkbox = self.wait_for_clickable(By.XPATH, self.CHECK_BOX_WORKSPACE_XPATH)
             try:
                 checkbox.click()
             except ElementNotInteractableException:
@@ -231,7 +267,7 @@ class ElementsPage:
         Click on the 'Check Box' option.
         """
         try:
-            check_box_option = self.driver.find_element(By.XPATH, self.OPTION_RADIO_BUTTON_XPATH)
+            check_box_option = self.find(By.XPATH, self.OPTION_RADIO_BUTTON_XPATH)
             check_box_option.click()
         except NoSuchElementException:
             print("Check Box option not found.")
@@ -241,7 +277,7 @@ class ElementsPage:
         Click on the 'Yes' radio button.
         """
         try:
-            yes_radio_button = self.driver.find_element(By.XPATH, self.BUTTON_YES_XPATH)
+            yes_radio_button = self.find(By.XPATH, self.BUTTON_YES_XPATH)
             yes_radio_button.click()
         except NoSuchElementException:
             print("Yes radio button not found.")
@@ -251,7 +287,7 @@ class ElementsPage:
         Get the text of the 'Yes' radio button.
         """
         try:
-            yes_radio_button = self.driver.find_element(By.XPATH, self.TEXT_SUCCESS_MESSAGE_XPATH)
+            yes_radio_button = self.find(By.XPATH, self.TEXT_SUCCESS_MESSAGE_XPATH)
             return yes_radio_button.text
         except NoSuchElementException:
             print("Yes radio button not found.")
@@ -262,12 +298,8 @@ class ElementsPage:
         Click on the 'Impressive' radio button using JavaScript to bypass UI obstructions.
         """
         try:
-            wait = WebDriverWait(self.driver, 10)
-
             # Wait until element is present in DOM (not necessarily clickable visually)
-            impressive_radio_button = wait.until(
-                EC.presence_of_element_located((By.XPATH, self.RADIO_IMPRESSIVE_XPATH))
-            )
+            impressive_radio_button = self.wait_for_presence(By.XPATH, self.RADIO_IMPRESSIVE_XPATH)
 
             # Scroll into view (optional, for visual confirmation during debug)
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", impressive_radio_button)
@@ -287,7 +319,7 @@ class ElementsPage:
         Check if the 'No' radio button is disabled.
         """
         try:
-            no_radio_button = self.driver.find_element(By.XPATH, self.RADIO_NO_XPATH)
+            no_radio_button = self.find(By.XPATH, self.RADIO_NO_XPATH)
             no_radio_button.is_enabled()
         except NoSuchElementException:
             print("No radio button not found.")
@@ -299,15 +331,13 @@ class ElementsPage:
         Click on the 'Buttons' option.
         """
         try:
-            buttons_option = self.driver.find_element(By.XPATH, self.OPTION_BUTTONS_XPATH)
+            buttons_option = self.find(By.XPATH, self.OPTION_BUTTONS_XPATH)
             buttons_option.click()
         except NoSuchElementException:
             print("Buttons option not found.")
 
     def click_on_double_click_button(self):
-        button = WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, self.BUTTON_DOUBLE_CLICK_XPATH))
-        )
+        button = self.wait_for_clickable(By.XPATH, self.BUTTON_DOUBLE_CLICK_XPATH)
         action = ActionChains(self.driver)
         action.double_click(button).perform()
 
@@ -317,18 +347,14 @@ class ElementsPage:
         using an explicit wait instead of time.sleep().
         """
         try:
-            wait = WebDriverWait(self.driver, 10)
-
             # Wait until the element is present and clickable
-            right_click_button = wait.until(
-                EC.element_to_be_clickable((By.XPATH, self.BUTTON_RIGHT_CLICK_XPATH))
-            )
+            right_click_button = self.wait_for_clickable(By.XPATH, self.BUTTON_RIGHT_CLICK_XPATH)
 
             # Scroll the element into view (centered)
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", right_click_button)
 
             # Wait a bit more in case of rendering delays after scrolling (optional but without sleep)
-            wait.until(lambda driver: right_click_button.is_displayed())
+            self.wait_for(lambda driver: right_click_button.is_displayed())
 
             # Perform the right-click
             ActionChains(self.driver).context_click(right_click_button).perform()
@@ -341,7 +367,7 @@ class ElementsPage:
         Click on the 'Click Me' button.
         """
         try:
-            click_me_button = self.driver.find_element(By.XPATH, self.BUTTON_CLICK_ME_XPATH)
+            click_me_button = self.find(By.XPATH, self.BUTTON_CLICK_ME_XPATH)
             self.driver.execute_script("arguments[0].scrollIntoView(true);", click_me_button)
             click_me_button.click()
         except NoSuchElementException:
@@ -352,10 +378,7 @@ class ElementsPage:
         Get the text of the success message after double clicking the button.
         """
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            success_message = wait.until(
-                EC.visibility_of_element_located((By.XPATH, self.BUTTON_DOUBLE_CLICK_SUCCESS_MESSAGE_XPATH))
-            )
+            success_message = self.wait_for_visibility(By.XPATH, self.BUTTON_DOUBLE_CLICK_SUCCESS_MESSAGE_XPATH, timeout)
             self.driver.execute_script("arguments[0].scrollIntoView(true);", success_message)
             return success_message.text.strip()
         except TimeoutException:
@@ -368,14 +391,11 @@ class ElementsPage:
         Waits up to `timeout` seconds for the element to appear and then disappear.
         """
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            success_message = wait.until(
-                EC.visibility_of_element_located((By.XPATH, self.BUTTON_RIGHT_CLICK_SUCCESS_MESSAGE_XPATH))
-            )
+            success_message = self.wait_for_visibility(By.XPATH, self.BUTTON_RIGHT_CLICK_SUCCESS_MESSAGE_XPATH, timeout)
             self.driver.execute_script("arguments[0].scrollIntoView(true);", success_message)
             message_text = success_message.text.strip()
             # Wait for the message to disappear
-            wait.until(EC.invisibility_of_element_located((By.XPATH, self.BUTTON_RIGHT_CLICK_SUCCESS_MESSAGE_XPATH)))
+            self.wait_for_invisibility(By.XPATH, self.BUTTON_RIGHT_CLICK_SUCCESS_MESSAGE_XPATH, timeout)
             return message_text
         except TimeoutException:
             print("Timed out waiting for success message.")
@@ -387,14 +407,11 @@ class ElementsPage:
         Waits up to `timeout` seconds for the element to appear and then disappear.
         """
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            success_message = wait.until(
-                EC.visibility_of_element_located((By.XPATH, self.BUTTON_DYNAMIC_CLICK_SUCCESS_MESSAGE_XPATH))
-            )
+            success_message = self.wait_for_visibility(By.XPATH, self.BUTTON_DYNAMIC_CLICK_SUCCESS_MESSAGE_XPATH, timeout)
             self.driver.execute_script("arguments[0].scrollIntoView(true);", success_message)
             message_text = success_message.text.strip()
             # Wait for the message to disappear
-            wait.until(EC.invisibility_of_element_located((By.XPATH, self.BUTTON_DYNAMIC_CLICK_SUCCESS_MESSAGE_XPATH)))
+            self.wait_for_invisibility(By.XPATH, self.BUTTON_DYNAMIC_CLICK_SUCCESS_MESSAGE_XPATH, timeout)
             return message_text
         except TimeoutException:
             print("Timed out waiting for success message.")
@@ -406,7 +423,7 @@ class ElementsPage:
         Click on the 'Web Table' option.
         """
         try:
-            web_table_option = self.driver.find_element(By.XPATH, self.OPTION_WEB_TABLE_XPATH)
+            web_table_option = self.find(By.XPATH, self.OPTION_WEB_TABLE_XPATH)
             web_table_option.click()
         except NoSuchElementException:
             print("Web Table option not found.")
@@ -417,17 +434,35 @@ class ElementsPage:
         Click on the 'Links' option.
         """
         try:
-            links_option = self.driver.find_element(By.XPATH, self.OPTION_LINKS_XPATH)
+            links_option = self.find(By.XPATH, self.OPTION_LINKS_XPATH)
             links_option.click()
         except NoSuchElementException:
             print("Links option not found.")
 
+    def wait_for_links_page(self, timeout=10):
+        """
+        Wait until the 'Links' page has loaded after clicking the option.
+        """
+        try:
+            self.wait_for_page_load(timeout)
+            self.wait_for_visibility(By.XPATH, self.LINK_SIMPLE_XPATH, timeout)
+            return True
+        except TimeoutException:
+            print("Timeout: Links page did not load.")
+            return False
+
+    def get_api_link_endpoints(self):
+        """
+        Get the endpoint each API link on the 'Links' page calls, as {link id: URL}.
+        """
+        return {link["id"]: link["url"] for link in self.collect_links() if link["id"] in self.API_LINK_STATUS_KEYS}
+
     def get_links_count(self):
         """
         Get the count of all links on the page.
         """
         try:
-            links = self.driver.find_elements(By.XPATH, self.LINKS_COUNT_XPATH)
+            links = self.wait_for_all(By.XPATH, self.LINKS_COUNT_XPATH)
             return len(links)
         except NoSuchElementException:
             print("Links not found.")
@@ -438,7 +473,7 @@ class ElementsPage:
         Click on the 'Simple Link'.
         """
         try:
-            simple_link = self.driver.find_element(By.XPATH, self.LINK_SIMPLE_XPATH)
+            simple_link = self.find(By.XPATH, self.LINK_SIMPLE_XPATH)
             simple_link.click()
         except NoSuchElementException:
             print("Simple Link not found.")
@@ -448,7 +483,7 @@ class ElementsPage:
         Click on the 'Dynamic Link'.
         """
         try:
-            dynamic_link = self.driver.find_element(By.XPATH, self.LINK_DYNAMIC_XPATH)
+            dynamic_link = self.find(By.XPATH, self.LINK_DYNAMIC_XPATH)
             dynamic_link.click()
         except NoSuchElementException:
             print("Dynamic Link not found.")
@@ -458,7 +493,7 @@ class ElementsPage:
         Click on the 'Create' link.
         """
         try:
-            create_link = self.driver.find_element(By.XPATH, self.LINK_CREATE_XPATH)
+            create_link = self.find(By.XPATH, self.LINK_CREATE_XPATH)
             create_link.click()
         except NoSuchElementException:
             print("Create Link not found.")
@@ -468,7 +503,7 @@ class ElementsPage:
         Click on the 'No Content' link.
         """
         try:
-            no_content_link = self.driver.find_element(By.XPATH, self.LINK_NO_CONTENT_XPATH)
+            no_content_link = self.find(By.XPATH, self.LINK_NO_CONTENT_XPATH)
             no_content_link.click()
         except NoSuchElementException:
             print("No Content Link not found.")
@@ -478,7 +513,7 @@ class ElementsPage:
         Click on the 'Moved' link.
         """
         try:
-            moved_link = self.driver.find_element(By.XPATH, self.LINK_MOVED_XPATH)
+            moved_link = self.find(By.XPATH, self.LINK_MOVED_XPATH)
             moved_link.click()
         except NoSuchElementException:
             print("Moved Link not found.")
@@ -488,7 +523,7 @@ class ElementsPage:
         Click on the 'Bad Request' link.
         """
         try:
-            bad_request_link = self.driver.find_element(By.XPATH, self.LINK_BAD_REQUEST_XPATH)
+            bad_request_link = self.find(By.XPATH, self.LINK_BAD_REQUEST_XPATH)
             bad_request_link.click()
         except NoSuchElementException:
             print("Bad Request Link not found.")
@@ -498,7 +533,7 @@ class ElementsPage:
         Click on the 'Unauthorized' link.
         """
         try:
-            unauthorized_link = self.driver.find_element(By.XPATH, self.LINK_UNAUTHORIZED_XPATH)
+            unauthorized_link = self.find(By.XPATH, self.LINK_UNAUTHORIZED_XPATH)
             unauthorized_link.click()
         except NoSuchElementException:
             print("Unauthorized Link not found.")
@@ -508,7 +543,7 @@ class ElementsPage:
         Click on the 'Forbidden' link.
         """
         try:
-            forbidden_link = self.driver.find_element(By.XPATH, self.LINK_FORBIDDEN_XPATH)
+            forbidden_link = self.find(By.XPATH, self.LINK_FORBIDDEN_XPATH)
             forbidden_link.click()
         except NoSuchElementException:
             print("Forbidden Link not found.")
@@ -518,7 +553,7 @@ class ElementsPage:
         Click on the 'Not Found' link.
         """
         try:
-            not_found_link = self.driver.find_element(By.XPATH, self.LINK_NOT_FOUND_XPATH)
+            not_found_link = self.find(By.XPATH, self.LINK_NOT_FOUND_XPATH)
             not_found_link.click()
         except NoSuchElementException:
             print("Not Found Link not found.")
@@ -528,7 +563,7 @@ class ElementsPage:
         Get the response status code after clicking on a link.
         """
         try:
-            response_status = self.driver.find_element(By.XPATH, self.RESPONSE_STATUS_CODE_XPATH)
+            response_status = self.find(By.XPATH, self.RESPONSE_STATUS_CODE_XPATH)
             return response_status.text.strip()
         except NoSuchElementException:
             print("Response status code not found.")
@@ -539,17 +574,33 @@ class ElementsPage:
         Click on the 'Broken Links - Images' option.
         """
         try:
-            broken_links_images_option = self.driver.find_element(By.XPATH, self.OPTION_BROKEN_LINKS_XPATH)
+            broken_links_images_option = self.find(By.XPATH, self.OPTION_BROKEN_LINKS_XPATH)
             broken_links_images_option.click()
         except NoSuchElementException:
             print("Broken Links - Images option not found.")
 
+    def wait_for_broken_links_page(self, timeout=10):
+        """
+        Wait until the 'Broken Links - Images' page has loaded and every image on it has
+        finished loading (or failed to), so broken images can be told apart.
+        """
+        try:
+            self.wait_for_page_load(timeout)
+            self.wait_for_presence(By.XPATH, self.IMG_IS_DISPLAYED_XPATH, timeout)
+            self.wait_for(lambda driver: driver.execute_script(
+                "return Array.prototype.every.call(document.images, function (img) { return img.complete; })"),
+                timeout)
+            return True
+        except TimeoutException:
+            print("Timeout: Broken Links - Images page did not load.")
+            return False
+
     def is_image_displayed(self):
         """
         Check if the image is displayed on the page.
         """
         try:
-            image = self.driver.find_element(By.XPATH, self.IMG_IS_DISPLAYED_XPATH)
+            image = self.find(By.XPATH, self.IMG_IS_DISPLAYED_XPATH)
             return image.is_displayed()
         except NoSuchElementException:
             print("Image not found.")
@@ -560,7 +611,7 @@ class ElementsPage:
         Check if the image is broken (failed to load) using naturalWidth property.
         """
         try:
-            image_element = self.driver.find_element(By.XPATH, self.IMG_BROKEN_LINKS_XPATH)
+            image_element = self.find(By.XPATH, self.IMG_BROKEN_LINKS_XPATH)
             # Execute JavaScript to check if the image is broken
             is_broken = self.driver.execute_script(
                 "return arguments[0].naturalWidth === 0", image_element)
@@ -574,7 +625,7 @@ class ElementsPage:
         Click on the 'Click Here for Valid Link'.
         """
         try:
-            valid_link = self.driver.find_element(By.XPATH, self.LINK_VALID_LINK_XPATH)
+            valid_link = self.find(By.XPATH, self.LINK_VALID_LINK_XPATH)
             valid_link.click()
         except NoSuchElementException:
             print("Valid Link not found.")
@@ -584,7 +635,7 @@ class ElementsPage:
         Click on the 'Click Here for Broken Link'.
         """
         try:
-            broken_link = self.driver.find_element(By.XPATH, self.LINK_BROKEN_LINK_XPATH)
+            broken_link = self.find(By.XPATH, self.LINK_BROKEN_LINK_XPATH)
             broken_link.click()
         except NoSuchElementException:
             print("Broken Link not found.")
@@ -596,17 +647,13 @@ class ElementsPage:
         Scrolls into view, waits until clickable, then clicks.
         """
         try:
-            file_upload_and_download_option = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, self.OPTION_FILE_UPLOAD_AND_DOWNLOAD_XPATH))
-            )
+            file_upload_and_download_option = self.wait_for_presence(By.XPATH, self.OPTION_FILE_UPLOAD_AND_DOWNLOAD_XPATH)
 
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});",
                                        file_upload_and_download_option)
 
             # Wait until clickable
-            WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, self.OPTION_FILE_UPLOAD_AND_DOWNLOAD_XPATH))
-            )
+            self.wait_for_clickable(By.XPATH, self.OPTION_FILE_UPLOAD_AND_DOWNLOAD_XPATH)
 
             try:
                 file_upload_and_download_option.click()
@@ -620,11 +667,11 @@ class ElementsPage:
     def upload_file(self, file_path, timeout=10):
         """
         Upload a file using the file input element, with an explicit wait.
+        The SHA-256 of the fixture is kept in `last_upload_digest` (cached per file).
         """
+        self.last_upload_digest = cached_digest(file_path)
         try:
-            upload_input = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((By.XPATH, self.INPUT_UPLOAD_FILE_XPATH))
-            )
+            upload_input = self.wait_for_presence(By.XPATH, self.INPUT_UPLOAD_FILE_XPATH, timeout)
             upload_input.send_keys(file_path)
         except TimeoutException:
             print("Timeout: File upload input not found.")
@@ -636,9 +683,7 @@ class ElementsPage:
         Get the success message after uploading a file, with an explicit wait.
         """
         try:
-            success_message = WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located((By.XPATH, self.TEXT_SUCCESS_MESSAGE_PATH_XPATH))
-            )
+            success_message = self.wait_for_visibility(By.XPATH, self.TEXT_SUCCESS_MESSAGE_PATH_XPATH, timeout)
             return success_message.text.strip()
         except TimeoutException:
             print("Timeout: Upload success message not found.")
@@ -653,9 +698,7 @@ class ElementsPage:
         Waits until the button is clickable and then clicks it.
         """
         try:
-            download_button = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable((By.XPATH, self.BTN_DOWNLOAD_FILE_XPATH))
-            )
+            download_button = self.wait_for_clickable(By.XPATH, self.BTN_DOWNLOAD_FILE_XPATH, timeout)
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", download_button)
             download_button.click()
         except TimeoutException:
@@ -663,12 +706,33 @@ class ElementsPage:
         except Exception as e:
             print(f"Error downloading file: {str(e)}")
 
+    def get_download_source_digest(self, timeout=10):
+        """
+        SHA-256 of the file behind the download button, read from its href (a data: URI
+        on demoqa, a plain URL on the replica) instead of through the browser download.
+        Returns None if the button is missing or its source cannot be read.
+        """
+        try:
+            href = self.wait_for_presence(By.XPATH, self.BTN_DOWNLOAD_FILE_XPATH, timeout).get_attribute("href")
+        except TimeoutException:
+            print("Timeout: Download button not found.")
+            return None
+        try:
+            if href.startswith("data:"):
+                # The data: URI is already in memory as the href string
+                return stream_digest(io.BytesIO(base64.b64decode(href.split(",", 1)[1])))
+            with urllib.request.urlopen(href, timeout=timeout) as response:
+                return stream_digest(response)
+        except Exception as e:
+            print(f"Error reading download source: {str(e)}")
+            return None
+
     def Click_on_dynamic_properties(self):
         """
         Click on the 'Dynamic Properties' option.
         """
         try:
-            dynamic_properties_option = self.driver.find_element(By.XPATH, self.OPTION_DYNAMIC_PROPERTIES_XPATH)
+            dynamic_properties_option = self.find(By.XPATH, self.OPTION_DYNAMIC_PROPERTIES_XPATH)
             dynamic_properties_option.click()
         except NoSuchElementException:
             print("Dynamic Properties option not found.")
@@ -678,8 +742,7 @@ class ElementsPage:
         Waits for the button that appears after 5 seconds and returns True if it's displayed.
         """
         try:
-            wait = WebDriverWait(self.driver, 10)
-            button = wait.until(EC.visibility_of_element_located((By.XPATH, self.BTN_AFTER_5_SECONDS_XPATH)))
+            button = self.wait_for_visibility(By.XPATH, self.BTN_AFTER_5_SECONDS_XPATH)
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
             return button.is_displayed()
         except TimeoutException:
@@ -0,0 +1,73 @@
+from urllib.parse import urljoin
+
+from selenium.webdriver.common.by import By
+
+from pageObjects.BasePage import BasePage
+from pageObjects.BrowserWindow import BrowserWindowHandle
+from pageObjects.ElementsPage import ElementsPage
+from pageObjects.RegistrationForm import RegistrationPage
+from pageObjects.WebTable import WebTable
+from pageObjects.WidgetsPage import WidgetsPage
+from unititlies.eventLog import timed
+from unititlies.readProperties import ReadConfig
+
+
+class Navigator:
+
+    # Route table: section name -> (path relative to BaseURL, page-ready marker locator)
+    ROUTES = {
+        # Elements
+        "Elements": ("elements", (By.CSS_SELECTOR, ElementsPage.TEXT_ELEMENT_PAGE_CSS_SELECTOR)),
+        "Text Box": ("text-box", (By.XPATH, ElementsPage.TXT_INPUT_USER_NAME_XPATH)),
+        "Check Box": ("checkbox", (By.XPATH, ElementsPage.BUTTON_PLUE_XPATH)),
+        "Radio Button": ("radio-button", (By.XPATH, ElementsPage.BUTTON_YES_XPATH)),
+        "Web Tables": ("webtables", (By.XPATH, WebTable.ADD_BUTTON)),
+        "Buttons": ("buttons", (By.XPATH, ElementsPage.BUTTON_DOUBLE_CLICK_XPATH)),
+        "Links": ("links", (By.XPATH, ElementsPage.LINK_SIMPLE_XPATH)),
+        "Broken Links - Images": ("broken", (By.XPATH, ElementsPage.LINK_VALID_LINK_XPATH)),
+        "Upload and Download": ("upload-download", (By.XPATH, ElementsPage.INPUT_UPLOAD_FILE_XPATH)),
+        "Dynamic Properties": ("dynamic-properties", (By.XPATH, "//h1[normalize-space()='Dynamic Properties']")),
+
+        # Forms
+        "Forms": ("forms", (By.XPATH, RegistrationPage.OPTION_FORM_XPATH)),
+        "Practice Form": ("automation-practice-form", (By.XPATH, RegistrationPage.TXT_BOX_FIRST_NAME_XPATH)),
+
+        # Alerts, Frame & Windows
+        "Alerts, Frame & Windows": ("alertsWindows", (By.XPATH, BrowserWindowHandle.OPTION_BROWSER_WINDOW_XPATH)),
+        "Browser Windows": ("browser-windows", (By.XPATH, BrowserWindowHandle.BUTTON_NEW_TAB_XPATH)),
+        "Alerts": ("alerts", (By.XPATH, BrowserWindowHandle.BUTTON_CLICK_ME_AND_SEE_ALERT_XPATH)),
+        "Frames": ("frames", (By.XPATH, BrowserWindowHandle.SWITCH_FRAME_XPATH)),
+        "Nested Frames": ("nestedframes", (By.XPATH, BrowserWindowHandle.PARENT_FRAME_XPATH)),
+        "Modal Dialogs": ("modal-dialogs", (By.XPATH, BrowserWindowHandle.BUTTON_SMALL_MODAL_XPATH)),
+
+        # Widgets
+        "Widgets": ("widgets", (By.XPATH, WidgetsPage.TEXT_OPTION_ACCORDION_XPATH)),
+        "Accordian": ("accordian", (By.CSS_SELECTOR, WidgetsPage.FIRST_ACCORDION_SECTION_CSS_SELECTOR)),
+        "Auto Complete": ("auto-complete", (By.CSS_SELECTOR, WidgetsPage.INPUT_MULTIPLE_COLOR_AUTO_COMPLETE_CSS_SELECTOR)),
+    }
+
+    def __init__(self, driver, base_url=None):
+        self.driver = driver
+        self.base_url = base_url or ReadConfig.get_application_url()
+
+    def url_for(self, section):
+        """
+        Get the direct URL of a section from the route table.
+        """
+        if section not in self.ROUTES:
+            raise ValueError(f"Unknown section: {section}. Known sections: {', '.join(self.ROUTES)}")
+        path, _ = self.ROUTES[section]
+        return urljoin(self.base_url, path)
+
+    @timed
+    def navigate_to(self, section, timeout=10):
+        """
+        Open a section with a single page load, wait until the page is ready (network
+        idle and DOM quiet) and check its page-ready marker.
+        Raises TimeoutException if either does not happen within `timeout` seconds.
+        """
+        url = self.url_for(section)
+        by, marker = self.ROUTES[section]
+        page = BasePage(self.driver)
+        page.open(url, timeout)
+        page.wait_for_presence(by, marker, timeout)
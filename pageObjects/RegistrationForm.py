@@ -1,14 +1,16 @@
 # Required Selenium and Python modules
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait, Select
-from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import Select
 from datetime import datetime
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
 
+from pageObjects.BasePage import BasePage
+from unititlies.fileHash import cached_digest
 
-class RegistrationPage:
+
+class RegistrationPage(BasePage):
 
     # ========== LOCATORS ==========
     # Page navigation element
@@ -38,6 +40,8 @@ class RegistrationPage:
     # Address and file upload fields
     TXT_BOX_ADDRESS_XPATH = "//textarea[@id='currentAddress']"
     INPUT_FILE_UPLOAD_XPATH = "//input[@id='uploadPicture']"
+    # SHA-256 of the file passed to the last upload_file call
+    last_upload_digest = None
 
     # State and city dropdowns
     DROPDOWN_STATE_XPATH = "//div[contains(text(),'Select State')]"
@@ -47,42 +51,21 @@ class RegistrationPage:
     BUTTON_SUBMIT_XPATH = "//button[@id='submit']"
     TEXT_OF_SUBMIT_FORM_XPATH = "//tbody/tr/td"
 
-    def __init__(self, driver):
-        # Initialize with a Selenium WebDriver instance
-        self.driver = driver
+    # Text inputs that fill_form can set in one call
+    FORM_FIELDS = {
+        "First Name": TXT_BOX_FIRST_NAME_XPATH,
+        "Last Name": TXT_BOX_LAST_NAME_XPATH,
+        "Email": TXT_BOX_EMAIL_XPATH,
+        "Mobile": TXT_BOX_MOBILE_XPATH,
+        "Current Address": TXT_BOX_ADDRESS_XPATH,
+    }
 
-    def scroll_and_click(self, xpath, element_name, timeout=10, scroll_attempts=5):
-        """
-        Scroll to an element using JavaScript and click it.
-        Retries multiple times in case of failure.
-        """
-        try:
-            for attempt in range(scroll_attempts):
-                try:
-                    # Wait for element to appear in DOM
-                    element = WebDriverWait(self.driver, timeout).until(
-                        EC.presence_of_element_located((By.XPATH, xpath))
-                    )
-                    # Scroll into view
-                    self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element)
-                    # Wait until clickable and then click
-                    element = WebDriverWait(self.driver, timeout).until(
-                        EC.element_to_be_clickable((By.XPATH, xpath))
-                    )
-                    element.click()
-                    return
-                except TimeoutException:
-                    continue
-            print(f"{element_name} card could not be clicked after {scroll_attempts} scroll attempts.")
-        except NoSuchElementException:
-            print(f"{element_name} card not found.")
-
-    def generate_xpath(self, element):
-        """
-        Utility to generate dynamic XPath of a given element.
-        (Optional for debugging or development use)
-        """
-        return self.driver.execute_script(""" ... """, element)
+    def _click_and_type(self, xpath, element_name, text):
+        # Type into the element scroll_and_click already holds instead of locating it again
+        element = self.scroll_and_click(xpath, element_name)
+        if element is None:
+            element = self.find(By.XPATH, xpath)
+        element.send_keys(text)
 
     def click_on_form_option(self):
         # Click on the "Practice Form" card
@@ -90,18 +73,15 @@ class RegistrationPage:
 
     def enter_first_name(self, first_name):
         # Enter first name
-        self.scroll_and_click(self.TXT_BOX_FIRST_NAME_XPATH, "First Name")
-        self.driver.find_element(By.XPATH, self.TXT_BOX_FIRST_NAME_XPATH).send_keys(first_name)
+        self._click_and_type(self.TXT_BOX_FIRST_NAME_XPATH, "First Name", first_name)
 
     def enter_last_name(self, last_name):
         # Enter last name
-        self.scroll_and_click(self.TXT_BOX_LAST_NAME_XPATH, "Last Name")
-        self.driver.find_element(By.XPATH, self.TXT_BOX_LAST_NAME_XPATH).send_keys(last_name)
+        self._click_and_type(self.TXT_BOX_LAST_NAME_XPATH, "Last Name", last_name)
 
     def enter_email(self, email):
         # Enter email address
-        self.scroll_and_click(self.TXT_BOX_EMAIL_XPATH, "Email")
-        self.driver.find_element(By.XPATH, self.TXT_BOX_EMAIL_XPATH).send_keys(email)
+        self._click_and_type(self.TXT_BOX_EMAIL_XPATH, "Email", email)
 
     def select_gender_male(self):
         # Select the "Male" radio button for gender
@@ -109,15 +89,13 @@ class RegistrationPage:
 
     def enter_mobile_number(self, mobile_number):
         # Enter mobile number
-        self.scroll_and_click(self.TXT_BOX_MOBILE_XPATH, "Mobile Number")
-        self.driver.find_element(By.XPATH, self.TXT_BOX_MOBILE_XPATH).send_keys(mobile_number)
+        self._click_and_type(self.TXT_BOX_MOBILE_XPATH, "Mobile Number", mobile_number)
 
     def enter_date_of_birth(self, dob):
         """
         Select a date from the calendar widget.
         Format: "dd-Month-yyyy" (e.g., "17-May-1998")
         """
-        wait = WebDriverWait(self.driver, 10)
         parsed_dob = datetime.strptime(dob, "%d-%B-%Y")
         year = parsed_dob.year
         month = parsed_dob.strftime("%B")
@@ -127,10 +105,10 @@ class RegistrationPage:
         self.scroll_and_click(self.TXT_BOX_CLICKS_ON_DATE_OF_BIRTH_XPATH, "Date of Birth Input")
 
         # Set month and year
-        month_dropdown = wait.until(EC.presence_of_element_located((By.XPATH, self.DROPDOWN_MONTH_XPATH)))
+        month_dropdown = self.wait_for_presence(By.XPATH, self.DROPDOWN_MONTH_XPATH)
         Select(month_dropdown).select_by_visible_text(month)
 
-        year_dropdown = wait.until(EC.presence_of_element_located((By.XPATH, self.DROPDOWN_YEAR_XPATH)))
+        year_dropdown = self.wait_for_presence(By.XPATH, self.DROPDOWN_YEAR_XPATH)
         Select(year_dropdown).select_by_visible_text(str(year))
 
         # Click specific day
@@ -142,9 +120,7 @@ class RegistrationPage:
         Enter a subject using keyboard simulation.
         Supports autocomplete feature.
         """
-        subject_input = WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, self.TXT_BOX_SUBJECT_CSS_SELECTOR))
-        )
+        subject_input = self.wait_for_clickable(By.CSS_SELECTOR, self.TXT_BOX_SUBJECT_CSS_SELECTOR)
         subject_input.click()
 
         # Simulate typing with ActionChains
@@ -160,18 +136,17 @@ class RegistrationPage:
 
     def enter_address(self, address):
         # Enter current address
-        self.scroll_and_click(self.TXT_BOX_ADDRESS_XPATH, "Address")
-        self.driver.find_element(By.XPATH, self.TXT_BOX_ADDRESS_XPATH).send_keys(address)
+        self._click_and_type(self.TXT_BOX_ADDRESS_XPATH, "Address", address)
 
     def upload_file(self, file_path):
         """
         Upload a file by sending its path to the file input element.
         Returns the uploaded file name for verification.
+        The SHA-256 of the fixture is kept in `last_upload_digest` (cached per file).
         """
+        self.last_upload_digest = cached_digest(file_path)
         try:
-            file_input = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, self.INPUT_FILE_UPLOAD_XPATH))
-            )
+            file_input = self.wait_for_presence(By.XPATH, self.INPUT_FILE_UPLOAD_XPATH)
             file_input.send_keys(file_path)
             uploaded_file_name = file_input.get_attribute("value").split("\\")[-1]
             return uploaded_file_name
@@ -185,9 +160,7 @@ class RegistrationPage:
         try:
             self.scroll_and_click(self.DROPDOWN_STATE_XPATH, "State Dropdown")
             options_xpath = f"//div[contains(text(), '{state_name}')]"
-            option_element = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, options_xpath))
-            )
+            option_element = self.wait_for_clickable(By.XPATH, options_xpath)
             option_element.click()
         except TimeoutException:
             print(f"State '{state_name}' not found in the dropdown.")
@@ -199,9 +172,7 @@ class RegistrationPage:
         try:
             self.scroll_and_click(self.DROPDOWN_CITY_XPATH, "City Dropdown")
             options_xpath = f"//div[contains(text(), '{city_name}')]"
-            option_element = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, options_xpath))
-            )
+            option_element = self.wait_for_clickable(By.XPATH, options_xpath)
             option_element.click()
         except TimeoutException:
             print(f"City '{city_name}' not found in the dropdown.")
@@ -218,10 +189,8 @@ class RegistrationPage:
         Returns list of text entries.
         """
         try:
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, self.TEXT_OF_SUBMIT_FORM_XPATH))
-            )
-            elements = self.driver.find_elements(By.XPATH, self.TEXT_OF_SUBMIT_FORM_XPATH)
+            self.wait_for_presence(By.XPATH, self.TEXT_OF_SUBMIT_FORM_XPATH)
+            elements = self.find_all(By.XPATH, self.TEXT_OF_SUBMIT_FORM_XPATH)
             return [element.text for element in elements]
         except TimeoutException:
             return []
@@ -1,14 +1,101 @@
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+
+from pageObjects.BasePage import BasePage
+
+
+# Reads the header and every non-empty row of the table in one call.
+# Returns null while the table body is not rendered yet.
+SNAPSHOT_SCRIPT = """
+    var headerSelector = arguments[0], rowSelector = arguments[1], cellSelector = arguments[2];
+    if (!document.querySelector('.rt-tbody')) return null;
+    function texts(parent, selector) {
+        return Array.prototype.map.call(parent.querySelectorAll(selector), function (el) {
+            return el.innerText.trim();
+        });
+    }
+    var rows = Array.prototype.map.call(document.querySelectorAll(rowSelector), function (row) {
+        return texts(row, cellSelector);
+    }).filter(function (cells) {
+        return cells.some(function (text) { return text !== ''; });
+    });
+    return {columns: texts(document, headerSelector), rows: rows};
+"""
+
+
+class TableSnapshot:
+    """
+    In-memory copy of the web table taken by WebTable.snapshot().
+    Lookups are served locally, without talking to the browser.
+    Empty padding rows are dropped; data rows keep the same index as in get_all_rows().
+    """
+
+    def __init__(self, columns, rows):
+        self.columns = columns
+        self.rows = rows
+        self._indexes = {}
+
+    def __len__(self):
+        return len(self.rows)
+
+    def row(self, index):
+        """
+        Cell texts of the row at `index`, or [] if there is no such row.
+        """
+        return self.rows[index] if 0 <= index < len(self.rows) else []
+
+    def row_as_dict(self, index):
+        """
+        The row at `index` as {column name: cell text}, or {} if there is no such row.
+        """
+        return dict(zip(self.columns, self.row(index)))
+
+    def column(self, name):
+        """
+        All values of the column `name`.
+        """
+        position = self.columns.index(name)
+        return [cells[position] for cells in self.rows]
+
+    def index(self, column):
+        """
+        {cell value: row index} for `column`, built on first use and kept with the snapshot.
+        The first row wins when a value repeats.
+        """
+        if column not in self._indexes:
+            position = self.columns.index(column)
+            lookup = {}
+            for row_index, cells in enumerate(self.rows):
+                lookup.setdefault(cells[position], row_index)
+            self._indexes[column] = lookup
+        return self._indexes[column]
+
+    def find_row(self, column, value):
+        """
+        Index of the first row whose `column` equals `value`, or -1.
+        """
+        return self.index(column).get(value, -1)
+
+    def find_row_containing(self, text):
+        """
+        Index of the first row with `text` in any cell, or -1.
+        """
+        for index, cells in enumerate(self.rows):
+            if any(text in cell for cell in cells):
+                return index
+        return -1
 
 
-class WebTable:
+class WebTable(BasePage):
+
+    # Cached TableSnapshot; dropped whenever this page object changes the table
+    _table = None
 
     # Locators for elements on the web table page
     ADD_BUTTON = "//button[@id='addNewRecordButton']"
     SEARCH_BOX = "//input[@id='searchBox']"
+    TABLE_BODY = ".rt-tbody"
+    TABLE_HEADERS = ".rt-thead.-header .rt-th"
     ROWS = ".rt-tbody .rt-tr-group"
     TABLE_CELLS = ".rt-td"
     DELETE_BUTTONS = 'span[title="Delete"]'
@@ -23,125 +110,140 @@ class WebTable:
     TXT_DEPARTMENT_XPATH = "//input[@id='department']"
     BTN_SUBMIT_XPATH = "//button[@id='submit']"
 
-    def __init__(self, driver):
-        self.driver = driver
-
-    def scroll_and_click(self, xpath, element_name, timeout=10, scroll_attempts=5):
-        try:
-            for attempt in range(scroll_attempts):
-                try:
-                    element = WebDriverWait(self.driver, timeout).until(
-                        EC.presence_of_element_located((By.XPATH, xpath))
-                    )
-                    self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element)
-                    element = WebDriverWait(self.driver, timeout).until(
-                        EC.element_to_be_clickable((By.XPATH, xpath))
-                    )
-                    element.click()
-                    return
-                except TimeoutException:
-                    continue
-            print(f"{element_name} card could not be clicked after {scroll_attempts} scroll attempts.")
-        except NoSuchElementException:
-            print(f"{element_name} card not found.")
-
-    def generate_xpath(self, element):
-        # Optional utility: generate unique XPath for dynamic elements if needed
-        # This is a placeholder; replace with actual logic or XPath attributes.
-        return self.driver.execute_script("""
-            function getElementXPath(elt) {
-                var path = "";
-                for (; elt && elt.nodeType == 1; elt = elt.parentNode) {
-                    idx = getElementIdx(elt);
-                    xname = elt.tagName;
-                    if (idx > 1) xname += "[" + idx + "]";
-                    path = "/" + xname + path;
-                }
-                return path.toLowerCase();
-                function getElementIdx(elt) {
-                    var count = 1;
-                    for (var sib = elt.previousSibling; sib ; sib = sib.previousSibling) {
-                        if(sib.nodeType == 1 && sib.tagName == elt.tagName) count++
-                    }
-                    return count;
-                }
-            }
-            return getElementXPath(arguments[0]);
-        """, element)
+    # Add/Edit form fields by table column name, for fill_form
+    FORM_FIELDS = {
+        "First Name": TXT_FIRST_NAME_XPATH,
+        "Last Name": TXT_LAST_NAME_XPATH,
+        "Email": TXT_EMAIL_XPATH,
+        "Age": TXT_AGE_XPATH,
+        "Salary": TXT_SALARY_XPATH,
+        "Department": TXT_DEPARTMENT_XPATH,
+    }
 
     def wait_for_table(self):
-        WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, self.ROWS))
-        )
+        # Wait for the table body, not the rows: an empty result must not cost a timeout
+        self.wait_for_presence(By.CSS_SELECTOR, self.TABLE_BODY)
 
     def get_all_rows(self):
         self.wait_for_table()
-        return self.driver.find_elements(By.CSS_SELECTOR, self.ROWS)
+        return self.find_all(By.CSS_SELECTOR, self.ROWS)
+
+    def snapshot(self):
+        """
+        Read the whole table (header + every row and cell) in a single script call.
+        Returns a TableSnapshot that answers lookups locally.
+        """
+        data = self.driver.execute_script(SNAPSHOT_SCRIPT, self.TABLE_HEADERS, self.ROWS, self.TABLE_CELLS)
+        if data is None:
+            # Table not rendered yet: wait for it once, then read again
+            self.wait_for_table()
+            data = self.driver.execute_script(SNAPSHOT_SCRIPT, self.TABLE_HEADERS, self.ROWS, self.TABLE_CELLS)
+        return TableSnapshot(data["columns"], data["rows"])
+
+    def table(self):
+        """
+        The cached snapshot of the table, taken on first use after the last change.
+        """
+        if self._table is None:
+            self._table = self.snapshot()
+        return self._table
+
+    def invalidate(self):
+        """
+        Drop the cached snapshot; called by every action that changes the rows.
+        """
+        self._table = None
 
     def get_row_data(self, row_index):
-        rows = self.get_all_rows()
-        if row_index < len(rows):
-            cells = rows[row_index].find_elements(By.CSS_SELECTOR, self.TABLE_CELLS)
-            return [cell.text.strip() for cell in cells]
-        return []
+        return self.table().row(row_index)
 
     def find_row_by_email(self, email):
-        rows = self.get_all_rows()
-        for index, row in enumerate(rows):
-            if email in row.text:
-                return index
-        return -1
+        # Same match as before the snapshot: the first row with `email` in any of its cells
+        return self.table().find_row_containing(email)
+
+    def find_row_by(self, column, value):
+        """
+        Index of the first row whose `column` (e.g. 'First Name', 'Department') equals `value`, or -1.
+        """
+        return self.table().find_row(column, value)
+
+    def _row_button(self, index, selector):
+        # The snapshot index is the row's position in the DOM, so one script call reaches its button
+        return self.driver.execute_script(
+            "var row = document.querySelectorAll(arguments[0])[arguments[1]];"
+            "return row ? row.querySelector(arguments[2]) : null;",
+            self.ROWS, index, selector)
+
+    def _row_button_by_email(self, email, selector):
+        # Stale-element recovery: the email is a stable row key, so re-read the table and find the row again
+        self.invalidate()
+        index = self.find_row_by_email(email)
+        return self._row_button(index, selector) if index != -1 else None
 
     def click_edit_by_email(self, email, timeout=10):
         index = self.find_row_by_email(email)
-        if index != -1:
-            element = self.get_all_rows()[index].find_element(By.CSS_SELECTOR, self.EDIT_BUTTONS)
-            xpath = element.get_attribute("xpath") or self.generate_xpath(element)
-            self.scroll_and_click(xpath, "Edit button", timeout)
+        if index == -1:
+            return
+        self.click_element(self._row_button(index, self.EDIT_BUTTONS), "Edit button",
+                           relocate=lambda: self._row_button_by_email(email, self.EDIT_BUTTONS), timeout=timeout)
 
     def click_edit_by_index(self, index, timeout=10):
-        rows = self.get_all_rows()
-        if index < len(rows):
-            element = rows[index].find_element(By.CSS_SELECTOR, self.EDIT_BUTTONS)
-            xpath = element.get_attribute("xpath") or self.generate_xpath(element)
-            self.scroll_and_click(xpath, "Edit button", timeout)
+        if index < 0:
+            return
+        self.click_element(self._row_button(index, self.EDIT_BUTTONS), "Edit button",
+                           relocate=lambda: self._row_button(index, self.EDIT_BUTTONS), timeout=timeout)
 
     def click_delete_by_email(self, email):
         index = self.find_row_by_email(email)
-        if index != -1:
-            element = self.get_all_rows()[index].find_element(By.CSS_SELECTOR, self.DELETE_BUTTONS)
-            xpath = element.get_attribute("xpath") or self.generate_xpath(element)
-            self.scroll_and_click(xpath, "Delete button")
+        if index == -1:
+            return
+        self.click_element(self._row_button(index, self.DELETE_BUTTONS), "Delete button",
+                           relocate=lambda: self._row_button_by_email(email, self.DELETE_BUTTONS))
+        self.invalidate()
 
     def search(self, keyword):
         keyword = str(keyword) if keyword is not None else ""
-        search_box = self.driver.find_element(By.XPATH, self.SEARCH_BOX)
+        search_box = self.find(By.XPATH, self.SEARCH_BOX)
         search_box.clear()
         search_box.send_keys(keyword)
+        self.invalidate()
+        self.wait_for_search_results(keyword)
+
+    def wait_for_search_results(self, keyword, timeout=10):
+        """
+        Wait until the table has re-rendered for `keyword`: every non-empty row contains it.
+        """
+        script = """
+            var keyword = arguments[1].toLowerCase();
+            return Array.prototype.every.call(document.querySelectorAll(arguments[0]), function (row) {
+                var text = row.innerText.trim().toLowerCase();
+                return text === '' || text.indexOf(keyword) !== -1;
+            });
+        """
+        try:
+            self.wait_for(lambda driver: driver.execute_script(script, self.ROWS, keyword), timeout)
+            return True
+        except TimeoutException:
+            print(f"Timeout: Table did not re-render for search '{keyword}'.")
+            return False
 
     def click_add_button(self):
         self.scroll_and_click(self.ADD_BUTTON, "Add Button")
 
-    def fill_add_new_record_form(self, first_name, last_name, email, age, salary, department):
-        self.driver.find_element(By.XPATH, self.TXT_FIRST_NAME_XPATH).clear()
-        self.driver.find_element(By.XPATH, self.TXT_FIRST_NAME_XPATH).send_keys(first_name)
-        self.driver.find_element(By.XPATH, self.TXT_LAST_NAME_XPATH).clear()
-        self.driver.find_element(By.XPATH, self.TXT_LAST_NAME_XPATH).send_keys(last_name)
-        self.driver.find_element(By.XPATH, self.TXT_EMAIL_XPATH).clear()
-        self.driver.find_element(By.XPATH, self.TXT_EMAIL_XPATH).send_keys(email)
-        self.driver.find_element(By.XPATH, self.TXT_AGE_XPATH).clear()
-        self.driver.find_element(By.XPATH, self.TXT_AGE_XPATH).send_keys(age)
-        self.driver.find_element(By.XPATH, self.TXT_SALARY_XPATH).clear()
-        self.driver.find_element(By.XPATH, self.TXT_SALARY_XPATH).send_keys(salary)
-        self.driver.find_element(By.XPATH, self.TXT_DEPARTMENT_XPATH).clear()
-        self.driver.find_element(By.XPATH, self.TXT_DEPARTMENT_XPATH).send_keys(department)
+    def fill_add_new_record_form(self, first_name, last_name, email, age, salary, department, real_typing=False):
+        self.fill_form({
+            "First Name": first_name,
+            "Last Name": last_name,
+            "Email": email,
+            "Age": age,
+            "Salary": salary,
+            "Department": department,
+        }, real_typing=real_typing)
 
     def click_submit_button(self):
+        # Submitting the form adds or edits a record
         self.scroll_and_click(self.BTN_SUBMIT_XPATH, "Submit Button")
+        self.invalidate()
 
     def get_row_data_by_index(self, row_index):
-        rows = self.get_all_rows()
-        if row_index < len(rows):
-            cells = rows[row_index].find_elements(By.CSS_SELECTOR, self.TABLE_CELLS)
-            return [cell.text.strip() for cell in cells]
-        return []
+        return self.table().row(row_index)
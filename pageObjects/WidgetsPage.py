@@ -1,11 +1,10 @@
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import time
 
-class WidgetsPage:
+from pageObjects.BasePage import BasePage
+
+
+class WidgetsPage(BasePage):
 
     # Locators for the Widgets page elements
     # Accordion
@@ -25,24 +24,17 @@ class WidgetsPage:
     INPUT_MULTIPLE_COLOR_AUTO_COMPLETE_CSS_SELECTOR = ".auto-complete__value-container.auto-complete__value-container--is-multi.css-1hwfws3"
     SELECTED_COLORS_AUTO_COMPLETE_CSS_SELECTOR = "//div[@class = 'css-1rhbuit-multiValue auto-complete__multi-value']"
 
-    def __init__(self, driver):
-        """
-        Initialize the WidgetsPage object.
-        """
-        self.driver = driver
-
     def scroll_until_element_visible(self, by, locator, max_scrolls=10):
         """
         Scrolls the page until the element specified by `by` and `locator` is visible or max_scrolls is reached.
         # """
+        # Give the element time to render once; the scroll attempts below check without waiting
+        self.wait_for_all(by, locator)
         for _ in range(max_scrolls):
-            try:
-                element = self.driver.find_element(by, locator)
-                if element.is_displayed():
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                    return element
-            except NoSuchElementException:
-                pass
+            elements = self.find_all(by, locator)
+            if elements and elements[0].is_displayed():
+                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", elements[0])
+                return elements[0]
             self.driver.execute_script("window.scrollBy(0, 200);")
         raise Exception(f"Element not visible after scrolling: {locator}")
 
@@ -119,9 +111,6 @@ class WidgetsPage:
         # Locate the actual input field inside the container
         input_element = container.find_element(By.TAG_NAME, "input")
 
-        # Initialize an explicit wait to handle dynamic elements like dropdown suggestions
-        wait = WebDriverWait(self.driver, 10)
-
         # Iterate through the list of colors and enter each one
         for color in colors:
             # Focus on the input field
@@ -134,9 +123,7 @@ class WidgetsPage:
             input_element.send_keys(color)
 
             # Wait until the suggestion dropdown becomes visible before proceeding
-            wait.until(EC.visibility_of_element_located(
-                (By.CSS_SELECTOR, ".auto-complete__menu")  # Ensure this matches your app’s dropdown class
-            ))
+            self.wait_for_visibility(By.CSS_SELECTOR, ".auto-complete__menu")  # Ensure this matches your app’s dropdown class
 
             # Press ENTER to select the currently highlighted suggestion from the dropdown
             input_element.send_keys(Keys.ENTER)
@@ -150,5 +137,5 @@ class WidgetsPage:
 
         :return: List of selected color texts
         """
-        elements = self.driver.find_elements(By.XPATH, self.SELECTED_COLORS_AUTO_COMPLETE_CSS_SELECTOR)
+        elements = self.wait_for_all(By.XPATH, self.SELECTED_COLORS_AUTO_COMPLETE_CSS_SELECTOR)
         return [element.text for element in elements if element.is_displayed()]
\ No newline at end of file
@@ -2,8 +2,10 @@ import json
 import pytest
 from pageObjects.WidgetsPage import WidgetsPage
 from pageObjects.HomePage import HomePage
+from pageObjects.Navigator import Navigator
 from unititlies.customlogger import LogGen
 from unititlies.readProperties import ReadConfig
+from unititlies.screenshotService import capture_screenshot
 
 
 class TestBrowserWindowHandles:
@@ -26,15 +28,10 @@ class TestBrowserWindowHandles:
         self.logger.info("WebDriver instance initialized.")
 
         # Configure browser
-        self.driver.implicitly_wait(10)
-        self.logger.info("Implicit wait set to 10 seconds.")
 
         self.driver.maximize_window()
         self.logger.info("Browser window maximized.")
 
-        self.driver.get(self.baseURL)
-        self.logger.info(f"Navigated to application URL: {self.baseURL}")
-
         # Handle multiple tabs (e.g., close Bing, stay on the main app)
         windows = self.driver.window_handles
         self.logger.info(f"Window handles retrieved: {windows}")
@@ -55,7 +52,7 @@ class TestBrowserWindowHandles:
         except Exception as e:
             self.logger.error(f"Failed to load test data: {str(e)}")
             screenshot_path = "./Screenshots/test_data_load_exception.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.info(f"Screenshot saved at: {screenshot_path}")
             raise
 
@@ -63,19 +60,14 @@ class TestBrowserWindowHandles:
         self.home_page = HomePage(self.driver)
         self.widgets_page = WidgetsPage(self.driver)
 
-        # Navigate to the Registration Form
-        self.home_page.click_on_widgets_card()
-        self.logger.info("Clicked on 'Forms' card on Home Page.")
-
-        self.widgets_page.click_accordion_option()
-        self.logger.info("Clicked on 'Practice Form' under the Forms section.")
+        # Jump straight to the section under test (single page load)
+        Navigator(self.driver).navigate_to("Accordian")
+        self.logger.info("Navigated directly to 'Accordian' section.")
 
         yield  # Run the test method
 
         # ---------- TEAR DOWN ----------
-        self.logger.info("Closing browser after test execution.")
-        self.driver.quit()
-        self.logger.info("Browser closed successfully.")
+        self.logger.info("Test finished. Browser teardown is handled by the 'setup' fixture.")
 
     def test_accordion_widget(self):
         test_name = "test_accordion_widget"
@@ -115,14 +107,14 @@ class TestBrowserWindowHandles:
 
         except AssertionError as ae:
             screenshot_path = "./Screenshots/output_assertion_failed.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"Assertion failed in {test_name}: {str(ae)}")
             self.logger.error(f"Screenshot saved to {screenshot_path}")
             raise
 
         except Exception as e:
             screenshot_path = "./Screenshots/output_exception_error.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"Exception occurred in {test_name}: {str(e)}")
             self.logger.error(f"Screenshot saved to {screenshot_path}")
             raise
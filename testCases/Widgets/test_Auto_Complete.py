@@ -2,8 +2,10 @@ import json
 import pytest
 from pageObjects.WidgetsPage import WidgetsPage
 from pageObjects.HomePage import HomePage
+from pageObjects.Navigator import Navigator
 from unititlies.customlogger import LogGen
 from unititlies.readProperties import ReadConfig
+from unititlies.screenshotService import capture_screenshot
 
 
 class TestBrowserWindowHandles:
@@ -26,15 +28,10 @@ class TestBrowserWindowHandles:
         self.logger.info("WebDriver instance initialized.")
 
         # Configure browser
-        self.driver.implicitly_wait(10)
-        self.logger.info("Implicit wait set to 10 seconds.")
 
         self.driver.maximize_window()
         self.logger.info("Browser window maximized.")
 
-        self.driver.get(self.baseURL)
-        self.logger.info(f"Navigated to application URL: {self.baseURL}")
-
         # Handle multiple tabs (e.g., close Bing, stay on the main app)
         windows = self.driver.window_handles
         self.logger.info(f"Window handles retrieved: {windows}")
@@ -55,7 +52,7 @@ class TestBrowserWindowHandles:
         except Exception as e:
             self.logger.error(f"Failed to load test data: {str(e)}")
             screenshot_path = "./Screenshots/test_data_load_exception.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.info(f"Screenshot saved at: {screenshot_path}")
             raise
 
@@ -63,19 +60,14 @@ class TestBrowserWindowHandles:
         self.home_page = HomePage(self.driver)
         self.widgets_page = WidgetsPage(self.driver)
 
-        # Navigate to the Registration Form
-        self.home_page.click_on_widgets_card()
-        self.logger.info("Clicked on 'Forms' card on Home Page.")
-
-        self.widgets_page.click_auto_complete_option()
-        self.logger.info("Clicked on 'Practice Form' under the Forms section.")
+        # Jump straight to the section under test (single page load)
+        Navigator(self.driver).navigate_to("Auto Complete")
+        self.logger.info("Navigated directly to 'Auto Complete' section.")
 
         yield  # Run the test method
 
         # ---------- TEAR DOWN ----------
-        self.logger.info("Closing browser after test execution.")
-        self.driver.quit()
-        self.logger.info("Browser closed successfully.")
+        self.logger.info("Test finished. Browser teardown is handled by the 'setup' fixture.")
 
     def test_auto_complete(self):
         self.logger.info("Starting test: test_auto_complete")
@@ -102,14 +94,14 @@ class TestBrowserWindowHandles:
         except AssertionError as ae:
             self.logger.error(f"Assertion failed: {ae}")
             screenshot_path = "./Screenshots/test_auto_complete_failure.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.info(f"Screenshot saved at {screenshot_path}")
             raise
 
         except Exception as e:
             self.logger.error(f"An unexpected error occurred: {e}")
             screenshot_path = "./Screenshots/test_auto_complete_exception.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.info(f"Screenshot saved at {screenshot_path}")
             raise
 
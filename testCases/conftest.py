@@ -1,10 +1,27 @@
+import json
+
 from pytest_metadata.plugin import metadata_key
-from selenium import webdriver
 import pytest
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.edge.options import Options as EdgeOptions
-import os
+from unititlies.browserLauncher import PrewarmedLauncher, format_startup_report
+from unititlies.commandProfiler import CommandProfiler
+from unititlies.customlogger import LogGen
+from unititlies.downloadManager import redirect_browser_downloads
+from unititlies.driverFactory import DriverFactory
+from unititlies.driverPool import DriverPool, format_pool_stats
+from unititlies.eventLog import EventLogPlugin
+from unititlies.fileHash import precompute_digests
+from unititlies.harProxy import ReplayProxy, TrafficArchive
+from unititlies.lptScheduler import DurationScheduler
+from unititlies.perfBudget import PerformanceBudget
+from unititlies.readProperties import ReadConfig
+from unititlies.requestBlocker import BLOCKLIST_PATH, RequestBlocker, load_patterns
+from unititlies.screenshotService import ScreenshotService, set_service
+from unititlies.sleepAuditor import SleepAuditor
+from unititlies.stubServer import StubServer
+
+
+# Stash key holding the driver pool counters reported at the end of the run
+pool_stats_key = pytest.StashKey[dict]()
 
 
 ####################### Browser SetUp Code Start #######################
@@ -22,6 +39,150 @@ def pytest_addoption(parser):
         action="store_true",
         help="Run tests in headless mode"
     )
+    parser.addoption(
+        "--driver-pool",
+        action="store_true",
+        help="Reuse warm browser sessions across tests instead of launching one per test"
+    )
+    parser.addoption(
+        "--pool-size",
+        action="store",
+        type=int,
+        default=1,
+        help="Maximum number of idle browser sessions kept per worker (with --driver-pool)"
+    )
+    parser.addoption(
+        "--pool-max-reuse",
+        action="store",
+        type=int,
+        default=0,
+        help="Relaunch a pooled browser after this many tests, 0 for unlimited (with --driver-pool)"
+    )
+    parser.addoption(
+        "--prewarm",
+        action="store_true",
+        help="Boot the next test's browser in the background while the current test runs"
+    )
+    parser.addoption(
+        "--ui-navigation",
+        action="store_true",
+        help="Also run the opt-in tests that walk the Home -> card -> sidebar click paths"
+    )
+    parser.addoption(
+        "--sleep-budget",
+        action="store",
+        type=float,
+        default=None,
+        help="Fail a test that spends more than this many seconds in time.sleep"
+    )
+    parser.addoption(
+        "--link-stub",
+        action="store_true",
+        help="Run the link audit against a local stub server instead of the live site (offline CI)"
+    )
+    parser.addoption(
+        "--crawl",
+        action="store_true",
+        help="Also run the opt-in site-wide link crawl"
+    )
+    parser.addoption(
+        "--crawl-concurrency",
+        action="store",
+        type=int,
+        default=8,
+        help="Links checked at the same time by the site crawl"
+    )
+    parser.addoption(
+        "--crawl-rate",
+        action="store",
+        type=float,
+        default=5.0,
+        help="Maximum requests per second per host during the site crawl"
+    )
+    parser.addoption(
+        "--automation-log-level",
+        action="store",
+        default=None,
+        help="Lowest level written to Logs/automation.log (default: [LOGGING] Level in config.ini)"
+    )
+    parser.addoption(
+        "--screenshot-cap-mb",
+        action="store",
+        type=float,
+        default=200,
+        help="Disk budget for ./Screenshots; least recently used screenshots are evicted, 0 for no limit"
+    )
+    parser.addoption(
+        "--profile-commands",
+        action="store_true",
+        help="Record every WebDriver command per test and page-object method"
+    )
+    parser.addoption(
+        "--profile-output",
+        action="store",
+        default="./Reports/webdriver_commands.folded",
+        help="Folded-stacks file (for flamegraph.pl or speedscope) written with --profile-commands"
+    )
+    parser.addoption(
+        "--perf-budget",
+        action="store_true",
+        help="Enforce per-test wall time / WebDriver command budgets from --perf-budget-file"
+    )
+    parser.addoption(
+        "--perf-budget-file",
+        action="store",
+        default="./TestData/perf_budgets.json",
+        help="JSON file with the per-test budgets used by --perf-budget"
+    )
+    parser.addoption(
+        "--perf-history",
+        action="store",
+        default="./Reports/perf_history.json",
+        help="Rolling per-test duration history used by --perf-budget to flag regressions"
+    )
+    parser.addoption(
+        "--perf-regression",
+        action="store",
+        type=float,
+        default=0.25,
+        help="Flag a test whose recent median duration is this much slower than before (0.25 = 25%%)"
+    )
+    parser.addoption(
+        "--lpt-schedule",
+        action="store_true",
+        help="With -n and --dist load/loadscope, hand out tests longest-first using the durations of previous runs"
+    )
+    parser.addoption(
+        "--durations-file",
+        action="store",
+        default="./Reports/test_durations.json",
+        help="Per-test durations recorded and used by --lpt-schedule"
+    )
+    parser.addoption(
+        "--traffic",
+        action="store",
+        choices=("record", "replay", "offline"),
+        default=None,
+        help="Send browser traffic through a local proxy: record it, replay it (misses are recorded), "
+             "or replay it offline (misses fail with 504)"
+    )
+    parser.addoption(
+        "--traffic-archive",
+        action="store",
+        default="./Reports/traffic",
+        help="Directory of the recorded traffic used by --traffic"
+    )
+    parser.addoption(
+        "--blocklist",
+        action="store",
+        default=BLOCKLIST_PATH,
+        help="File of ad/analytics URL patterns blocked in the browser"
+    )
+    parser.addoption(
+        "--no-blocking",
+        action="store_true",
+        help="Let ads and analytics load (no request blocking)"
+    )
 
 # Fixture to read the browser name from command-line options
 @pytest.fixture()
@@ -33,58 +194,177 @@ def browser(request):
 def headless(request):
     return request.config.getoption("--headless")
 
+# "host:port" of the record/replay proxy (one per xdist worker); None without --traffic
+@pytest.fixture(scope="session")
+def traffic_proxy(request):
+    proxy = request.config.pluginmanager.get_plugin("traffic_proxy")
+    return proxy.start().address if proxy else None
+
+# Extra DriverFactory.create_driver arguments, shared by every way of launching a browser
+@pytest.fixture(scope="session")
+def launch_options(request, traffic_proxy):
+    blocker = request.config.pluginmanager.get_plugin("request_blocker")
+    return {"proxy": traffic_proxy, "network_log": blocker is not None}
+
+# Session-wide driver pool (one per xdist worker); None when pooling is disabled
+@pytest.fixture(scope="session")
+def driver_pool(request, launch_options):
+    config = request.config
+    if not config.getoption("--driver-pool"):
+        yield None
+        return
+
+    browser_name = config.getoption("--browser")
+    is_headless = config.getoption("--headless")
+    pool = DriverPool(
+        launcher=lambda: DriverFactory.create_driver(browser_name, is_headless, **launch_options),
+        base_url=ReadConfig.get_application_url(),
+        max_size=config.getoption("--pool-size"),
+        max_reuse=config.getoption("--pool-max-reuse"),
+    )
+    yield pool
+    pool.close_all()
+
+    stats = pool.stats()
+    if hasattr(config, "workeroutput"):
+        # Running inside an xdist worker: hand the counters to the controller
+        config.workeroutput["driver_pool"] = stats
+    else:
+        _merge_pool_stats(config, stats)
+
+# Session-wide background launcher; None when pre-warming is disabled
+@pytest.fixture(scope="session")
+def browser_launcher(request, launch_options):
+    config = request.config
+    if not config.getoption("--prewarm"):
+        yield None
+        return
+
+    browser_name = config.getoption("--browser")
+    is_headless = config.getoption("--headless")
+    launcher = PrewarmedLauncher(lambda: DriverFactory.create_driver(browser_name, is_headless, **launch_options))
+    yield launcher
+    launcher.shutdown()
+
+# Base URL for the link audit: a local stub server with --link-stub, otherwise the configured site
+@pytest.fixture(scope="session")
+def links_base_url(request):
+    if not request.config.getoption("--link-stub"):
+        yield ReadConfig.get_application_url()
+        return
+
+    with StubServer() as server:
+        yield server.base_url
+
+# Upload fixtures are hashed once per session (per xdist worker); upload_file then hits the cache
+@pytest.fixture(scope="session", autouse=True)
+def upload_fixture_digests():
+    with open("./TestData/elements_page.json", "r") as file:
+        elements_data = json.load(file)
+    with open("./TestData/registration_form.json", "r") as file:
+        registration_data = json.load(file)
+    return precompute_digests([
+        elements_data["UploadAndDownload"]["uploadFilePath"],
+        registration_data["UserOne"]["UploadFile"],
+    ])
+
+# Per-test download directory, so parallel xdist workers never see each other's files.
+# Chromium browsers are redirected at runtime; others keep their launch-time directory (None).
+@pytest.fixture()
+def download_dir(setup, tmp_path):
+    directory = tmp_path / "downloads"
+    directory.mkdir()
+    yield str(directory) if redirect_browser_downloads(setup, directory) else None
+
 # Fixture to initialize and return the appropriate WebDriver instance
 @pytest.fixture()
-def setup(browser, headless):
-    global driver
-
-    if browser == "chrome":
-        options = ChromeOptions()
-        extension_path = os.path.abspath("C:/Users/DELL/PycharmProjects/UI_Elements_Project/Extensions/uBlock_Origin.crx")
-        download_dir = os.path.abspath("C:/Users/DELL/PycharmProjects/UI_Elements_Project/Download")
-
-        # These options should be added regardless of headless mode
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_extension(extension_path)
-
-        # Download preferences
-        options.add_experimental_option("prefs", {
-            "download.default_directory": download_dir,
-            "download.prompt_for_download": False,
-            "download.directory_upgrade": True,
-            "safebrowsing.enabled": True
-        })
-
-        if headless:
-            options.add_argument("--headless=new")  # Required for headless downloads in new Chrome
-            options.add_argument("--disable-gpu")
-            options.add_argument("--window-size=1920,1080")
-
-        driver = webdriver.Chrome(options=options)
-        print("Launching Chrome" + (" in headless mode" if headless else ""))
-
-
-
-    elif browser == "firefox":
-        options = FirefoxOptions()
-        if headless:
-            options.headless = True
-        driver = webdriver.Firefox(options=options)
-        print("Launching Firefox" + (" in headless mode" if headless else ""))
-
-    elif browser == "edge":
-        if headless:
-            print("Warning: Headless mode for Edge is not officially supported in this script.")
-        driver = webdriver.Edge()
-        print("Launching Edge")
+def setup(request, browser, headless, driver_pool, browser_launcher, launch_options):
+    # With --profile-commands every command the test sends is recorded
+    profiler = request.config.pluginmanager.get_plugin("command_profiler")
+    # Ads and analytics are blocked unless --no-blocking
+    blocker = request.config.pluginmanager.get_plugin("request_blocker")
 
-    else:
-        raise ValueError(f"Unsupported browser: {browser}")
+    if driver_pool is not None:
+        driver = driver_pool.acquire()
+        yield _prepare_driver(driver, profiler, blocker)
+        _count_blocked(driver, blocker)
+        driver_pool.release(driver)
+        return
+
+    if browser_launcher is not None:
+        driver, timing = browser_launcher.acquire()
+        # Travels with the test report, so it also reaches the xdist controller
+        request.node.user_properties.append(("browser_startup", timing))
+        yield _prepare_driver(driver, profiler, blocker)
+        _count_blocked(driver, blocker)
+        driver.quit()
+        return
 
-    yield driver
+    driver = DriverFactory.create_driver(browser, headless, **launch_options)
+    yield _prepare_driver(driver, profiler, blocker)
+    _count_blocked(driver, blocker)
     driver.quit()
+
+
+def _prepare_driver(driver, profiler, blocker):
+    # Chromium blocks by itself (CDP); other browsers were launched behind the proxy filter
+    if blocker is not None:
+        blocker.apply(driver)
+    return profiler.wrap(driver) if profiler else driver
+
+
+def _count_blocked(driver, blocker):
+    if blocker is not None:
+        blocker.collect(driver)
+
+
+def _merge_pool_stats(config, stats):
+    totals = config.stash.get(pool_stats_key, None)
+    if totals is None:
+        config.stash[pool_stats_key] = dict(stats)
+        return
+    for key, value in stats.items():
+        totals[key] += value
+
+# Collects the driver pool counters from each xdist worker as it finishes
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    stats = getattr(node, "workeroutput", {}).get("driver_pool")
+    if stats:
+        _merge_pool_stats(node.config, stats)
+
+# Skips the opt-in click-path navigation tests and site crawl unless they were asked for
+def pytest_collection_modifyitems(config, items):
+    opt_in = {
+        "navigation": ("--ui-navigation", "UI navigation tests are opt-in, use --ui-navigation"),
+        "crawl": ("--crawl", "The site crawl is opt-in, use --crawl"),
+    }
+    for marker, (option, reason) in opt_in.items():
+        if config.getoption(option):
+            continue
+        skip = pytest.mark.skip(reason=reason)
+        for item in items:
+            if marker in item.keywords:
+                item.add_marker(skip)
+
+# Prints the driver pool and pre-warm summaries so startup savings can be measured
+def pytest_terminal_summary(terminalreporter, config):
+    stats = config.stash.get(pool_stats_key, None)
+    if stats:
+        terminalreporter.section("Driver pool")
+        for line in format_pool_stats(stats):
+            terminalreporter.write_line(line)
+
+    timings = {}
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            for name, value in getattr(report, "user_properties", []):
+                if name == "browser_startup":
+                    timings[report.nodeid] = value
+    if timings:
+        terminalreporter.section("Browser startup (pre-warmed)")
+        for line in format_startup_report(timings, verbose=config.getoption("verbose") > 0):
+            terminalreporter.write_line(line)
 ####################### Browser SetUp Code End #######################
 
 
@@ -93,15 +373,70 @@ def setup(browser, headless):
 
 # Hook to add custom environment info to the HTML test report
 def pytest_configure(config):
+    # Start the background log writer before any test class asks for its logger
+    worker_id = getattr(config, "workerinput", {}).get("workerid")
+    LogGen.configure(config.getoption("--automation-log-level") or ReadConfig.get_log_level(), worker_id)
+    # Per-test timelines in Logs/events.jsonl; under xdist the workers write them, not the controller
+    if worker_id is not None or getattr(config.option, "dist", "no") == "no":
+        config.pluginmanager.register(EventLogPlugin(), "event_log")
+
+    # Reports time spent in time.sleep per test (and enforces --sleep-budget)
+    config.pluginmanager.register(SleepAuditor(config.getoption("--sleep-budget")), "sleep_auditor")
+
+    # Failure screenshots are written in the background, deduplicated and attached to the HTML report
+    screenshots = ScreenshotService(max_bytes=int(config.getoption("--screenshot-cap-mb") * 1024 * 1024))
+    config.pluginmanager.register(screenshots, "screenshot_service")
+    set_service(screenshots)
+
+    # Budgets need the command counts, so they turn on the profiler (without its summary)
+    profile = config.getoption("--profile-commands")
+    budget_path = config.getoption("--perf-budget-file") if config.getoption("--perf-budget") else None
+    profiler = None
+    if profile or budget_path:
+        profiler = CommandProfiler(config.getoption("--profile-output") if profile else None, summary=profile)
+        config.pluginmanager.register(profiler, "command_profiler")
+    if budget_path:
+        budget = PerformanceBudget(budget_path, config.getoption("--perf-history"),
+                                   threshold=config.getoption("--perf-regression"), profiler=profiler)
+        config.pluginmanager.register(budget, "perf_budget")
+
+    if config.getoption("--lpt-schedule"):
+        config.pluginmanager.register(DurationScheduler(config.getoption("--durations-file")), "lpt_scheduler")
+
+    # Network-level ad/analytics blocking; sizes recorded by --traffic give the bytes saved
+    blocker = None
+    if not config.getoption("--no-blocking"):
+        # The index is only parsed when something was recorded
+        archive_dir = config.getoption("--traffic-archive")
+        sizes = TrafficArchive(archive_dir).sizes() if TrafficArchive.exists(archive_dir) else None
+        blocker = RequestBlocker(load_patterns(config.getoption("--blocklist")), sizes=sizes)
+        config.pluginmanager.register(blocker, "request_blocker")
+
+    # Browser traffic through the local proxy, started by the first test that needs a browser: to record
+    # or replay it, or only to filter it for browsers without CDP
+    traffic_mode = config.getoption("--traffic")
+    if traffic_mode is None and blocker is not None and config.getoption("--browser") == "firefox":
+        traffic_mode = "live"
+    if traffic_mode:
+        proxy = ReplayProxy(config.getoption("--traffic-archive"), traffic_mode, blocker=blocker)
+        config.pluginmanager.register(proxy, "traffic_proxy")
+
     config.stash[metadata_key] ['Project Name'] = 'Demo Project'  # Define project name
     config.stash[metadata_key] ['Test Module Name'] = 'Login Tests'  # Define module name
     config.stash[metadata_key] ['Tester Name'] = 'Vishal Hadiyal'  # Define tester name
 
 
+# Flushes this process's log; the controller (or a run without xdist) merges the worker logs
+def pytest_unconfigure(config):
+    LogGen.shutdown()
+    if not hasattr(config, "workerinput"):
+        LogGen.merge_worker_logs()
+
+
 # Hook to remove unwanted metadata from the HTML report
 @pytest.hookimpl(optionalhook=True)
 def pytest_metadata(metadata):
     metadata.pop("JAVA_HOME", None)  # Remove JAVA_HOME if present
     metadata.pop("Plugins", None)  # Remove Plugin metadata if present
 
-####################### Pytest HTML Report Configuration Start ###########################
\ No newline at end of file
+####################### Pytest HTML Report Configuration Start ###########################
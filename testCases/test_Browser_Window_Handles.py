@@ -1,5 +1,4 @@
 import json
-import time
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -8,8 +7,10 @@ from selenium.webdriver.support import expected_conditions as EC
 import pytest
 from pageObjects.BrowserWindow import BrowserWindowHandle
 from pageObjects.HomePage import HomePage
+from pageObjects.Navigator import Navigator
 from unititlies.customlogger import LogGen
 from unititlies.readProperties import ReadConfig
+from unititlies.screenshotService import capture_screenshot
 
 
 class TestBrowserWindowHandles:
@@ -32,15 +33,10 @@ class TestBrowserWindowHandles:
         self.logger.info("WebDriver instance initialized.")
 
         # Configure browser
-        self.driver.implicitly_wait(10)
-        self.logger.info("Implicit wait set to 10 seconds.")
 
         self.driver.maximize_window()
         self.logger.info("Browser window maximized.")
 
-        self.driver.get(self.baseURL)
-        self.logger.info(f"Navigated to application URL: {self.baseURL}")
-
         # Handle multiple tabs (e.g., close Bing, stay on the main app)
         windows = self.driver.window_handles
         self.logger.info(f"Window handles retrieved: {windows}")
@@ -61,7 +57,7 @@ class TestBrowserWindowHandles:
         except Exception as e:
             self.logger.error(f"Failed to load test data: {str(e)}")
             screenshot_path = "./Screenshots/test_data_load_exception.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.info(f"Screenshot saved at: {screenshot_path}")
             raise
 
@@ -69,19 +65,14 @@ class TestBrowserWindowHandles:
         self.home_page = HomePage(self.driver)
         self.BWH = BrowserWindowHandle(self.driver)
 
-        # Navigate to the Registration Form
-        self.home_page.click_on_alerts_frame_windows_card()
-        self.logger.info("Clicked on 'Forms' card on Home Page.")
-
-        self.BWH.click_on_browser_window_option()
-        self.logger.info("Clicked on 'Practice Form' under the Forms section.")
+        # Jump straight to the section under test (single page load)
+        Navigator(self.driver).navigate_to("Browser Windows")
+        self.logger.info("Navigated directly to 'Browser Windows' section.")
 
         yield  # Run the test method
 
         # ---------- TEAR DOWN ----------
-        self.logger.info("Closing browser after test execution.")
-        self.driver.quit()
-        self.logger.info("Browser closed successfully.")
+        self.logger.info("Test finished. Browser teardown is handled by the 'setup' fixture.")
 
     @pytest.mark.smoke
     def test_browser_new_tab(self):
@@ -96,9 +87,13 @@ class TestBrowserWindowHandles:
         try:
             # Step 1: Click on the 'New Tab' button
             self.logger.info("Clicking on the 'New Tab' button.")
+            known_windows = self.driver.window_handles
             self.BWH.click_on_new_tab_button()
             self.logger.info("Clicked on 'New Tab' button successfully.")
 
+            # Wait for the new window/tab to open instead of reading the handles right away
+            self.BWH.wait_for_new_window(known_windows)
+
             # Step 2: Get the list of current browser window handles
             windows = self.driver.window_handles
             self.logger.info(f"Window handles after opening new tab: {windows}")
@@ -121,13 +116,13 @@ class TestBrowserWindowHandles:
 
             # Optional: Take a screenshot for documentation
             screenshot_path = "./Screenshots/test_browser_new_tab_success.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.info(f"Screenshot captured at: {screenshot_path}")
 
         except AssertionError as e:
             # Capture a screenshot in case of assertion failure
             screenshot_path = "./Screenshots/test_browser_new_tab_failure.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"Assertion failed: {e}")
             self.logger.error(f"Screenshot captured at: {screenshot_path}")
             raise
@@ -135,7 +130,7 @@ class TestBrowserWindowHandles:
         except Exception as e:
             # General exception handling with screenshot
             screenshot_path = "./Screenshots/test_browser_new_tab_exception.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"An unexpected error occurred: {e}")
             self.logger.error(f"Screenshot captured at: {screenshot_path}")
             raise
@@ -166,9 +161,13 @@ class TestBrowserWindowHandles:
         try:
             # Step 1: Click on the 'New Window' button
             self.logger.info("Attempting to click on the 'New Window' button.")
+            known_windows = self.driver.window_handles
             self.BWH.click_on_new_window_button()
             self.logger.info("Clicked on 'New Window' button successfully.")
 
+            # Wait for the new window/tab to open instead of reading the handles right away
+            self.BWH.wait_for_new_window(known_windows)
+
             # Step 2: Retrieve all current browser window handles
             windows = self.driver.window_handles
             self.logger.info(f"Window handles retrieved: {windows}")
@@ -194,13 +193,13 @@ class TestBrowserWindowHandles:
 
             # Step 6: Capture a screenshot upon success
             screenshot_path = "./Screenshots/test_browser_new_window_success.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.info(f"Screenshot captured successfully at: {screenshot_path}")
 
         except AssertionError as e:
             # Handle assertion failures
             screenshot_path = "./Screenshots/test_browser_new_window_failure.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"Assertion failed: {e}")
             self.logger.error(f"Failure screenshot captured at: {screenshot_path}")
             raise
@@ -208,7 +207,7 @@ class TestBrowserWindowHandles:
         except Exception as e:
             # Handle unexpected exceptions
             screenshot_path = "./Screenshots/test_browser_new_window_exception.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"An unexpected exception occurred: {e}")
             self.logger.error(f"Exception screenshot captured at: {screenshot_path}")
             raise
@@ -280,7 +279,7 @@ class TestBrowserWindowHandles:
 
         except Exception as e:
             screenshot_path = f"./Screenshots/{test_name}_failure.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"{test_name} failed. Screenshot saved to {screenshot_path}")
             self.logger.exception("Exception occurred during test execution:")
             raise e
@@ -332,7 +331,7 @@ class TestBrowserWindowHandles:
         except AssertionError as ae:
             # Capture and log error with screenshot on failure
             screenshot_path = f"./Screenshots/{test_name}_failure.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"Assertion failed in {test_name}: {ae}")
             self.logger.error(f"Screenshot saved to: {screenshot_path}")
             raise
@@ -340,7 +339,7 @@ class TestBrowserWindowHandles:
         except Exception as e:
             # Handle any unexpected exceptions
             screenshot_path = f"./Screenshots/{test_name}_exception.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"Exception occurred in {test_name}: {e}")
             self.logger.error(f"Screenshot saved to: {screenshot_path}")
             raise
@@ -400,14 +399,14 @@ class TestBrowserWindowHandles:
         except AssertionError as e:
             self.logger.error(f"Assertion failed in {test_name}: {str(e)}")
             screenshot_path = f"./Screenshots/{test_name}_assertion_error.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.info(f"Screenshot saved to {screenshot_path}")
             raise
 
         except Exception as e:
             self.logger.error(f"Exception occurred in {test_name}: {str(e)}", exc_info=True)
             screenshot_path = f"./Screenshots/{test_name}_exception.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.info(f"Screenshot saved to {screenshot_path}")
             raise
 
@@ -449,14 +448,14 @@ class TestBrowserWindowHandles:
 
         except AssertionError as e:
             screenshot_path = "./Screenshots/test_iframe_failure.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"Assertion failed: {e}")
             self.logger.error(f"Screenshot captured at: {screenshot_path}")
             raise
 
         except Exception as e:
             screenshot_path = "./Screenshots/test_iframe_exception.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"An unexpected error occurred: {e}")
             self.logger.error(f"Screenshot captured at: {screenshot_path}")
             raise
@@ -483,7 +482,7 @@ class TestBrowserWindowHandles:
             # Step 1: Click on the 'Nested Frames' option
             self.logger.info("Clicking on the 'Nested Frames' option.")
             self.BWH.click_on_nested_iframe_option()
-            time.sleep(3)
+            self.BWH.wait_for_nested_frames_page()
 
             # Step 2: Validate main header text outside the iframe
             self.logger.info("Validating the main heading text of nested frame page.")
@@ -513,14 +512,14 @@ class TestBrowserWindowHandles:
 
         except AssertionError as e:
             screenshot_path = "./Screenshots/test_nested_iframe_failure.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"Assertion failed: {e}")
             self.logger.error(f"Screenshot captured at: {screenshot_path}")
             raise
 
         except Exception as e:
             screenshot_path = "./Screenshots/test_nested_iframe_exception.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"An unexpected error occurred: {e}")
             self.logger.error(f"Screenshot captured at: {screenshot_path}")
             raise
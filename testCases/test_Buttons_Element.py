@@ -1,9 +1,10 @@
 import json
 import pytest
-from pageObjects.HomePage import HomePage
 from pageObjects.ElementsPage import ElementsPage
+from pageObjects.Navigator import Navigator
 from unititlies.customlogger import LogGen
 from unititlies.readProperties import ReadConfig
+from unititlies.screenshotService import capture_screenshot
 
 
 class TestButtonElements:
@@ -17,12 +18,10 @@ class TestButtonElements:
         This setup method runs automatically before each test method.
         It performs the following actions:
         - Initializes the WebDriver.
-        - Sets an implicit wait.
         - Maximizes the browser window.
-        - Navigates to the base URL.
         - Loads test data from a JSON file.
         - Initializes page objects.
-        - Navigate to the 'Elements' section and click on the 'Buttons' option.
+        - Opens the 'Buttons' section directly.
         """
 
         # Logging the start of the test
@@ -31,11 +30,7 @@ class TestButtonElements:
 
         # Setting up WebDriver
         self.driver = setup
-        self.driver.implicitly_wait(10)
         self.driver.maximize_window()
-        self.driver.get(self.baseURL)
-
-        self.logger.info(f"Navigated to URL: {self.baseURL}")
 
         # Load test data from JSON file
         try:
@@ -48,17 +43,9 @@ class TestButtonElements:
 
         self.logger.info("Setup method completed successfully.")
 
-        # Initialize Page Object Models for Home and Elements pages
-        home_page = HomePage(self.driver)
-        elements_page = ElementsPage(self.driver)
-
-        # Navigate to 'Elements' section from the home page
-        home_page.click_on_elements_card()
-        self.logger.info("Step 1: Clicked on 'Elements' card.")
-
-        # Navigate to 'Buttons' option on the Elements page
-        elements_page.click_on_buttons()
-        self.logger.info("Step 2: Clicked on 'Buttons' option.")
+        # Jump straight to the 'Buttons' section (single page load)
+        Navigator(self.driver).navigate_to("Buttons")
+        self.logger.info("Navigated directly to 'Buttons' section.")
 
     @pytest.mark.skip(reason="Skipping this test case for now.")
     def test_Double_Click_Button(self):
@@ -89,20 +76,19 @@ class TestButtonElements:
         except AssertionError as e:
             self.logger.error(f"Test Failed: {e}")
             screenshot_path = "./Screenshots/test_Double_Click_Button_failure.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.info(f"Screenshot saved at: {screenshot_path}")
             raise
 
         except Exception as ex:
             self.logger.error(f"An unexpected error occurred: {ex}")
             screenshot_path = "./Screenshots/test_Double_Click_Button_unexpected_error.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.info(f"Screenshot saved at: {screenshot_path}")
             raise
 
         finally:
             self.logger.info("Test case completed.")
-            self.driver.quit()
 
     # @pytest.mark.skip(reason="Skipping this test case for now.")
     def test_Right_Click_Button(self):
@@ -138,7 +124,7 @@ class TestButtonElements:
             # Log assertion error and save screenshot
             self.logger.error(f"Test Failed (Assertion Error): {e}")
             screenshot_path = f"./Screenshots/{test_name}_failure.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.info(f"Screenshot saved at: {screenshot_path}")
             raise
 
@@ -146,13 +132,12 @@ class TestButtonElements:
             # Log unexpected exceptions and save screenshot
             self.logger.error(f"An unexpected error occurred: {ex}")
             screenshot_path = f"./Screenshots/{test_name}_unexpected_error.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.info(f"Screenshot saved at: {screenshot_path}")
             raise
 
         finally:
             self.logger.info(f"{test_name} completed.")
-            self.driver.quit()
 
     @pytest.mark.skip(reason="Skipping this test case for now.")
     def test_Dynamic_Click_Button(self):
@@ -198,7 +183,7 @@ class TestButtonElements:
             # Log assertion error and take a screenshot for debugging
             self.logger.error(f"Test Failed (Assertion Error): {e}")
             screenshot_path = f"./Screenshots/{test_name}_failure.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.info(f"Screenshot saved at: {screenshot_path}")
             raise
 
@@ -206,14 +191,13 @@ class TestButtonElements:
             # Log any unexpected exceptions and take a screenshot
             self.logger.error(f"An unexpected error occurred: {ex}")
             screenshot_path = f"./Screenshots/{test_name}_unexpected_error.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.info(f"Screenshot saved at: {screenshot_path}")
             raise
 
         finally:
             # Final log indicating test completion and cleanup
-            self.logger.info(f"{test_name} completed. Closing the browser.")
-            self.driver.quit()
+            self.logger.info(f"{test_name} completed.")
 
     @pytest.mark.skip(reason="Skipping this test case for now.")
     def test_All_Click_Buttons(self):
@@ -277,20 +261,19 @@ class TestButtonElements:
         except AssertionError as e:
             self.logger.error(f"Test Failed (Assertion Error): {e}")
             screenshot_path = f"./Screenshots/{test_name}_failure.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.info(f"Screenshot saved at: {screenshot_path}")
             raise
 
         except Exception as ex:
             self.logger.error(f"An unexpected error occurred: {ex}")
             screenshot_path = f"./Screenshots/{test_name}_unexpected_error.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.info(f"Screenshot saved at: {screenshot_path}")
             raise
 
         finally:
-            self.logger.info(f"{test_name} completed. Closing the browser.")
-            self.driver.quit()
+            self.logger.info(f"{test_name} completed.")
 
     #  ============================ Parameterized Tests ===========================
     @pytest.mark.parametrize("click_method, get_message_method, expected_key", [
@@ -336,17 +319,16 @@ class TestButtonElements:
         except AssertionError as e:
             self.logger.error(f"Test Failed (Assertion Error): {e}")
             screenshot_path = f"./Screenshots/{test_name}_failure.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.info(f"Screenshot saved at: {screenshot_path}")
             raise
 
         except Exception as ex:
             self.logger.error(f"An unexpected error occurred: {ex}")
             screenshot_path = f"./Screenshots/{test_name}_unexpected_error.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.info(f"Screenshot saved at: {screenshot_path}")
             raise
 
         finally:
-            self.logger.info(f"{test_name} completed. Closing the browser.")
-            self.driver.quit()
\ No newline at end of file
+            self.logger.info(f"{test_name} completed.")
\ No newline at end of file
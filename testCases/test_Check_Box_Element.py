@@ -1,12 +1,12 @@
 import json
-import time
 
 import pytest
 from selenium.common import NoSuchElementException
-from pageObjects.HomePage import HomePage
 from pageObjects.ElementsPage import ElementsPage
+from pageObjects.Navigator import Navigator
 from unititlies.customlogger import LogGen
 from unititlies.readProperties import ReadConfig
+from unititlies.screenshotService import capture_screenshot
 
 
 class TestCheckBoxElement:
@@ -21,10 +21,9 @@ class TestCheckBoxElement:
 
         Responsibilities:
         - Logs the start of the test.
-        - Initializes the WebDriver with implicit wait and maximized window.
-        - Navigates to the application's base URL.
+        - Initializes the WebDriver with a maximized window.
         - Loads test data from a JSON file for use in tests.
-        - Navigates to the 'Elements' section of the application.
+        - Opens the 'Check Box' section directly.
         """
 
         self.logger.info("********** Starting Test: TestElementsPage **********")
@@ -32,15 +31,9 @@ class TestCheckBoxElement:
         # Browser setup
         self.logger.info("Initializing browser setup...")
         self.driver = setup
-        self.driver.implicitly_wait(10)
-        self.logger.info("Set implicit wait to 10 seconds.")
         self.driver.maximize_window()
         self.logger.info("Maximized the browser window.")
 
-        # Navigate to base URL
-        self.driver.get(self.baseURL)
-        self.logger.info(f"Navigated to base URL: {self.baseURL}")
-
         # Load test data from JSON file
         try:
             self.logger.info("Loading test data from JSON file: elements_page.json")
@@ -51,13 +44,9 @@ class TestCheckBoxElement:
             self.logger.error(f"Failed to load test data from elements_page.json: {str(e)}")
             raise
 
-        # Initialize page object for Home Page and click 'Elements' card
-        self.logger.info("Initializing HomePage object.")
-        home_page = HomePage(self.driver)
-
-        self.logger.info("Clicking on 'Elements' card on the Home Page.")
-        home_page.click_on_elements_card()
-        self.logger.info("'Elements' card clicked successfully.")
+        # Jump straight to the 'Check Box' section (single page load)
+        Navigator(self.driver).navigate_to("Check Box")
+        self.logger.info("Navigated directly to 'Check Box' section.")
 
     @pytest.mark.skip(reason="Skipping test for demonstration purposes.")
     def test_home_check_box_displayed(self):
@@ -70,16 +59,11 @@ class TestCheckBoxElement:
         self.logger.info("Initializing ElementsPage objects.")
         elements_page = ElementsPage(self.driver)
 
-        # Step 2: Wait for elements to load (replace with explicit wait in production)
-        self.logger.info("Waiting for page to stabilize before interacting with elements.")
-        time.sleep(2)  # Temporary wait; not recommended for production use
+        # Step 2: Wait for the check box tree of the 'Check Box' section
+        self.logger.info("Waiting for the check box tree to render.")
+        elements_page.wait_for_check_box_tree()
 
-        # Step 3: Navigate to 'Check Box' section in the Elements Page
-        self.logger.info("Clicking on 'Check Box' section in the Elements Page.")
-        elements_page.click_on_check_box()
-        self.logger.info("Successfully navigated to 'Check Box' section.")
-
-        # Step 4: Verify if the 'Home' checkbox is displayed
+        # Step 3: Verify if the 'Home' checkbox is displayed
         self.logger.info("Verifying visibility of 'Home' checkbox on the page.")
         try:
             # Placeholder assertion
@@ -93,7 +77,7 @@ class TestCheckBoxElement:
         except AssertionError as ae:
             # Handle failed assertion
             screenshot_path = "./Screenshots/test_home_check_box_displayed_assertion_fail.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error("Assertion failed while verifying 'Home' checkbox visibility.")
             self.logger.error(f"AssertionError Details: {ae}")
             self.logger.error(f"Screenshot captured: {screenshot_path}")
@@ -102,7 +86,7 @@ class TestCheckBoxElement:
         except NoSuchElementException as nse:
             # Handle scenario where checkbox is not found
             screenshot_path = "./Screenshots/test_home_check_box_displayed_nosuchelement_fail.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error("Element not found: 'Home' checkbox is missing on the page.")
             self.logger.error(f"NoSuchElementException Details: {nse}")
             self.logger.error(f"Screenshot captured: {screenshot_path}")
@@ -111,16 +95,13 @@ class TestCheckBoxElement:
         except Exception as e:
             # Handle any unexpected exception
             screenshot_path = "./Screenshots/test_home_check_box_displayed_unexpected_fail.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error("Unexpected error occurred during test execution.")
             self.logger.error(f"Exception Details: {e}")
             self.logger.error(f"Screenshot captured: {screenshot_path}")
             raise
         finally:
-            # Step 5: Close the browser (teardown)
-            self.logger.info("Closing the browser.")
-            self.driver.quit()
-            self.logger.info("Browser closed successfully.")
+            self.logger.info("========== Test Completed: test_home_check_box_displayed ==========")
 
     @pytest.mark.skip(reason="Skipping test for demonstration purposes.")
     def test_workspace_check_box_displayed_after_expanding(self):
@@ -135,24 +116,18 @@ class TestCheckBoxElement:
             self.logger.info("Step 1: Initializing ElementsPage object.")
             elements_page = ElementsPage(self.driver)
 
-            # Step 2: Wait for the page to stabilize before interaction
-            self.logger.info("Step 2: Waiting for page to stabilize.")
-            time.sleep(2)  # Replace with WebDriverWait in real-world usage
-
-            # Step 3: Navigate to the 'Check Box' section
-            self.logger.info("Step 3: Clicking on 'Check Box' section.")
-            elements_page.click_on_check_box()
-            self.logger.info("Navigated to 'Check Box' section successfully.")
-            time.sleep(2)
+            # Step 2: Wait for the check box tree of the 'Check Box' section
+            self.logger.info("Step 2: Waiting for the check box tree to render.")
+            elements_page.wait_for_check_box_tree()
 
-            # Step 4: Expand the 'Home' node to reveal child elements like 'Workspace'
-            self.logger.info("Step 4: Expanding 'Home' checkbox to reveal 'Workspace'.")
+            # Step 3: Expand the 'Home' node to reveal child elements like 'Workspace'
+            self.logger.info("Step 3: Expanding 'Home' checkbox to reveal 'Workspace'.")
             elements_page.click_plus_button()
+            elements_page.wait_for_tree_expanded()
             self.logger.info("Expanded 'Home' checkbox successfully.")
-            time.sleep(2)
 
-            # Step 5: Check if the 'Workspace' checkbox is visible and clickable
-            self.logger.info("Step 5: Checking visibility of 'Workspace' checkbox.")
+            # Step 4: Check if the 'Workspace' checkbox is visible and clickable
+            self.logger.info("Step 4: Checking visibility of 'Workspace' checkbox.")
 
             try:
                 # Perform the action or visibility check
@@ -162,7 +137,7 @@ class TestCheckBoxElement:
             except NoSuchElementException as nse:
                 # Screenshot and detailed logging for missing element
                 screenshot_path = "./Screenshots/test_workspace_check_box_displayed_nosuchelement_fail.png"
-                self.driver.save_screenshot(screenshot_path)
+                capture_screenshot(self.driver, screenshot_path)
                 self.logger.error("ERROR: 'Workspace' checkbox not found on the page.")
                 self.logger.error(f"Exception Details: {nse}")
                 self.logger.error(f"Screenshot captured: {screenshot_path}")
@@ -171,14 +146,11 @@ class TestCheckBoxElement:
         except Exception as e:
             # Handle any unexpected exception
             screenshot_path = "./Screenshots/test_workspace_check_box_displayed_unexpected_fail.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error("Unexpected error occurred during test execution.")
             self.logger.error(f"Exception Details: {e}")
             self.logger.error(f"Screenshot captured: {screenshot_path}")
             raise
 
         finally:
-            # Step 6: Close the browser (teardown)
-            self.logger.info("Step 6: Closing the browser.")
-            self.driver.quit()
             self.logger.info("========== Test Completed: test_workspace_check_box_displayed_after_expanding ==========")
\ No newline at end of file
@@ -1,11 +1,11 @@
 import json
-import os
-import time
 import pytest
-from pageObjects.HomePage import HomePage
 from pageObjects.ElementsPage import ElementsPage
+from pageObjects.Navigator import Navigator
 from unititlies.customlogger import LogGen
+from unititlies.downloadManager import DownloadManager
 from unititlies.readProperties import ReadConfig
+from unititlies.screenshotService import capture_screenshot
 
 
 class TestFIleUploadAndDownload:
@@ -22,11 +22,9 @@ class TestFIleUploadAndDownload:
         It performs the following setup tasks:
         - Initializes WebDriver
         - Maximizes the window
-        - Applies implicit wait
-        - Opens the application
         - Closes unwanted tabs
         - Loads test data
-        - Navigates to 'Web Tables' via 'Elements'
+        - Each test opens its own section directly
         """
 
         self.logger.info("========== Starting Test: TestTableHandling ==========")
@@ -36,15 +34,10 @@ class TestFIleUploadAndDownload:
         self.logger.info("WebDriver instance initialized.")
 
         # Configure browser
-        self.driver.implicitly_wait(10)
-        self.logger.info("Implicit wait set to 10 seconds.")
 
         self.driver.maximize_window()
         self.logger.info("Browser window maximized.")
 
-        self.driver.get(self.baseURL)
-        self.logger.info(f"Navigated to application URL: {self.baseURL}")
-
         # Handle multiple tabs (e.g., close Bing, stay on the main app)
         windows = self.driver.window_handles
         self.logger.info(f"Window handles retrieved: {windows}")
@@ -66,30 +59,19 @@ class TestFIleUploadAndDownload:
             self.logger.error(f"Failed to load test data: {str(e)}")
             raise
 
-        # Initialize Page Objects
-        home_page = HomePage(self.driver)
-        elements_page = ElementsPage(self.driver)
-
-        # Navigate through UI to reach web Tables Section
-        home_page.click_on_elements_card()
-        self.logger.info("Clicked on 'Elements' card on Home Page.")
-
-        elements_page.click_on_file_upload_and_download()
-        self.logger.info("Clicked on 'Upload and Download' under the Elements section.")
+        self.navigator = Navigator(self.driver)
 
         yield  # Yield control to the test method
 
         # ---------- TEAR DOWN ----------
-        self.logger.info("Closing browser after test execution.")
-        self.driver.quit()
-        self.logger.info("Browser closed successfully.")
+        self.logger.info("Test finished. Browser teardown is handled by the 'setup' fixture.")
 
     @pytest.mark.smoke
     def test_file_upload(self):
         """
         Test case for uploading a file.
         It performs the following steps:
-        - Clicks on 'Upload and Download'
+        - Opens 'Upload and Download'
         - Uploads a file
         - Verifies the upload success message
         """
@@ -97,15 +79,21 @@ class TestFIleUploadAndDownload:
         test_name = "test_file_upload"
         elements_page = ElementsPage(self.driver)
 
-        # Step 1: Navigate to the 'Upload and Download' section of the application
-        elements_page.click_on_file_upload_and_download()
-        self.logger.info("Clicked on 'Upload and Download'.")  # Log the navigation action
+        # Step 1: Open the 'Upload and Download' section directly (single page load)
+        self.navigator.navigate_to("Upload and Download")
+        self.logger.info("Opened 'Upload and Download'.")  # Log the navigation action
 
         # Step 2: Upload the file using the path provided in test data
         file_path = self.data["UploadAndDownload"]["uploadFilePath"]
         elements_page.upload_file(file_path)
         self.logger.info(f"File uploaded: {file_path}")  # Log the file upload action
 
+        # The fixture itself must be the expected file (digest is streamed and cached)
+        expected_digest = self.data["UploadAndDownload"]["uploadFileSha256"]
+        assert elements_page.last_upload_digest == expected_digest, \
+            f"Upload fixture checksum mismatch: expected {expected_digest}, got {elements_page.last_upload_digest}"
+        self.logger.info(f"Upload fixture SHA-256 verified: {expected_digest}")
+
         # Step 3: Retrieve and verify the success message after uploading the file
         try:
             success_message = elements_page.get_upload_success_message()
@@ -114,58 +102,77 @@ class TestFIleUploadAndDownload:
         except AssertionError as e:
             # Capture screenshot on failure
             screenshot_path = f"./Screenshots/{test_name}_assertion_failed.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"Assertion failed. Screenshot saved at: {screenshot_path}")
             self.logger.error(f"Expected: {self.data['UploadAndDownload']['UploadedMessage']}, Got: {success_message}")
             raise
         except Exception as e:
             # Capture screenshot on any other exception
             screenshot_path = f"./Screenshots/{test_name}_exception.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"An error occurred. Screenshot saved at: {screenshot_path}")
             self.logger.error(f"Error details: {str(e)}")
             raise
 
     @pytest.mark.smoke
-    def test_file_download(self):
+    def test_file_download(self, download_dir):
         """
         Test case for downloading a file.
         Steps:
         1. Navigate to 'Upload and Download' section.
-        2. Initiate file download.
-        3. Verify download success by checking the file existence.
+        2. Initiate file download into this test's own download directory.
+        3. Wait for the download to finish and verify the file.
         """
 
         test_name = "test_file_download"
         elements_page = ElementsPage(self.driver)
 
+        # Isolated per-test directory when the browser supports it, else the configured one
+        directory = download_dir or self.data["UploadAndDownload"]["downloadFilePath"]
+        # A shared directory may already hold the file, so the browser could pick another name there
+        expected_name = self.data["UploadAndDownload"]["downloadFileName"] if download_dir else None
+
         try:
-            # Step 1: Navigate to the 'Upload and Download' section of the application
-            elements_page.click_on_file_upload_and_download()
-            self.logger.info("Step 1: Clicked on 'Upload and Download' section.")
-
-            # Step 2: Download the file using the path provided in test data
-            file_path = self.data["UploadAndDownload"]["downloadFilePath"]
-            elements_page.download_file(file_path)
-            self.logger.info(f"Step 2: Initiated file download to path: {file_path}")
-
-            # Wait briefly for the download to complete
-            time.sleep(2)
-
-            # Step 3: Verify the file has been downloaded
-            if os.path.exists(file_path):
-                self.logger.info("Step 3: File download verified successfully.")
-            else:
-                self.logger.error("Step 3: File download failed. File not found.")
-                screenshot_path = f"./Screenshots/{test_name}_assertion_failed.png"
-                self.driver.save_screenshot(screenshot_path)
-                self.logger.info(f"Screenshot saved at: {screenshot_path}")
-                assert False, "Downloaded file does not exist."
+            # Step 1: Open the 'Upload and Download' section directly (single page load)
+            self.navigator.navigate_to("Upload and Download")
+            self.logger.info("Step 1: Opened 'Upload and Download' section.")
+
+            with DownloadManager(directory) as downloads:
+                # Step 2: Download the file
+                elements_page.download_file(directory)
+                self.logger.info(f"Step 2: Initiated file download to directory: {directory}")
+
+                # Step 3: Wait for the finished file (no partial .crdownload, size stable)
+                result = downloads.wait_for_download(expected_name=expected_name, timeout=30, algorithm="sha256")
+                self.logger.info(f"Step 3: Downloaded {result['path']} ({result['size']} bytes) "
+                                 f"in {result['seconds']}s, watched with {downloads.mode}.")
+
+            assert result["size"] > 0, "Downloaded file is empty."
+
+            # Step 4: Verify the content against the expected checksum. The replica serves a known
+            # file; for the live site without a recorded value, the bytes behind the link are the reference.
+            key = "replicaDownloadFileSha256" if ReadConfig.replica_enabled() else "downloadFileSha256"
+            expected_digest = self.data["UploadAndDownload"][key]
+            if not expected_digest:
+                expected_digest = elements_page.get_download_source_digest()
+                self.logger.info(f"Step 4: No '{key}' in test data; download source SHA-256 is {expected_digest} "
+                                 f"(record it in elements_page.json to pin the file).")
+            assert expected_digest, "No expected checksum: not in test data and the download source is unreadable."
+            assert result["sha256"] == expected_digest, \
+                f"Downloaded file checksum mismatch: expected {expected_digest}, got {result['sha256']}"
+            self.logger.info(f"Step 4: Downloaded file SHA-256 verified: {expected_digest}")
+
+        except (AssertionError, TimeoutError) as e:
+            self.logger.error(f"Step 3: File download failed: {e}")
+            screenshot_path = f"./Screenshots/{test_name}_assertion_failed.png"
+            capture_screenshot(self.driver, screenshot_path)
+            self.logger.info(f"Screenshot saved at: {screenshot_path}")
+            raise AssertionError(f"File download failed: {e}")
 
         except Exception as e:
             self.logger.exception(f"Exception occurred in {test_name}: {e}")
             screenshot_path = f"./Screenshots/{test_name}_exception.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.info(f"Screenshot saved at: {screenshot_path}")
             raise
 
@@ -182,10 +189,10 @@ class TestFIleUploadAndDownload:
         elements_page = ElementsPage(self.driver)
 
         try:
-            # Step 1: Navigate to 'Dynamic Properties'
-            self.logger.info("Step 1: Navigating to 'Dynamic Properties' section.")
-            elements_page.Click_on_dynamic_properties()
-            self.logger.info("Clicked on 'Dynamic Properties' successfully.")
+            # Step 1: Open 'Dynamic Properties' directly (single page load)
+            self.logger.info("Step 1: Opening 'Dynamic Properties' section.")
+            self.navigator.navigate_to("Dynamic Properties")
+            self.logger.info("Opened 'Dynamic Properties' successfully.")
 
             # Step 2: Wait for the button and check its visibility
             self.logger.info("Step 2: Waiting for the button to appear (after 5 seconds).")
@@ -200,7 +207,7 @@ class TestFIleUploadAndDownload:
         except AssertionError as e:
             # Capture screenshot on assertion failure
             screenshot_path = f"./Screenshots/{test_name}_assertion_failed.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"Assertion failed: {str(e)}")
             self.logger.error(f"Screenshot saved at: {screenshot_path}")
             raise
@@ -1,14 +1,13 @@
 import json
-import time
 
 # import time
 
 import pytest
-from pageObjects.HomePage import HomePage
-from pageObjects.ElementsPage import ElementsPage
+from pageObjects.Navigator import Navigator
 from pageObjects.WebTable import WebTable
 from unititlies.customlogger import LogGen
 from unititlies.readProperties import ReadConfig
+from unititlies.screenshotService import capture_screenshot
 
 
 class TestTableHandling:
@@ -25,11 +24,9 @@ class TestTableHandling:
         It performs the following setup tasks:
         - Initializes WebDriver
         - Maximizes the window
-        - Applies implicit wait
-        - Opens the application
         - Closes unwanted tabs
         - Loads test data
-        - Navigates to 'Web Tables' via 'Elements'
+        - Opens the 'Web Tables' section directly
         """
 
         self.logger.info("========== Starting Test: TestTableHandling ==========")
@@ -39,15 +36,10 @@ class TestTableHandling:
         self.logger.info("WebDriver instance initialized.")
 
         # Configure browser
-        self.driver.implicitly_wait(10)
-        self.logger.info("Implicit wait set to 10 seconds.")
 
         self.driver.maximize_window()
         self.logger.info("Browser window maximized.")
 
-        self.driver.get(self.baseURL)
-        self.logger.info(f"Navigated to application URL: {self.baseURL}")
-
         # Handle multiple tabs (e.g., close Bing, stay on the main app)
         windows = self.driver.window_handles
         self.logger.info(f"Window handles retrieved: {windows}")
@@ -69,22 +61,14 @@ class TestTableHandling:
             self.logger.error(f"Failed to load test data: {str(e)}")
             raise
 
-        # Initialize Page Objects
-        home_page = HomePage(self.driver)
-        elements_page = ElementsPage(self.driver)
-
-        # Navigate through UI to reach Web Tables section
-        home_page.click_on_elements_card()
-        self.logger.info("Clicked on 'Elements' card on Home Page.")
-
-        elements_page.click_on_web_table()
-        self.logger.info("Clicked on 'Web Tables' under the Elements section.")
+        # Jump straight to the section under test (single page load)
+        Navigator(self.driver).navigate_to("Web Tables")
+        self.logger.info("Navigated directly to 'Web Tables' section.")
 
         yield  # Yield control to the test method
 
         # ---------- TEAR DOWN ----------
-        self.logger.info("Closing browser after test execution.")
-        self.driver.quit()
+        self.logger.info("Test finished. Browser teardown is handled by the 'setup' fixture.")
 
     @pytest.mark.smoke
     def test_find_user_and_delete(self):
@@ -121,13 +105,13 @@ class TestTableHandling:
 
         except AssertionError as ae:
             screenshot_path = "./Screenshots/test_find_user_and_delete_fail.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"AssertionError: {ae}")
             raise
 
         except Exception as e:
             screenshot_path = "./Screenshots/test_find_user_and_delete_fail.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"Exception occurred: {e}")
             raise
 
@@ -183,13 +167,13 @@ class TestTableHandling:
 
         except AssertionError as ae:
             screenshot_path = f"./Screenshots/{test_name}_assertion_failed.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"Assertion failed: {ae}")
             raise
 
         except Exception as e:
             screenshot_path = f"./Screenshots/{test_name}_unexpected_error.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"Unexpected error: {e}")
             raise
 
@@ -248,16 +232,16 @@ class TestTableHandling:
 
             # Step 8: Search for the updated user
             self.logger.info(f"Step 8: Searching again for user with updated email: {updated_email}")
-            web_table.search(updated_email)
-            time.sleep(2)
+            web_table.search(updated_email)  # waits for the table to re-render
 
             # Step 9: Validate updated user details
             self.logger.info("Step 9: Validating updated user details in the table")
-            row_index = web_table.find_row_by_email(updated_email)
+            table = web_table.snapshot()  # whole table in one round-trip
+            row_index = table.find_row("Email", updated_email)
             assert row_index != -1, f"Updated user with email '{updated_email}' not found"
 
-            row_data = web_table.get_row_data_by_index(row_index)
-            self.logger.info(f"Extracted row data: {row_data}")
+            actual_data = table.row_as_dict(row_index)
+            self.logger.info(f"Extracted row data: {actual_data}")
 
             expected_data = {
                 "First Name": updated_first_name,
@@ -268,30 +252,21 @@ class TestTableHandling:
                 "Department": updated_department
             }
 
-            actual_data = {
-                "First Name": row_data[0],
-                "Last Name": row_data[1],
-                "Age": row_data[2],
-                "Email": row_data[3],
-                "Salary": row_data[4],
-                "Department": row_data[5],
-            }
-
             for key in expected_data:
-                assert expected_data[key] == actual_data[key], f"{key} did not update correctly"
+                assert expected_data[key] == actual_data.get(key), f"{key} did not update correctly"
 
             self.logger.info("Test passed: User details updated and verified successfully")
 
         except AssertionError as ae:
             screenshot_path = f"./Screenshots/{test_name}_assertion_failed.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"Assertion failed: {ae}")
             self.logger.error(f"Screenshot captured: {screenshot_path}")
             raise
 
         except Exception as e:
             screenshot_path = f"./Screenshots/{test_name}_unexpected_error.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"Unexpected error occurred: {e}")
             self.logger.error(f"Screenshot captured: {screenshot_path}")
             raise
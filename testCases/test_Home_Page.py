@@ -4,6 +4,7 @@ from selenium.common import NoSuchElementException
 from pageObjects.HomePage import HomePage
 from unititlies.customlogger import LogGen
 from unititlies.readProperties import ReadConfig
+from unititlies.screenshotService import capture_screenshot
 from datetime import datetime
 
 
@@ -16,16 +17,15 @@ class TestHomePage:
     def setup_method(self, setup):
         """
         This setup method runs automatically before each test method.
-        It initializes the WebDriver, sets implicit wait, maximizes the window,
+        It initializes the WebDriver, maximizes the window,
         and navigates to the base URL. It also loads test data from JSON.
         """
         self.logger.info("********** Starting Test: TestHomePage **********")
         self.logger.info("Initializing browser setup...")
 
         self.driver = setup
-        self.driver.implicitly_wait(10)
         self.driver.maximize_window()
-        self.driver.get(self.baseURL)
+        HomePage(self.driver).open(self.baseURL)
 
         self.logger.info(f"Navigated to URL: {self.baseURL}")
 
@@ -47,7 +47,7 @@ class TestHomePage:
         """
 
         # Retrieve expected values from test data
-        expected_url = self.data["url"]
+        expected_url = ReadConfig.localize_url(self.data["url"])
         expected_title = self.data["pageTitle"]
 
         # Capture actual values from the current page
@@ -72,7 +72,7 @@ class TestHomePage:
         except AssertionError as ae:
             # If the URL validation fails, take a screenshot and log the error
             screenshot_path = f"{screenshot_dir}/test_homepage_title_url_fail_{timestamp}.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"URL validation FAILED: {ae}")
             self.logger.info(f"Screenshot saved to {screenshot_path}")
             raise  # Re-raise the exception to mark the test as failed
@@ -85,14 +85,11 @@ class TestHomePage:
         except AssertionError as ae:
             # If the title validation fails, take a screenshot and log the error
             screenshot_path = f"{screenshot_dir}/test_homepage_title_title_fail_{timestamp}.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"Title validation FAILED: {ae}")
             self.logger.info(f"Screenshot saved to {screenshot_path}")
             raise  # Re-raise the exception to mark the test as failed
         finally:
-            # Close the browser after the test
-            self.driver.quit()
-            self.logger.info("Browser closed.")
             self.logger.info("********** Test Completed: TestHomePage **********")
 
     @pytest.mark.ui
@@ -110,15 +107,12 @@ class TestHomePage:
         # Take a screenshot if the logo is not displayed
         if not logo_displayed:
             screenshot_path = f"./Screenshots/test_homepage_logo_fail.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error("Logo validation FAILED.")
             self.logger.info(f"Screenshot saved to {screenshot_path}")
         else:
             self.logger.info("Logo validation PASSED.")
 
-        # Close the browser after the test
-        self.driver.quit()
-        self.logger.info("Browser closed.")
         self.logger.info("********** Test Completed: TestHomePage **********")
 
     @pytest.mark.functional
@@ -186,7 +180,7 @@ class TestHomePage:
         except AssertionError as ae:
             # Handle assertion failures with screenshot and detailed log
             screenshot_path = "./Screenshots/test_homepage_join_now_assertion_fail.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"ASSERTION ERROR: {ae}")
             self.logger.info(f"Screenshot saved at: {screenshot_path}")
             raise
@@ -194,7 +188,7 @@ class TestHomePage:
         except NoSuchElementException as ne:
             # Handle element not found error with screenshot and detailed log
             screenshot_path = "./Screenshots/test_homepage_join_now_not_found.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"ELEMENT NOT FOUND: {ne}")
             self.logger.info(f"Screenshot saved at: {screenshot_path}")
             raise
@@ -207,8 +201,6 @@ class TestHomePage:
         finally:
             # Final log entries for test completion and cleanup
             self.logger.info("TEST COMPLETED: 'Join Now' button test.")
-            self.driver.quit()
-            self.logger.info("Browser session closed.")
             self.logger.info("********** Test Completed: TestHomePage **********")
 
     @pytest.mark.ui
@@ -242,7 +234,7 @@ class TestHomePage:
         except AssertionError as ae:
             # Capture screenshot on assertion failure
             screenshot_path = "./Screenshots/test_homepage_link_count_assertion_fail.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f" ASSERTION ERROR: {ae}")
             self.logger.info(f"Screenshot captured at: {screenshot_path}")
             raise
@@ -253,9 +245,6 @@ class TestHomePage:
             raise
 
         finally:
-            # Clean up actions and logging
-            self.logger.info("Closing the browser session.")
-            self.driver.quit()
             self.logger.info("========== TEST COMPLETED: Validate number of links on the Home Page ==========")
 
     @pytest.mark.ui
@@ -289,7 +278,7 @@ class TestHomePage:
         except AssertionError as ae:
             # Capture screenshot on assertion failure
             screenshot_path = "./Screenshots/test_homepage_cards_count_assertion_fail.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f" ASSERTION ERROR: {ae}")
             self.logger.info(f"Screenshot captured at: {screenshot_path}")
             raise
@@ -300,7 +289,4 @@ class TestHomePage:
             raise
 
         finally:
-            # Clean up actions and logging
-            self.logger.info("Closing the browser session.")
-            self.driver.quit()
             self.logger.info("========== TEST COMPLETED: Validate number of cards on the Home Page ==========")
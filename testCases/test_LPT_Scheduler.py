@@ -0,0 +1,73 @@
+import json
+
+import pytest
+from unititlies.lptScheduler import DEFAULT_TEST_SECONDS, DurationScheduler
+
+
+@pytest.mark.unit
+class TestLPTScheduler:
+    """
+    Unit tests for the duration-aware xdist scheduling (no browser needed).
+    """
+
+    @pytest.fixture()
+    def scheduler(self, tmp_path):
+        durations = {
+            "test_a.py::TestSlow::test_one": 30.0,
+            "test_a.py::TestSlow::test_two": 30.0,
+            "test_b.py::TestFast::test_one": 2.0,
+            "test_b.py::TestFast::test_two": 3.0,
+            "test_c.py::test_function": 5.0,
+        }
+        path = tmp_path / "durations.json"
+        path.write_text(json.dumps(durations))
+        return DurationScheduler(str(path))
+
+    def test_lpt_makespan_longest_first(self):
+        # LPT puts 5 and 4 on separate workers, then the 3s on whichever is least loaded
+        assert DurationScheduler.lpt_makespan([3, 3, 5, 3, 4], 2) == 10
+
+    def test_lpt_makespan_one_worker_is_the_sum(self):
+        assert DurationScheduler.lpt_makespan([1, 2, 3], 1) == 6
+        assert DurationScheduler.lpt_makespan([1, 2, 3], 0) == 6
+
+    def test_lpt_makespan_more_workers_than_units(self):
+        assert DurationScheduler.lpt_makespan([7, 2], 4) == 7
+        assert DurationScheduler.lpt_makespan([], 3) == 0
+
+    def test_predict_uses_history_then_median(self, scheduler):
+        assert scheduler.predict("test_b.py::TestFast::test_two") == 3.0
+        assert scheduler.predict("test_new.py::test_unknown") == 5.0  # median of the history
+
+    def test_predict_without_history(self, tmp_path):
+        scheduler = DurationScheduler(str(tmp_path / "missing.json"))
+        assert scheduler.predict("test_new.py::test_unknown") == DEFAULT_TEST_SECONDS
+
+    def test_plan_units_keeps_short_classes_together(self, scheduler):
+        units = scheduler.plan_units(list(scheduler.durations), workers=1)
+        assert units["test_a.py::TestSlow::test_one"] == "test_a.py::TestSlow"
+        assert units["test_b.py::TestFast::test_one"] == "test_b.py::TestFast"
+        assert units["test_b.py::TestFast::test_two"] == "test_b.py::TestFast"
+        assert units["test_c.py::test_function"] == "test_c.py"
+
+    def test_plan_units_splits_a_class_longer_than_a_share(self, scheduler):
+        # 70s over 2 workers is a 35s share; TestSlow alone takes 60s
+        units = scheduler.plan_units(list(scheduler.durations), workers=2)
+        assert units["test_a.py::TestSlow::test_one"] == "test_a.py::TestSlow::test_one"
+        assert units["test_a.py::TestSlow::test_two"] == "test_a.py::TestSlow::test_two"
+        assert units["test_b.py::TestFast::test_one"] == "test_b.py::TestFast"
+
+    def test_plan_units_never_splits_a_single_test(self, scheduler):
+        units = scheduler.plan_units(["test_a.py::TestSlow::test_one", "test_b.py::TestFast::test_one"], workers=4)
+        assert units["test_a.py::TestSlow::test_one"] == "test_a.py::TestSlow"
+
+    @pytest.mark.parametrize("dist", ["each", "loadfile", "loadgroup", "worksteal"])
+    def test_other_dist_modes_keep_the_xdist_scheduler(self, scheduler, dist):
+        pytest.importorskip("xdist")
+        warnings = []
+        config = type("Config", (), {
+            "getvalue": lambda self, name: dist,
+            "issue_config_time_warning": lambda self, warning, stacklevel: warnings.append(warning),
+        })()
+        assert scheduler.pytest_xdist_make_scheduler(config, log=None) is None
+        assert len(warnings) == 1 and dist in str(warnings[0])
@@ -0,0 +1,97 @@
+import json
+import pytest
+from pageObjects.ElementsPage import ElementsPage
+from pageObjects.Navigator import Navigator
+from unititlies.customlogger import LogGen
+from unititlies.linkChecker import LinkChecker, status_message
+from unititlies.screenshotService import capture_screenshot
+
+
+class TestLinkAudit:
+    """
+    Checks every API link on the 'Links' page in one pass: the endpoints are
+    collected with a single script call and requested concurrently, instead of
+    clicking each link and reading the response text from the UI.
+    Run with --link-stub to audit a local stub server (offline CI).
+    """
+
+    # Set up logger for the test class
+    logger = LogGen.loggen()
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self, setup, links_base_url):
+        """
+        Loads test data and opens the 'Links' section of the site under audit.
+        """
+        self.logger.info("========== Starting Test: TestLinkAudit ==========")
+
+        self.driver = setup
+
+        # Load test data from JSON file
+        try:
+            with open("./TestData/elements_page.json", "r") as file:
+                self.data = json.load(file)
+            self.logger.info("Test data successfully loaded from 'elements_page.json'.")
+        except Exception as e:
+            self.logger.error(f"Failed to load test data: {str(e)}")
+            raise
+
+        # Jump straight to the section under test (single page load)
+        Navigator(self.driver, links_base_url).navigate_to("Links")
+        self.logger.info(f"Navigated directly to 'Links' section of {links_base_url}")
+
+        yield  # Yield control to the test method
+
+        # ---------- TEAR DOWN ----------
+        self.logger.info("Test finished. Browser teardown is handled by the 'setup' fixture.")
+
+    @pytest.mark.smoke
+    def test_api_link_statuses(self):
+        test_name = "test_api_link_statuses"
+        self.logger.info(f"========== Starting Test: {test_name} ==========")
+
+        checker = LinkChecker.from_driver(self.driver)
+        try:
+            # Step 1: Collect every API link endpoint in one script call
+            element_page = ElementsPage(self.driver)
+            endpoints = element_page.get_api_link_endpoints()
+            self.logger.info(f"Step 1: Collected API link endpoints: {endpoints}")
+
+            missing = sorted(set(ElementsPage.API_LINK_STATUS_KEYS) - set(endpoints))
+            assert not missing, f"API links not found on the page: {missing}"
+
+            # Step 2: Request all endpoints concurrently with the browser's cookies
+            results = checker.check(endpoints.values())
+            self.logger.info(f"Step 2: Checked {len(results)} endpoints "
+                             f"({checker.pool.opened} connections opened, {checker.pool.reused} reused)")
+
+            # Step 3: Compare every response with the expected message from test data
+            mismatches = []
+            for link_id, status_key in ElementsPage.API_LINK_STATUS_KEYS.items():
+                result = results[endpoints[link_id]]
+                actual = status_message(result["status"], result["reason"]) if result["error"] is None \
+                    else f"Request failed: {result['error']}"
+                expected = self.data["linksTest"][status_key]
+                self.logger.info(f"Step 3: '{link_id}' -> {actual} ({result['seconds']}s)")
+                if actual != expected:
+                    mismatches.append(f"{link_id}: expected '{expected}', got '{actual}'")
+
+            assert not mismatches, "Link status mismatches:\n" + "\n".join(mismatches)
+            self.logger.info(f"Test {test_name} passed successfully.")
+
+        except AssertionError as ae:
+            # Log assertion errors and take screenshot
+            screenshot_path = f"./Screenshots/{test_name}_assertion_failed.png"
+            capture_screenshot(self.driver, screenshot_path)
+            self.logger.error(f"Assertion failed in {test_name}: {ae}")
+            self.logger.error(f"Screenshot captured at: {screenshot_path}")
+            raise
+
+        except Exception as e:
+            # Log unexpected exceptions
+            self.logger.error(f"Unexpected error occurred in {test_name}: {e}")
+            raise
+
+        finally:
+            checker.close()
+            self.logger.info(f"========== Ending Test: {test_name} ==========\n")
@@ -1,10 +1,10 @@
 import json
-import time
 import pytest
-from pageObjects.HomePage import HomePage
 from pageObjects.ElementsPage import ElementsPage
+from pageObjects.Navigator import Navigator
 from unititlies.customlogger import LogGen
 from unititlies.readProperties import ReadConfig
+from unititlies.screenshotService import capture_screenshot
 
 
 class TestLinks:
@@ -21,11 +21,9 @@ class TestLinks:
         It performs the following setup tasks:
         - Initializes WebDriver
         - Maximizes the window
-        - Applies implicit wait
-        - Opens the application
         - Closes unwanted tabs
         - Loads test data
-        - Navigates to 'Web Tables' via 'Elements'
+        - Each test opens its own section ('Links' or 'Broken Links - Images') directly
         """
 
         self.logger.info("========== Starting Test: TestTableHandling ==========")
@@ -35,15 +33,10 @@ class TestLinks:
         self.logger.info("WebDriver instance initialized.")
 
         # Configure browser
-        self.driver.implicitly_wait(10)
-        self.logger.info("Implicit wait set to 10 seconds.")
 
         self.driver.maximize_window()
         self.logger.info("Browser window maximized.")
 
-        self.driver.get(self.baseURL)
-        self.logger.info(f"Navigated to application URL: {self.baseURL}")
-
         # Handle multiple tabs (e.g., close Bing, stay on the main app)
         windows = self.driver.window_handles
         self.logger.info(f"Window handles retrieved: {windows}")
@@ -65,22 +58,12 @@ class TestLinks:
             self.logger.error(f"Failed to load test data: {str(e)}")
             raise
 
-        # Initialize Page Objects
-        home_page = HomePage(self.driver)
-        elements_page = ElementsPage(self.driver)
-
-        # Navigate through UI to reach web Tables Section
-        home_page.click_on_elements_card()
-        self.logger.info("Clicked on 'Elements' card on Home Page.")
-
-        elements_page.click_on_web_table()
-        self.logger.info("Clicked on 'Web Tables' under the Elements section.")
+        self.navigator = Navigator(self.driver)
 
         yield  # Yield control to the test method
 
         # ---------- TEAR DOWN ----------
-        self.logger.info("Closing browser after test execution.")
-        self.driver.quit()
+        self.logger.info("Test finished. Browser teardown is handled by the 'setup' fixture.")
 
     @pytest.mark.smoke
     def test_Count_Of_Links(self):
@@ -91,10 +74,9 @@ class TestLinks:
             # Instantiate ElementsPage object
             element_page = ElementsPage(self.driver)
 
-            # Navigate to the 'Links' section
-            self.logger.info("Clicking on the 'Links' section")
-            element_page.click_on_links()
-            time.sleep(2)  # Wait for the page to load (replace with explicit wait in real-world tests)
+            # Open the 'Links' section directly (single page load)
+            self.logger.info("Opening the 'Links' section")
+            self.navigator.navigate_to("Links")
 
             # Count all <a> tags on the current page
             self.logger.info("Counting all <a> tags on the current page")
@@ -110,7 +92,7 @@ class TestLinks:
         except AssertionError as ae:
             # Capture screenshot on assertion failure
             screenshot_path = f"./Screenshots/{test_name}_assertion_failed.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"Assertion failed in {test_name}: {ae}")
             self.logger.error(f"Screenshot saved at: {screenshot_path}")
             raise
@@ -132,20 +114,20 @@ class TestLinks:
             # Instantiate ElementsPage object
             element_page = ElementsPage(self.driver)
 
-            # Navigate to the 'Links' section
-            self.logger.info("Clicking on the 'Links' section")
-            element_page.click_on_links()
-            time.sleep(2)  # Wait for the page to load (replace with explicit wait in real-world tests)
+            # Open the 'Links' section directly (single page load)
+            self.logger.info("Opening the 'Links' section")
+            self.navigator.navigate_to("Links")
 
             # Click on the simple link
             self.logger.info("Clicking on the simple link")
+            known_windows = self.driver.window_handles
             element_page.click_on_simple_link()
-            # Switch to the new window/tab
-            windows = self.driver.window_handles
-            if len(windows) > 1:
-                self.driver.switch_to.window(windows[1])
+            # Switch to the new window/tab as soon as it opens
+            new_window = element_page.wait_for_new_window(known_windows)
+            if new_window:
+                self.driver.switch_to.window(new_window)
             current_url = self.driver.current_url
-            expected_url = self.data["linksTest"]["simpleLinkURL"]
+            expected_url = ReadConfig.localize_url(self.data["linksTest"]["simpleLinkURL"])
             assert current_url == expected_url, f"Expected URL {expected_url}, but found {current_url}"
 
             self.logger.info(f"Test {test_name} passed successfully.")
@@ -153,7 +135,7 @@ class TestLinks:
         except AssertionError as ae:
             # Capture screenshot on assertion failure
             screenshot_path = f"./Screenshots/{test_name}_assertion_failed.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"Assertion failed in {test_name}: {ae}")
             self.logger.error(f"Screenshot saved at: {screenshot_path}")
             raise
@@ -175,20 +157,20 @@ class TestLinks:
             # Instantiate ElementsPage object
             element_page = ElementsPage(self.driver)
 
-            # Navigate to the 'Links' section
-            self.logger.info("Clicking on the 'Links' section")
-            element_page.click_on_links()
-            time.sleep(2)  # Wait for the page to load (replace with explicit wait in real-world tests)
+            # Open the 'Links' section directly (single page load)
+            self.logger.info("Opening the 'Links' section")
+            self.navigator.navigate_to("Links")
 
             # Click on the dynamic link
             self.logger.info("Clicking on the dynamic link")
+            known_windows = self.driver.window_handles
             element_page.click_on_dynamic_link()
-            # Switch to the new window/tab
-            windows = self.driver.window_handles
-            if len(windows) > 1:
-                self.driver.switch_to.window(windows[1])
+            # Switch to the new window/tab as soon as it opens
+            new_window = element_page.wait_for_new_window(known_windows)
+            if new_window:
+                self.driver.switch_to.window(new_window)
             current_url = self.driver.current_url
-            expected_url = self.data["linksTest"]["dynamicLinkURL"]
+            expected_url = ReadConfig.localize_url(self.data["linksTest"]["dynamicLinkURL"])
             assert current_url == expected_url, f"Expected URL {expected_url}, but found {current_url}"
 
             self.logger.info(f"Test {test_name} passed successfully.")
@@ -196,7 +178,7 @@ class TestLinks:
         except AssertionError as ae:
             # Capture screenshot on assertion failure
             screenshot_path = f"./Screenshots/{test_name}_assertion_failed.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"Assertion failed in {test_name}: {ae}")
             self.logger.error(f"Screenshot saved at: {screenshot_path}")
             raise
@@ -231,9 +213,9 @@ class TestLinks:
             self.logger.debug("Instantiating ElementsPage object.")
             element_page = ElementsPage(self.driver)
 
-            # Step 1: Navigate to the Links section
-            self.logger.info("Navigating to the 'Links' section.")
-            element_page.click_on_links()
+            # Step 1: Open the Links section directly (single page load)
+            self.logger.info("Opening the 'Links' section.")
+            self.navigator.navigate_to("Links")
             self.logger.debug("Navigation to 'Links' section successful.")
 
             # Step 2: Perform the action based on the link_action parameter
@@ -274,7 +256,7 @@ class TestLinks:
         except AssertionError as ae:
             # Log assertion errors and take screenshot
             screenshot_path = f"./Screenshots/{test_name}_assertion_failed.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f" Assertion failed in {test_name}: {ae}")
             self.logger.error(f"Screenshot captured at: {screenshot_path}")
             raise
@@ -298,12 +280,9 @@ class TestLinks:
             element_page = ElementsPage(self.driver)
             self.logger.info("ElementsPage initialized successfully.")
 
-            # Navigate to the 'Broken Links - Images' section
-            self.logger.info("Navigating to the 'Broken Links - Images' section.")
-            element_page.click_on_broken_links_images()
-
-            # Wait for the page to load (should be replaced with explicit waits in real-world scenarios)
-            time.sleep(2)
+            # Open the 'Broken Links - Images' section directly; the page is ready once its images have loaded
+            self.logger.info("Opening the 'Broken Links - Images' section.")
+            self.navigator.navigate_to("Broken Links - Images")
 
             # Check if the image is displayed
             self.logger.info("Checking if the image is displayed.")
@@ -316,7 +295,7 @@ class TestLinks:
         except AssertionError as ae:
             # Log assertion error and take screenshot
             screenshot_path = f"./Screenshots/{test_name}_assertion_failed.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"[ASSERTION FAILED] {test_name}: {ae}")
             self.logger.error(f"Screenshot saved at: {screenshot_path}")
             raise
@@ -340,9 +319,9 @@ class TestLinks:
             element_page = ElementsPage(self.driver)
             self.logger.info("ElementsPage initialized successfully.")
 
-            # Navigate to the 'Broken Links - Images' section
-            self.logger.info("Navigating to the 'Broken Links - Images' section.")
-            element_page.click_on_broken_links_images()
+            # Open the 'Broken Links - Images' section directly (single page load)
+            self.logger.info("Opening the 'Broken Links - Images' section.")
+            self.navigator.navigate_to("Broken Links - Images")
 
             # Check if the image is NOT broken (i.e., loaded correctly)
             self.logger.info("Checking if the image is correctly loaded.")
@@ -354,7 +333,49 @@ class TestLinks:
 
         except AssertionError as ae:
             screenshot_path = f"./Screenshots/{test_name}_assertion_failed.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
+            self.logger.error(f"[ASSERTION FAILED] {test_name}: {ae}")
+            self.logger.error(f"Screenshot saved at: {screenshot_path}")
+            raise
+
+        except Exception as e:
+            self.logger.error(f"[EXCEPTION] An unexpected error occurred in {test_name}: {e}")
+            raise
+
+        finally:
+            self.logger.info(f"[END] {test_name}: Test completed.")
+
+    @pytest.mark.smoke
+    def test_Image_Audit(self):
+        test_name = "test_Image_Audit"
+        self.logger.info(f"[START] {test_name}: Auditing every image on the 'Broken Links - Images' page.")
+
+        try:
+            # Instantiate ElementsPage object
+            element_page = ElementsPage(self.driver)
+
+            # Open the 'Broken Links - Images' section directly; the page is ready once its images have loaded
+            self.logger.info("Opening the 'Broken Links - Images' section.")
+            self.navigator.navigate_to("Broken Links - Images")
+
+            # Audit all images in one script call, cross-checking their URLs over HTTP
+            report = element_page.audit_images(check_urls=True)
+            self.logger.info(f"Images: {report['total']}, loaded: {report['loaded']}, broken: {report['broken']}")
+            for image in report["images"]:
+                self.logger.info(f"{image['src']}: broken={image['broken']}, naturalWidth={image['naturalWidth']}, "
+                                 f"HTTP {image.get('http_status')}")
+
+            expected = self.data["imagesTest"]
+            broken_paths = report["broken"]
+            assert not any(src.endswith(expected["validImage"]) for src in broken_paths), \
+                f"Valid image {expected['validImage']} is reported broken."
+            assert any(src.endswith(expected["brokenImage"]) for src in broken_paths), \
+                f"Broken image {expected['brokenImage']} was not detected."
+            self.logger.info("Image audit matches the expected valid and broken images.")
+
+        except AssertionError as ae:
+            screenshot_path = f"./Screenshots/{test_name}_assertion_failed.png"
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"[ASSERTION FAILED] {test_name}: {ae}")
             self.logger.error(f"Screenshot saved at: {screenshot_path}")
             raise
@@ -378,9 +399,9 @@ class TestLinks:
             element_page = ElementsPage(self.driver)
             self.logger.info("ElementsPage initialized successfully.")
 
-            # Step 2: Navigate to the 'Broken Links - Images' section
-            self.logger.info("Navigating to the 'Broken Links - Images' section.")
-            element_page.click_on_broken_links_images()
+            # Step 2: Open the 'Broken Links - Images' section directly (single page load)
+            self.logger.info("Opening the 'Broken Links - Images' section.")
+            self.navigator.navigate_to("Broken Links - Images")
 
             # Step 3: Click on a valid image link to verify its behavior
             self.logger.info("Clicking on a valid image link to verify it redirects to a valid URL.")
@@ -388,7 +409,7 @@ class TestLinks:
 
             # Step 4: Capture the current URL and compare with expected
             actual_url = self.driver.current_url
-            expected_url = self.data["linksTest"]["ValidURL"]
+            expected_url = ReadConfig.localize_url(self.data["linksTest"]["ValidURL"])
             self.logger.info(f"Expected URL: {expected_url}")
             self.logger.info(f"Actual URL after clicking image: {actual_url}")
 
@@ -399,7 +420,7 @@ class TestLinks:
         except AssertionError as ae:
             # Handle assertion failure with screenshot
             screenshot_path = f"./Screenshots/{test_name}_assertion_failed.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"[ASSERTION FAILED] {test_name}: {ae}")
             self.logger.error(f"Screenshot saved at: {screenshot_path}")
             raise
@@ -425,9 +446,9 @@ class TestLinks:
             element_page = ElementsPage(self.driver)
             self.logger.info("ElementsPage object created successfully.")
 
-            # Step 2: Navigate to the 'Broken Links - Images' section
-            self.logger.info("Step 2: Navigating to the 'Broken Links - Images' section of the application.")
-            element_page.click_on_broken_links_images()
+            # Step 2: Open the 'Broken Links - Images' section directly (single page load)
+            self.logger.info("Step 2: Opening the 'Broken Links - Images' section of the application.")
+            self.navigator.navigate_to("Broken Links - Images")
             self.logger.info("Successfully navigated to the 'Broken Links - Images' page.")
 
             # Step 3: Click on a valid image link
@@ -437,7 +458,7 @@ class TestLinks:
 
             # Step 4: Get the current URL after the click
             actual_url = self.driver.current_url
-            expected_url = self.data["linksTest"]["BrokenLink"]
+            expected_url = ReadConfig.localize_url(self.data["linksTest"]["BrokenLink"])
             self.logger.info(f"Step 4: Captured actual URL after redirection: {actual_url}")
             self.logger.info(f"Expected URL: {expected_url}")
 
@@ -449,7 +470,7 @@ class TestLinks:
         except AssertionError as ae:
             # Capture screenshot on assertion failure
             screenshot_path = f"./Screenshots/{test_name}_assertion_failed.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.error(f"[ASSERTION FAILED] {test_name}: {ae}")
             self.logger.error(f"Screenshot saved at: {screenshot_path}")
             raise
@@ -4,8 +4,10 @@ import pytest
 
 from pageObjects.RegistrationForm import RegistrationPage
 from pageObjects.HomePage import HomePage
+from pageObjects.Navigator import Navigator
 from unititlies.customlogger import LogGen
 from unititlies.readProperties import ReadConfig
+from unititlies.screenshotService import capture_screenshot
 
 
 class TestRegistrationPage:
@@ -28,15 +30,10 @@ class TestRegistrationPage:
         self.logger.info("WebDriver instance initialized.")
 
         # Configure browser
-        self.driver.implicitly_wait(10)
-        self.logger.info("Implicit wait set to 10 seconds.")
 
         self.driver.maximize_window()
         self.logger.info("Browser window maximized.")
 
-        self.driver.get(self.baseURL)
-        self.logger.info(f"Navigated to application URL: {self.baseURL}")
-
         # Handle multiple tabs (e.g., close Bing, stay on the main app)
         windows = self.driver.window_handles
         self.logger.info(f"Window handles retrieved: {windows}")
@@ -57,7 +54,7 @@ class TestRegistrationPage:
         except Exception as e:
             self.logger.error(f"Failed to load test data: {str(e)}")
             screenshot_path = "./Screenshots/test_data_load_exception.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.info(f"Screenshot saved at: {screenshot_path}")
             raise
 
@@ -65,19 +62,14 @@ class TestRegistrationPage:
         self.home_page = HomePage(self.driver)
         self.registration_form = RegistrationPage(self.driver)
 
-        # Navigate to the Registration Form
-        self.home_page.click_on_forms_card()
-        self.logger.info("Clicked on 'Forms' card on Home Page.")
-
-        self.registration_form.click_on_form_option()
-        self.logger.info("Clicked on 'Practice Form' under the Forms section.")
+        # Jump straight to the section under test (single page load)
+        Navigator(self.driver).navigate_to("Practice Form")
+        self.logger.info("Navigated directly to 'Practice Form' section.")
 
         yield  # Run the test method
 
         # ---------- TEAR DOWN ----------
-        self.logger.info("Closing browser after test execution.")
-        self.driver.quit()
-        self.logger.info("Browser closed successfully.")
+        self.logger.info("Test finished. Browser teardown is handled by the 'setup' fixture.")
 
     @pytest.mark.smoke
     def test_registration_page(self):
@@ -91,22 +83,21 @@ class TestRegistrationPage:
             # Extract user data from test input
             user_data = self.data.get("UserOne", {})
 
-            # Step-by-step form interaction
-            self.registration_form.enter_first_name(user_data["FirstName"])
-            self.logger.info(f"Entered first name: {user_data['FirstName']}")
-
-            self.registration_form.enter_last_name(user_data["LastName"])
-            self.logger.info(f"Entered last name: {user_data['LastName']}")
-
-            self.registration_form.enter_email(user_data["UserEmail"])
-            self.logger.info(f"Entered email: {user_data['UserEmail']}")
-
+            # Fill all text inputs in one call
+            self.registration_form.fill_form({
+                "First Name": user_data["FirstName"],
+                "Last Name": user_data["LastName"],
+                "Email": user_data["UserEmail"],
+                "Mobile": user_data["MobileNumber"],
+                "Current Address": user_data["CurrentAddress"],
+            })
+            self.logger.info(f"Entered name, email, mobile number and address for: "
+                             f"{user_data['FirstName']} {user_data['LastName']}")
+
+            # Step-by-step interaction for the remaining widgets
             self.registration_form.select_gender_male()
             self.logger.info("Selected gender: Male")
 
-            self.registration_form.enter_mobile_number(user_data["MobileNumber"])
-            self.logger.info(f"Entered mobile number: {user_data['MobileNumber']}")
-
             self.registration_form.enter_date_of_birth(user_data["DateOfBirth"])
             self.logger.info(f"Entered date of birth: {user_data['DateOfBirth']}")
 
@@ -119,9 +110,8 @@ class TestRegistrationPage:
 
             self.registration_form.upload_file(user_data["UploadFile"])
             self.logger.info(f"Uploaded file: {user_data['UploadFile']}")
-
-            self.registration_form.enter_address(user_data["CurrentAddress"])
-            self.logger.info(f"Entered address: {user_data['CurrentAddress']}")
+            assert self.registration_form.last_upload_digest == user_data["UploadFileSha256"], \
+                "Upload fixture checksum does not match the test data."
 
             self.registration_form.select_state(user_data["State"])
             self.registration_form.select_city(user_data["City"])
@@ -159,14 +149,14 @@ class TestRegistrationPage:
         except AssertionError as ae:
             self.logger.error(f"Assertion failed: {str(ae)}")
             screenshot_path = "./Screenshots/test_registration_page_assertion_error.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.info(f"Screenshot saved at: {screenshot_path}")
             raise
 
         except Exception as e:
             self.logger.error(f"Unexpected exception during test execution: {str(e)}")
             screenshot_path = "./Screenshots/test_registration_page_exception.png"
-            self.driver.save_screenshot(screenshot_path)
+            capture_screenshot(self.driver, screenshot_path)
             self.logger.info(f"Screenshot saved at: {screenshot_path}")
             raise
 
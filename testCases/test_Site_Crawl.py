@@ -0,0 +1,74 @@
+import json
+import pytest
+from unititlies.customlogger import LogGen
+from unititlies.readProperties import ReadConfig
+from unititlies.siteCrawler import SiteCrawler, format_crawl_report
+
+
+class TestSiteCrawl:
+    """
+    Opt-in (run with --crawl) crawl of every section reachable from the home
+    cards. Writes a broken-link report; an interrupted crawl resumes from its
+    checkpoint file on the next run, a finished one removes it.
+    """
+    # Retrieve the base application URL from the configuration file
+    baseURL = ReadConfig.get_application_url()
+
+    # Set up logger for the test class
+    logger = LogGen.loggen()
+
+    CHECKPOINT_PATH = "./Reports/crawl_checkpoint.json"
+    REPORT_PATH = "./Reports/broken_links.json"
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self, setup):
+        """
+        Loads test data; the crawler opens every page itself.
+        """
+        self.logger.info("========== Starting Test: TestSiteCrawl ==========")
+
+        self.driver = setup
+
+        # Load test data from JSON file
+        try:
+            with open("./TestData/elements_page.json", "r") as file:
+                self.data = json.load(file)
+            self.logger.info("Test data successfully loaded from 'elements_page.json'.")
+        except Exception as e:
+            self.logger.error(f"Failed to load test data: {str(e)}")
+            raise
+
+        yield  # Yield control to the test method
+
+        # ---------- TEAR DOWN ----------
+        self.logger.info("Test finished. Browser teardown is handled by the 'setup' fixture.")
+
+    @pytest.mark.crawl
+    def test_site_crawl(self, request):
+        test_name = "test_site_crawl"
+        self.logger.info(f"********** Test Case: {test_name} **********")
+
+        # Step 1: Crawl the site (resumes from the checkpoint if a previous run was interrupted)
+        crawler = SiteCrawler(
+            self.driver,
+            self.baseURL,
+            checkpoint_path=self.CHECKPOINT_PATH,
+            concurrency=request.config.getoption("--crawl-concurrency"),
+            rate_limit=request.config.getoption("--crawl-rate"),
+        )
+        self.logger.info(f"Step 1: Crawling {self.baseURL} ({len(crawler.visited)} pages already in checkpoint)")
+        crawler.crawl()
+
+        # Step 2: Write the broken-link report
+        report = crawler.write_report(self.REPORT_PATH)
+        for line in format_crawl_report(report):
+            self.logger.info(f"Step 2: {line}")
+        self.logger.info(f"Broken-link report saved at: {self.REPORT_PATH}")
+
+        # Step 3: The crawl must reach the sections and catch the site's known broken link
+        assert report["pages_crawled"] > 1, "The crawl did not get past the home page."
+        broken_urls = [link["url"].rstrip("/") for link in report["broken"]]
+        expected_broken = ReadConfig.localize_url(self.data["linksTest"]["BrokenLink"]).rstrip("/")
+        assert expected_broken in broken_urls, f"Known broken link {expected_broken} was not reported."
+
+        self.logger.info(f"{test_name} completed.")
@@ -0,0 +1,79 @@
+import pytest
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from pageObjects.BrowserWindow import BrowserWindowHandle
+from pageObjects.ElementsPage import ElementsPage
+from pageObjects.HomePage import HomePage
+from pageObjects.Navigator import Navigator
+from pageObjects.RegistrationForm import RegistrationPage
+from pageObjects.WidgetsPage import WidgetsPage
+from unititlies.customlogger import LogGen
+from unititlies.readProperties import ReadConfig
+from unititlies.screenshotService import capture_screenshot
+
+
+class TestUINavigation:
+    """
+    Opt-in checks (run with --ui-navigation) that the Home -> card -> sidebar
+    click paths still lead to the URLs in the Navigator route table.
+    """
+    # Retrieve the base application URL from the configuration file
+    baseURL = ReadConfig.get_application_url()
+
+    # Set up logger for the test class
+    logger = LogGen.loggen()
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self, setup):
+        """
+        Opens the home page so each test can walk the click path itself.
+        """
+        self.logger.info("========== Starting Test: TestUINavigation ==========")
+
+        self.driver = setup
+        self.driver.maximize_window()
+        HomePage(self.driver).open(self.baseURL)
+        self.logger.info(f"Navigated to application URL: {self.baseURL}")
+
+        self.home_page = HomePage(self.driver)
+        self.navigator = Navigator(self.driver)
+
+        yield  # Run the test method
+
+    @pytest.mark.navigation
+    @pytest.mark.parametrize("card_method, page_class, option_method, section", [
+        ("click_on_elements_card", ElementsPage, "click_on_web_table", "Web Tables"),
+        ("click_on_elements_card", ElementsPage, "click_on_links", "Links"),
+        ("click_on_elements_card", ElementsPage, "click_on_file_upload_and_download", "Upload and Download"),
+        ("click_on_alerts_frame_windows_card", BrowserWindowHandle, "click_on_alerts_option", "Alerts"),
+        ("click_on_alerts_frame_windows_card", BrowserWindowHandle, "click_on_frames_option", "Frames"),
+        ("click_on_widgets_card", WidgetsPage, "click_accordion_option", "Accordian"),
+        ("click_on_widgets_card", WidgetsPage, "click_auto_complete_option", "Auto Complete"),
+        ("click_on_forms_card", RegistrationPage, "click_on_form_option", "Practice Form"),
+    ])
+    def test_click_path_matches_route(self, card_method, page_class, option_method, section):
+        test_name = f"test_click_path_{section.replace(' ', '_')}"
+        self.logger.info(f"********** Test Case: {test_name} **********")
+
+        try:
+            # Step 1: Walk the UI click path
+            self.logger.info(f"Step 1: Clicking '{card_method}' then '{option_method}'")
+            getattr(self.home_page, card_method)()
+            getattr(page_class(self.driver), option_method)()
+
+            # Step 2: The click path must land on the routed URL
+            expected_url = self.navigator.url_for(section)
+            self.logger.info(f"Step 2: Waiting for URL: {expected_url}")
+            WebDriverWait(self.driver, 10).until(EC.url_to_be(expected_url))
+            self.logger.info(f"Click path for '{section}' matches the route table.")
+
+        except Exception as e:
+            screenshot_path = f"./Screenshots/{test_name}_failure.png"
+            capture_screenshot(self.driver, screenshot_path)
+            self.logger.error(f"Click path for '{section}' failed: {e}")
+            self.logger.info(f"Screenshot saved at: {screenshot_path}")
+            raise
+
+        finally:
+            self.logger.info(f"{test_name} completed.")
@@ -0,0 +1,88 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.common.exceptions import WebDriverException
+
+
+class PrewarmedLauncher:
+    """
+    Boots browsers one step ahead of the tests. Every time a driver is handed
+    out, the next one starts launching on a background thread, so its startup
+    overlaps with the test that is currently running.
+    """
+
+    def __init__(self, launcher):
+        """
+        Args:
+            launcher (callable): Zero-argument callable that starts a new WebDriver.
+        """
+        self.launcher = launcher
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="browser-prewarm")
+        self._pending = None
+
+    def acquire(self):
+        """
+        Returns a ready driver and the startup timing for it, then starts
+        booting the next one in the background.
+
+        Returns:
+            tuple: (WebDriver, dict) where the dict holds the total launch time,
+            the part the test had to wait for (exposed) and the part that
+            overlapped with the previous test (hidden), all in seconds.
+        """
+        start = time.perf_counter()
+        if self._pending is None:
+            self._start_next()
+        future, self._pending = self._pending, None
+        driver, launch_seconds = future.result()
+        exposed = time.perf_counter() - start
+
+        self._start_next()
+        return driver, {
+            "launch": round(launch_seconds, 3),
+            "exposed": round(exposed, 3),
+            "hidden": round(max(0.0, launch_seconds - exposed), 3),
+        }
+
+    def shutdown(self):
+        """
+        Stops the background thread and quits the speculatively started browser.
+        """
+        if self._pending is not None:
+            try:
+                driver, _ = self._pending.result()
+                driver.quit()
+            except WebDriverException:
+                pass
+            self._pending = None
+        self._executor.shutdown(wait=True)
+
+    def _start_next(self):
+        self._pending = self._executor.submit(self._timed_launch)
+
+    def _timed_launch(self):
+        start = time.perf_counter()
+        driver = self.launcher()
+        return driver, time.perf_counter() - start
+
+
+def format_startup_report(timings, verbose=False):
+    """
+    Builds the summary lines for the hidden vs. exposed browser startup time.
+
+    Args:
+        timings (dict): Test node id -> timing dict returned by PrewarmedLauncher.acquire.
+        verbose (bool): Include one line per test.
+    """
+    launch = sum(t["launch"] for t in timings.values())
+    exposed = sum(t["exposed"] for t in timings.values())
+    hidden = sum(t["hidden"] for t in timings.values())
+    overlap = (hidden / launch * 100) if launch else 0.0
+    lines = [
+        f"Tests: {len(timings)}, total launch: {launch:.2f}s, "
+        f"exposed: {exposed:.2f}s, hidden: {hidden:.2f}s ({overlap:.0f}% overlapped)"
+    ]
+    if verbose:
+        for nodeid, t in sorted(timings.items()):
+            lines.append(f"{nodeid}: launch {t['launch']:.2f}s, exposed {t['exposed']:.2f}s, hidden {t['hidden']:.2f}s")
+    return lines
@@ -0,0 +1,197 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+_page_objects_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "pageObjects")
+
+
+class CommandProfiler:
+    """
+    pytest plugin that records every WebDriver command (find element, click,
+    execute script, get attribute, ...) with its latency.
+
+    Commands are attributed to the running test and to the chain of page-object
+    methods that issued them (e.g. ElementsPage.click_on_text_box ->
+    BasePage.scroll_and_click -> BasePage.click_element). The end of the run
+    prints the chattiest page-object methods and writes a folded-stacks file
+    for flamegraph.pl / speedscope, weighted by microseconds spent.
+    """
+
+    def __init__(self, output_path=None, top=15, summary=True):
+        """
+        Args:
+            output_path (str): Folded-stacks file written at the end of the run, None to skip.
+            top (int): Number of page-object methods shown in the summary table.
+            summary (bool): Print the summary table; off when only the counts are needed (e.g. budgets).
+        """
+        self.output_path = output_path
+        self.top = top
+        self.summary = summary
+        self.stacks = {}  # "test;Page.method;...;command" -> [count, seconds]
+        self.test_commands = {}  # test id -> commands sent so far (this process only)
+        self.phase_commands = {}  # (test id, "setup" | "call" | "teardown") -> commands (this process only)
+        self._current_test = None
+        self._phase = None
+        self._lock = threading.Lock()
+
+    # ---------- Recording ----------
+    def wrap(self, driver):
+        """
+        Route the driver's commands (including the ones sent through its WebElements) through the profiler.
+        """
+        if getattr(driver, "_command_profiler", None) is self:
+            return driver
+        execute = driver.execute
+
+        def profiled_execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                self.record(driver_command, time.perf_counter() - start)
+
+        driver.execute = profiled_execute
+        driver._command_profiler = self
+        return driver
+
+    def record(self, command, seconds):
+        frames = _page_object_frames(sys._getframe(2))
+        test = self._current_test or "<outside test>"
+        key = ";".join([test, *(frames or ["<test code>"]), command])
+        with self._lock:
+            self.test_commands[test] = self.test_commands.get(test, 0) + 1
+            if self._phase is not None:
+                phase = (test, self._phase)
+                self.phase_commands[phase] = self.phase_commands.get(phase, 0) + 1
+            entry = self.stacks.setdefault(key, [0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+
+    def merge(self, stacks):
+        with self._lock:
+            for key, (count, seconds) in stacks.items():
+                entry = self.stacks.setdefault(key, [0, 0.0])
+                entry[0] += count
+                entry[1] += seconds
+
+    # ---------- Reports ----------
+    def by_method(self):
+        """
+        Totals per issuing page-object method (the outermost one on the stack).
+
+        Returns:
+            list: (method, commands, seconds, {command: count}) tuples, chattiest first.
+        """
+        totals = {}
+        for key, (count, seconds) in self.stacks.items():
+            parts = key.split(";")
+            method, command = parts[1], parts[-1]
+            total = totals.setdefault(method, [0, 0.0, {}])
+            total[0] += count
+            total[1] += seconds
+            total[2][command] = total[2].get(command, 0) + count
+        return sorted(((method, *values) for method, values in totals.items()), key=lambda row: row[1], reverse=True)
+
+    def by_test(self):
+        """
+        Returns:
+            dict: test id -> (commands, seconds).
+        """
+        totals = {}
+        for key, (count, seconds) in self.stacks.items():
+            test = key.split(";", 1)[0]
+            commands, total = totals.get(test, (0, 0.0))
+            totals[test] = (commands + count, total + seconds)
+        return totals
+
+    def write_folded(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as file:
+            for key, (_, seconds) in sorted(self.stacks.items()):
+                # flamegraph.pl wants integer weights
+                file.write(f"{key.replace(' ', '_')} {max(1, round(seconds * 1_000_000))}\n")
+
+    # ---------- Hooks ----------
+    def pytest_runtest_logstart(self, nodeid, location):
+        self._current_test = nodeid
+
+    def pytest_runtest_logfinish(self, nodeid, location):
+        self._current_test = None
+
+    # Commands per phase: setup navigation and driver-pool resets must not count as the test body
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_setup(self, item):
+        self._phase = "setup"
+        try:
+            return (yield)
+        finally:
+            self._phase = None
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_call(self, item):
+        self._phase = "call"
+        try:
+            return (yield)
+        finally:
+            self._phase = None
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        self._phase = "teardown"
+        try:
+            return (yield)
+        finally:
+            self._phase = None
+
+    def pytest_sessionfinish(self, session):
+        config = session.config
+        if hasattr(config, "workeroutput"):
+            # Running inside an xdist worker: hand the stacks to the controller
+            config.workeroutput["command_profile"] = self.stacks
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        stacks = getattr(node, "workeroutput", {}).get("command_profile")
+        if stacks:
+            self.merge(stacks)
+
+    def pytest_terminal_summary(self, terminalreporter, config):
+        if not self.stacks or not self.summary:
+            return
+        if self.output_path:
+            self.write_folded(self.output_path)
+
+        tests = self.by_test()
+        commands = sum(count for count, _ in tests.values())
+        seconds = sum(total for _, total in tests.values())
+        terminalreporter.section("WebDriver commands")
+        terminalreporter.write_line(f"{commands} commands in {seconds:.2f}s over {len(tests)} test(s)")
+        terminalreporter.write_line(f"{'commands':>9} {'total':>9} {'avg':>8}  page-object method (top commands)")
+        for method, count, total, per_command in self.by_method()[:self.top]:
+            chatty = ", ".join(f"{name} x{n}" for name, n in
+                               sorted(per_command.items(), key=lambda entry: entry[1], reverse=True)[:3])
+            terminalreporter.write_line(
+                f"{count:9d} {total:8.2f}s {total / count * 1000:6.0f}ms  {method} ({chatty})"
+            )
+        terminalreporter.write_line("Chattiest tests:")
+        for test, (count, total) in sorted(tests.items(), key=lambda entry: entry[1][0], reverse=True)[:5]:
+            terminalreporter.write_line(f"{count:9d} {total:8.2f}s  {test}")
+        if self.output_path:
+            terminalreporter.write_line(f"Folded stacks for a flamegraph: {self.output_path}")
+
+
+def _page_object_frames(frame):
+    # Page-object methods on the stack, outermost first (e.g. ElementsPage.click_on_text_box;BasePage.find)
+    frames = []
+    while frame is not None:
+        code = frame.f_code
+        if code.co_filename.startswith(_page_objects_dir):
+            frames.append(getattr(code, "co_qualname", code.co_name))
+        frame = frame.f_back
+    frames.reverse()
+    return frames
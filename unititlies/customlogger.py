@@ -1,12 +1,164 @@
+import atexit
+import glob
+import heapq
 import logging
+import logging.handlers
+import os
+import queue
+import threading
+
+from unititlies.eventLog import EventStampFilter, JsonLinesFormatter, TextOnlyFilter
+
+LOG_DIR = os.path.join(".", "Logs")
+LOG_FILE_NAME = "automation.log"
+EVENTS_FILE_NAME = "events.jsonl"
+LOGGER_NAME = "automation"
+
+LOG_FORMAT = "%(asctime)s.%(msecs)03d: %(levelname)s: %(message)s"
+# Sortable timestamps, so per-worker files can be merged in time order
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# No test reads these, so don't pay for them on every record
+logging.logMultiprocessing = False
+logging.logProcesses = False
+logging.logThreads = False
+
 
 class LogGen:
+    """
+    Test logging that never blocks on disk.
+
+    Loggers only put records on an in-memory queue; a QueueListener thread
+    formats them and writes this process's log files: the plain-text log and
+    the structured events log (JSON lines, see unititlies.eventLog). Under
+    xdist every worker writes its own part files (automation.gw0.log,
+    events.gw0.jsonl, ...) and the controller merges them at the end of the
+    session.
+    """
+
+    _queue = None
+    _listener = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def configure(level="INFO", worker_id=None, log_dir=LOG_DIR):
+        """
+        Start the background writer for this process (later calls only change the level).
+
+        Args:
+            level (str|int): Lowest level written, e.g. INFO or WARNING. Records below it
+                are dropped by the logger before any formatting or queueing.
+            worker_id (str): xdist worker id (gw0, gw1, ...), None for the main process.
+            log_dir (str): Directory of the log files.
+        """
+        logger = logging.getLogger(LOGGER_NAME)
+        logger.setLevel(_to_level(level))
+
+        with LogGen._lock:
+            if LogGen._listener is not None:
+                return logger
+
+            os.makedirs(log_dir, exist_ok=True)
+            part = worker_id or "main"
+            text_handler = logging.FileHandler(os.path.join(log_dir, f"automation.{part}.log"), encoding="utf-8")
+            text_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
+            text_handler.addFilter(TextOnlyFilter())
+            events_handler = logging.FileHandler(os.path.join(log_dir, f"events.{part}.jsonl"), encoding="utf-8")
+            events_handler.setFormatter(JsonLinesFormatter())
+
+            LogGen._queue = queue.SimpleQueue()
+            LogGen._listener = logging.handlers.QueueListener(LogGen._queue, text_handler, events_handler)
+            LogGen._listener.start()
+
+            queue_handler = logging.handlers.QueueHandler(LogGen._queue)
+            # Test id and timeline offsets must be taken on the calling thread
+            queue_handler.addFilter(EventStampFilter())
+            logger.handlers = [queue_handler]
+            # Keep the records out of the root logger (and pytest's capture)
+            logger.propagate = False
+            atexit.register(LogGen.shutdown)
+        return logger
 
     @staticmethod
     def loggen():
-        logging.basicConfig(filename=".\\Logs\\automation.log",
-                            format='%(asctime)s: %(levelname)s: %(message)s', datefmt='%m/%d/%Y %I:%M:%S %p',
-                            force=True)
-        logger = logging.getLogger()
-        logger.setLevel(logging.INFO)
-        return logger
\ No newline at end of file
+        """
+        Returns the shared test logger, starting the writer with defaults if needed.
+        """
+        if LogGen._listener is None:
+            LogGen.configure()
+        return logging.getLogger(LOGGER_NAME)
+
+    @staticmethod
+    def shutdown():
+        """
+        Write out every queued record and stop the writer thread.
+        """
+        with LogGen._lock:
+            listener, LogGen._listener = LogGen._listener, None
+        if listener is None:
+            return
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+        logging.getLogger(LOGGER_NAME).handlers = []
+
+    @staticmethod
+    def merge_worker_logs(log_dir=LOG_DIR):
+        """
+        Append the part files of this run to automation.log and events.jsonl in
+        timestamp order, then remove them.
+
+        Returns:
+            int: Number of part files merged.
+        """
+        merged = _merge_parts(os.path.join(log_dir, "automation.*.log"), os.path.join(log_dir, LOG_FILE_NAME),
+                              _text_entries)
+        merged += _merge_parts(os.path.join(log_dir, "events.*.jsonl"), os.path.join(log_dir, EVENTS_FILE_NAME),
+                               _json_entries)
+        return merged
+
+
+def _merge_parts(pattern, target, entries):
+    part_paths = sorted(glob.glob(pattern))
+    if not part_paths:
+        return 0
+
+    files = [open(path, "r", encoding="utf-8") for path in part_paths]
+    try:
+        with open(target, "a", encoding="utf-8") as merged:
+            for _, _, entry in heapq.merge(*(entries(file, index) for index, file in enumerate(files))):
+                merged.write(entry)
+    finally:
+        for file in files:
+            file.close()
+
+    for path in part_paths:
+        os.remove(path)
+    return len(part_paths)
+
+
+def _text_entries(file, index):
+    # One entry per record; traceback lines stay attached to the record that logged them
+    entry = []
+    for line in file:
+        if entry and line[:4].isdigit():
+            yield entry[0][:23], index, "".join(entry)
+            entry = []
+        entry.append(line)
+    if entry:
+        yield entry[0][:23], index, "".join(entry)
+
+
+def _json_entries(file, index):
+    # Every line starts with {"ts": "<sortable timestamp>"
+    for line in file:
+        yield line[8:31], index, line
+
+
+def _to_level(level):
+    if isinstance(level, int):
+        return level
+    value = logging.getLevelName(str(level).upper())
+    if not isinstance(value, int):
+        raise ValueError(f"Unknown log level: {level}")
+    return value
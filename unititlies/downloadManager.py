@@ -0,0 +1,203 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import threading
+import time
+
+from unititlies.fileHash import file_digest
+
+# Files the browsers write while a download is still in progress
+PARTIAL_SUFFIXES = (".crdownload", ".part", ".partial", ".tmp", ".download")
+
+# inotify event masks (see inotify(7))
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+
+
+class _InotifyWatcher:
+    """
+    Wakes up as soon as something changes in the directory (Linux only, via libc).
+    """
+
+    MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+    def __init__(self, directory):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self._fd, os.fsencode(directory), self.MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, f"inotify_add_watch failed for {directory}")
+
+    def wait(self, timeout):
+        ready, _, _ = select.select([self._fd], [], [], max(0.0, timeout))
+        if ready:
+            # Drain the queued events; the caller re-reads the directory anyway
+            try:
+                while os.read(self._fd, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def close(self):
+        os.close(self._fd)
+
+
+class _PollingWatcher:
+    """
+    Fallback for platforms without inotify: re-check the directory every `interval` seconds.
+    """
+
+    def __init__(self, directory, interval=0.1):
+        self.interval = interval
+        self._stop = threading.Event()
+
+    def wait(self, timeout):
+        self._stop.wait(min(self.interval, max(0.0, timeout)))
+
+    def close(self):
+        self._stop.set()
+
+
+class DownloadManager:
+    """
+    Waits for a browser download to finish in a directory.
+
+    Files that already exist when the manager starts are ignored. A new file counts
+    as finished once no partial download (.crdownload, .part, ...) is left for it
+    and its size has not changed for `stable_for` seconds.
+
+    Usage:
+        with DownloadManager(download_dir) as downloads:
+            elements_page.download_file(download_dir)
+            result = downloads.wait_for_download(expected_name="sampleFile.jpeg")
+    """
+
+    def __init__(self, directory, stable_for=0.3, use_inotify=True):
+        """
+        Args:
+            directory (str): Directory the browser downloads into.
+            stable_for (float): Seconds the file size must stay unchanged.
+            use_inotify (bool): Use inotify when available, otherwise poll.
+        """
+        self.directory = directory
+        self.stable_for = stable_for
+        self.use_inotify = use_inotify
+        self._existing = set()
+        self._watcher = None
+
+    def start(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self._existing = set(os.listdir(self.directory))
+        self._watcher = None
+        if self.use_inotify:
+            try:
+                self._watcher = _InotifyWatcher(self.directory)
+            except (OSError, AttributeError):
+                # No inotify on this platform (e.g. Windows or macOS)
+                self._watcher = None
+        if self._watcher is None:
+            self._watcher = _PollingWatcher(self.directory)
+        return self
+
+    def stop(self):
+        if self._watcher is not None:
+            self._watcher.close()
+            self._watcher = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @property
+    def mode(self):
+        """
+        'inotify' or 'polling', whichever watcher is in use.
+        """
+        return "inotify" if isinstance(self._watcher, _InotifyWatcher) else "polling"
+
+    def wait_for_download(self, expected_name=None, timeout=30, algorithm=None):
+        """
+        Wait for a new file to finish downloading.
+
+        Args:
+            expected_name (str): Only accept this file name; by default any new file.
+            timeout (float): Seconds to wait.
+            algorithm (str): Also hash the finished file (streamed in chunks), e.g. "sha256".
+
+        Returns:
+            dict: {"path", "size", "seconds"} of the finished file, plus the digest
+            under the algorithm's name when `algorithm` is given.
+
+        Raises:
+            TimeoutError: If no download finishes within `timeout` seconds.
+        """
+        if self._watcher is None:
+            self.start()
+
+        start = time.monotonic()
+        deadline = start + timeout
+        last_seen = {}  # file name -> (size, time the size was first seen)
+
+        while True:
+            now = time.monotonic()
+            names = set(os.listdir(self.directory)) - self._existing
+            in_progress = any(name.endswith(PARTIAL_SUFFIXES) for name in names)
+            waiting_on_size = False
+
+            for name in sorted(names):
+                if name.endswith(PARTIAL_SUFFIXES) or (expected_name and name != expected_name):
+                    continue
+                if any(other.startswith(name) and other.endswith(PARTIAL_SUFFIXES) for other in names):
+                    continue
+                path = os.path.join(self.directory, name)
+                try:
+                    size = os.path.getsize(path)
+                except OSError:
+                    continue  # renamed or removed in between
+
+                previous = last_seen.get(name)
+                if previous is None or previous[0] != size:
+                    last_seen[name] = (size, now)
+                    waiting_on_size = True
+                elif size > 0 and not in_progress and now - previous[1] >= self.stable_for:
+                    result = {"path": path, "size": size, "seconds": round(now - start, 3)}
+                    if algorithm:
+                        result[algorithm] = file_digest(path, algorithm)
+                    return result
+                else:
+                    waiting_on_size = True
+
+            if now >= deadline:
+                raise TimeoutError(f"No download finished in {self.directory} within {timeout} seconds.")
+
+            # A file waiting on its size needs a re-check even if no event arrives
+            wait = min(deadline - now, self.stable_for) if waiting_on_size else deadline - now
+            self._watcher.wait(wait)
+
+
+def redirect_browser_downloads(driver, directory):
+    """
+    Point a Chromium browser (Chrome/Edge) at `directory` for its downloads, at runtime.
+
+    Returns:
+        bool: True if the browser accepted the new directory, False if it cannot be
+        changed at runtime (e.g. Firefox), in which case the launch-time directory stays.
+    """
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return False
+    params = {"behavior": "allow", "downloadPath": os.path.abspath(directory)}
+    for command in ("Browser.setDownloadBehavior", "Page.setDownloadBehavior"):
+        try:
+            driver.execute_cdp_cmd(command, params)
+            return True
+        except Exception:
+            continue
+    return False
@@ -0,0 +1,95 @@
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.edge.options import Options as EdgeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+import os
+
+
+class DriverFactory:
+
+    @staticmethod
+    def create_driver(browser, headless=False, proxy=None, network_log=False):
+        """
+        Launches a new WebDriver session for the requested browser.
+
+        Args:
+            browser (str): The browser name: chrome, firefox, or edge.
+            headless (bool): Whether to run the browser in headless mode.
+            proxy (str): "host:port" of an HTTP(S) proxy for all page traffic (e.g. the
+                record/replay proxy), None for a direct connection.
+            network_log (bool): Keep Chromium's performance log, which the request blocker
+                reads to count blocked requests.
+
+        Returns:
+            WebDriver: A freshly started WebDriver instance.
+        """
+        if browser == "chrome":
+            options = ChromeOptions()
+            download_dir = os.path.abspath("C:/Users/DELL/PycharmProjects/UI_Elements_Project/Download")
+
+            # These options should be added regardless of headless mode
+            options.add_experimental_option("excludeSwitches", ["enable-automation"])
+            options.add_experimental_option('useAutomationExtension', False)
+            options.add_argument("--disable-blink-features=AutomationControlled")
+            # Ads and trackers are blocked at the network level (see unititlies.requestBlocker)
+
+            # Download preferences
+            options.add_experimental_option("prefs", {
+                "download.default_directory": download_dir,
+                "download.prompt_for_download": False,
+                "download.directory_upgrade": True,
+                "safebrowsing.enabled": True
+            })
+
+            if headless:
+                options.add_argument("--headless=new")  # Required for headless downloads in new Chrome
+                options.add_argument("--disable-gpu")
+                options.add_argument("--window-size=1920,1080")
+
+            if proxy:
+                DriverFactory._add_chromium_proxy(options, proxy)
+            if network_log:
+                options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+            driver = webdriver.Chrome(options=options)
+            print("Launching Chrome" + (" in headless mode" if headless else ""))
+
+        elif browser == "firefox":
+            options = FirefoxOptions()
+            if headless:
+                options.headless = True
+            if proxy:
+                host, port = proxy.rsplit(":", 1)
+                options.set_preference("network.proxy.type", 1)  # manual proxy configuration
+                for scheme in ("http", "ssl"):
+                    options.set_preference(f"network.proxy.{scheme}", host)
+                    options.set_preference(f"network.proxy.{scheme}_port", int(port))
+                # The proxy decrypts HTTPS with its own self-signed certificate
+                options.accept_insecure_certs = True
+            driver = webdriver.Firefox(options=options)
+            print("Launching Firefox" + (" in headless mode" if headless else ""))
+
+        elif browser == "edge":
+            if headless:
+                print("Warning: Headless mode for Edge is not officially supported in this script.")
+            options = EdgeOptions()
+            if proxy:
+                DriverFactory._add_chromium_proxy(options, proxy)
+            if network_log:
+                options.set_capability("ms:loggingPrefs", {"performance": "ALL"})
+            driver = webdriver.Edge(options=options)
+            print("Launching Edge")
+
+        else:
+            raise ValueError(f"Unsupported browser: {browser}")
+
+        # All waiting is explicit (see pageObjects.BasePage); an implicit wait would
+        # stack on top of it and make every "element not present" check slow
+        driver.implicitly_wait(0)
+        return driver
+
+    @staticmethod
+    def _add_chromium_proxy(options, proxy):
+        options.add_argument(f"--proxy-server=http://{proxy}")
+        # The proxy decrypts HTTPS with its own self-signed certificate
+        options.add_argument("--ignore-certificate-errors")
@@ -0,0 +1,149 @@
+import time
+
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+
+
+class DriverPool:
+    """
+    Keeps warm WebDriver sessions alive for the lifetime of a pytest process
+    (one pool per xdist worker) and hands out a freshly reset session per test.
+    A browser is only relaunched when its reset fails or it hits the reuse limit.
+    """
+
+    def __init__(self, launcher, base_url, max_size=1, max_reuse=0):
+        """
+        Args:
+            launcher (callable): Zero-argument callable that starts a new WebDriver.
+            base_url (str): URL every handed-out session is navigated to.
+            max_size (int): Maximum number of idle sessions kept warm.
+            max_reuse (int): Relaunch a session after this many tests (0 = unlimited).
+        """
+        self.launcher = launcher
+        self.base_url = base_url
+        self.max_size = max(1, max_size)
+        self.max_reuse = max_reuse
+        self._idle = []
+        self._uses = {}
+
+        # Counters used for the end-of-session report
+        self.launches = 0
+        self.reuses = 0
+        self.restarts = 0
+        self.launch_seconds = 0.0
+        self.reset_seconds = 0.0
+
+    def acquire(self):
+        """
+        Returns a healthy WebDriver session, reusing an idle one when possible.
+        """
+        while self._idle:
+            driver = self._idle.pop()
+            start = time.perf_counter()
+            if self._reset(driver):
+                self.reset_seconds += time.perf_counter() - start
+                self.reuses += 1
+                self._uses[driver] += 1
+                return driver
+            # Reset failed: the browser is unhealthy, throw it away and try the next one
+            self.restarts += 1
+            self._discard(driver)
+        return self._launch()
+
+    def release(self, driver):
+        """
+        Returns a session to the pool, or quits it if the pool is full or
+        the session has reached its reuse limit.
+        """
+        uses = self._uses.get(driver, 0)
+        if (self.max_reuse and uses >= self.max_reuse) or len(self._idle) >= self.max_size:
+            self._discard(driver)
+            return
+        self._idle.append(driver)
+
+    def close_all(self):
+        """
+        Quits every idle session. Called once at the end of the session.
+        """
+        while self._idle:
+            self._discard(self._idle.pop())
+
+    def stats(self):
+        """
+        Returns the pool counters as a plain dict (safe to send between xdist processes).
+        """
+        return {
+            "launches": self.launches,
+            "reuses": self.reuses,
+            "restarts": self.restarts,
+            "launch_seconds": self.launch_seconds,
+            "reset_seconds": self.reset_seconds,
+        }
+
+    def _launch(self):
+        start = time.perf_counter()
+        driver = self.launcher()
+        self.launch_seconds += time.perf_counter() - start
+        self.launches += 1
+        self._uses[driver] = 1
+        driver.get(self.base_url)
+        return driver
+
+    def _discard(self, driver):
+        self._uses.pop(driver, None)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def _reset(self, driver):
+        """
+        Brings a used session back to a clean state: no alert, a single window,
+        no cookies or web storage, and the base URL loaded.
+        Returns False when the browser does not respond properly.
+        """
+        try:
+            try:
+                driver.switch_to.alert.dismiss()
+            except NoAlertPresentException:
+                pass
+
+            # Close every window/tab the previous test opened
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            # Clear web storage for the current origin (fails on about:blank, which is fine)
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except WebDriverException:
+                pass
+
+            # Chromium can drop cookies for every domain in one call
+            if hasattr(driver, "execute_cdp_cmd"):
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            else:
+                driver.delete_all_cookies()
+
+            driver.get(self.base_url)
+            return True
+        except WebDriverException:
+            return False
+
+
+def format_pool_stats(stats):
+    """
+    Builds the human-readable lines for the driver pool summary.
+    """
+    launches = stats["launches"]
+    reuses = stats["reuses"]
+    avg_launch = stats["launch_seconds"] / launches if launches else 0.0
+    avg_reset = stats["reset_seconds"] / reuses if reuses else 0.0
+    saved = reuses * (avg_launch - avg_reset)
+    return [
+        f"Browsers launched: {launches} (restarted unhealthy: {stats['restarts']})",
+        f"Sessions reused: {reuses}",
+        f"Average launch cost: {avg_launch:.2f}s, average reset cost: {avg_reset:.2f}s",
+        f"Estimated startup time saved: {saved:.2f}s",
+    ]
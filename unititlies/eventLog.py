@@ -0,0 +1,226 @@
+import functools
+import inspect
+import json
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+import pytest
+
+# Child of LogGen's logger: its records go through the same queue and writer thread
+EVENT_LOGGER_NAME = "automation.events"
+
+_event_logger = logging.getLogger(EVENT_LOGGER_NAME)
+_page_objects_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "pageObjects")
+
+# The test currently running in this process (one test at a time per xdist worker)
+_current = {"test_id": None, "started": None, "last": None, "depth": 0}
+
+
+class EventStampFilter(logging.Filter):
+    """
+    Stamps every record with the running test and its position on the test's
+    timeline. Runs on the calling thread, before the record is queued.
+    """
+
+    def filter(self, record):
+        record.test_id = _current["test_id"]
+        started, last = _current["started"], _current["last"]
+        record.offset = round(record.created - started, 3) if started else None
+        # Free-form log lines: time since the previous line of the same test
+        if not hasattr(record, "event"):
+            record.since_last = round(record.created - last, 3) if last else None
+        if started:
+            _current["last"] = record.created
+        return True
+
+
+class TextOnlyFilter(logging.Filter):
+    """
+    Keeps structured events (steps, test start/end) out of the plain-text log.
+    """
+
+    def filter(self, record):
+        return not hasattr(record, "event")
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    One JSON object per record. Plain logger.info(...) lines become "log" events
+    with the message as their step.
+    """
+
+    def format(self, record):
+        event = {
+            "ts": self.formatTime(record, "%Y-%m-%d %H:%M:%S") + f".{int(record.msecs):03d}",
+            "event": getattr(record, "event", "log"),
+            "level": record.levelname,
+            "test": getattr(record, "test_id", None),
+            "offset": getattr(record, "offset", None),
+            "step": record.getMessage(),
+        }
+        if event["event"] == "log":
+            event["duration"] = getattr(record, "since_last", None)
+        for key in ("method", "caller", "locator", "duration", "outcome", "depth", "error"):
+            if hasattr(record, key):
+                event[key] = getattr(record, key)
+        return json.dumps(event, default=str)
+
+
+def event(name, step, level=logging.INFO, **fields):
+    """
+    Write a structured event for the running test, e.g. event("step", "Submit form", outcome="passed").
+    """
+    if _event_logger.isEnabledFor(level):
+        _event_logger.log(level, step, extra={"event": name, **fields})
+
+
+@contextmanager
+def step(name, method=None, locator=None):
+    """
+    Time a block of test code as one step:
+
+        with step("Fill the registration form"):
+            ...
+    """
+    if not _event_logger.isEnabledFor(logging.INFO):
+        yield
+        return
+    start = time.perf_counter()
+    outcome, error = "passed", None
+    try:
+        yield
+    except BaseException as e:
+        outcome, error = "failed", e.__class__.__name__
+        raise
+    finally:
+        fields = {"duration": round(time.perf_counter() - start, 3), "outcome": outcome}
+        if method:
+            fields["method"] = method
+        if locator:
+            fields["locator"] = locator
+        if error:
+            fields["error"] = error
+        event("step", name, **fields)
+
+
+def timed(func):
+    """
+    Decorator for page-object methods: records method, locator, duration and outcome
+    as a "call" event. Costs no WebDriver commands and nothing when INFO is disabled.
+    """
+    parameters = list(inspect.signature(func).parameters)
+    # The argument reported as the locator: the first of these the method takes
+    candidates = [name for name in ("locator", "xpath", "section", "element_name") if name in parameters]
+    locator_index = parameters.index(candidates[0]) if candidates else None
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not _event_logger.isEnabledFor(logging.INFO):
+            return func(self, *args, **kwargs)
+
+        method = f"{type(self).__name__}.{func.__name__}"
+        locator = None
+        if locator_index is not None:
+            name = parameters[locator_index]
+            locator = kwargs.get(name, args[locator_index - 1] if len(args) >= locator_index else None)
+
+        _current["depth"] += 1
+        start = time.perf_counter()
+        outcome, error = "passed", None
+        try:
+            result = func(self, *args, **kwargs)
+            if result is None and func.__name__ in ("scroll_and_click", "click_element"):
+                outcome = "failed"  # these report a failed click by returning None
+            return result
+        except BaseException as e:
+            outcome, error = "failed", e.__class__.__name__
+            raise
+        finally:
+            depth = _current["depth"]
+            _current["depth"] -= 1
+            fields = {"method": method, "caller": _page_object_caller(), "locator": locator, "depth": depth,
+                      "duration": round(time.perf_counter() - start, 3), "outcome": outcome}
+            if error:
+                fields["error"] = error
+            event("call", method, **fields)
+
+    return wrapper
+
+
+def _page_object_caller():
+    # The page-object method (e.g. ElementsPage.click_on_text_box) that led to this call
+    frame = sys._getframe(2)
+    while frame is not None:
+        code = frame.f_code
+        if code.co_filename.startswith(_page_objects_dir) and not code.co_filename.endswith("BasePage.py") \
+                and code.co_name != "wrapper":
+            return getattr(code, "co_qualname", code.co_name)
+        frame = frame.f_back
+    return None
+
+
+def load_timelines(path):
+    """
+    Read an events file and group it per test.
+
+    Returns:
+        dict: test id -> list of events in the order they happened.
+    """
+    timelines = {}
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if line:
+                entry = json.loads(line)
+                timelines.setdefault(entry.get("test"), []).append(entry)
+    return timelines
+
+
+def summarize_calls(timelines):
+    """
+    Total time per page-object method across all tests, slowest first.
+
+    Returns:
+        list: (method, calls, total seconds, failures) tuples.
+    """
+    totals = {}
+    for events in timelines.values():
+        for entry in events:
+            if entry["event"] != "call":
+                continue
+            calls, seconds, failures = totals.get(entry["method"], (0, 0.0, 0))
+            totals[entry["method"]] = (calls + 1, seconds + entry["duration"], failures + (entry["outcome"] != "passed"))
+    return sorted(((method, *values) for method, values in totals.items()), key=lambda row: row[2], reverse=True)
+
+
+class EventLogPlugin:
+    """
+    pytest plugin that opens and closes each test's timeline in the events log
+    (test_start / test_end with the outcome of every phase).
+    """
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_logstart(self, nodeid, location):
+        now = time.time()
+        _current.update(test_id=nodeid, started=now, last=now, depth=0)
+        event("test_start", nodeid)
+
+    def pytest_runtest_logreport(self, report):
+        if report.when == "call" or report.outcome != "passed":
+            event("phase", report.when, outcome=report.outcome, duration=round(report.duration, 3))
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_runtest_logfinish(self, nodeid, location):
+        started = _current["started"]
+        event("test_end", nodeid, duration=round(time.time() - started, 3) if started else None)
+        _current.update(test_id=None, started=None, last=None, depth=0)
+
+
+if __name__ == "__main__":
+    # python -m unititlies.eventLog Logs/events.jsonl
+    for method, calls, seconds, failures in summarize_calls(load_timelines(sys.argv[1] if len(sys.argv) > 1 else
+                                                                             os.path.join("Logs", "events.jsonl"))):
+        print(f"{seconds:9.3f}s  {calls:6d} calls  {failures:4d} failed  {method}")
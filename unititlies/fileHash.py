@@ -0,0 +1,79 @@
+import hashlib
+import os
+import threading
+
+# Files are hashed in chunks of this size, so memory use does not grow with the file
+CHUNK_SIZE = 1024 * 1024
+
+# (absolute path, size, mtime, algorithm) -> hex digest
+_digest_cache = {}
+_cache_lock = threading.Lock()
+
+
+def stream_digest(stream, algorithm="sha256", chunk_size=CHUNK_SIZE):
+    """
+    Hash any binary stream with `readinto` (file, HTTP response, BytesIO) in
+    fixed-size chunks, so memory use does not grow with the stream.
+
+    Args:
+        stream: Readable binary stream.
+        algorithm (str): Any hashlib algorithm name, e.g. sha256 or md5.
+        chunk_size (int): Bytes read per chunk.
+
+    Returns:
+        str: Hex digest.
+    """
+    digest = hashlib.new(algorithm)
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    while True:
+        read = stream.readinto(buffer)
+        if not read:
+            break
+        digest.update(view[:read])
+    return digest.hexdigest()
+
+
+def file_digest(path, algorithm="sha256", chunk_size=CHUNK_SIZE):
+    """
+    Hash a file by streaming it in fixed-size chunks (never loads the whole file).
+
+    Args:
+        path (str): File to hash.
+        algorithm (str): Any hashlib algorithm name, e.g. sha256 or md5.
+        chunk_size (int): Bytes read per chunk.
+
+    Returns:
+        str: Hex digest.
+    """
+    with open(path, "rb", buffering=0) as file:
+        return stream_digest(file, algorithm, chunk_size)
+
+
+def cached_digest(path, algorithm="sha256"):
+    """
+    Digest of a fixture file, computed once per process and reused until the file
+    changes (size or modification time). Returns None if the file does not exist.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns, algorithm)
+    with _cache_lock:
+        if key in _digest_cache:
+            return _digest_cache[key]
+    digest = file_digest(path, algorithm)
+    with _cache_lock:
+        _digest_cache[key] = digest
+    return digest
+
+
+def precompute_digests(paths, algorithm="sha256"):
+    """
+    Warm the cache for fixture files (e.g. at session start), skipping missing ones.
+
+    Returns:
+        dict: path -> digest (None for missing files).
+    """
+    return {path: cached_digest(path, algorithm) for path in paths}
@@ -0,0 +1,474 @@
+import base64
+import gzip
+import hashlib
+import http.client
+import json
+import os
+import selectors
+import shutil
+import socket
+import ssl
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import pytest
+
+from unititlies.linkChecker import ConnectionPool
+from unititlies.requestBlocker import UNKNOWN_PAGE
+
+ARCHIVE_DIR = os.path.join(".", "Reports", "traffic")
+
+# Headers that describe one connection, not the response: never stored or forwarded
+HOP_BY_HOP = {"connection", "keep-alive", "proxy-connection", "proxy-authenticate", "proxy-authorization",
+              "te", "trailer", "transfer-encoding", "upgrade", "content-length"}
+# Dropped from recorded requests so the archive always holds full responses, never a 304 for the browser's cache
+CONDITIONAL = {"if-none-match", "if-modified-since", "if-match", "if-unmodified-since", "if-range"}
+
+
+class TrafficArchive:
+    """
+    Recorded responses on disk, looked up by request.
+
+    The archive is a directory: index.json maps "METHOD URL" keys to the
+    status, headers and body digest of the response, and every distinct body
+    is stored once, gzip-compressed, as bodies/<sha256>.gz. Pages that share
+    scripts, styles and images therefore cost their bytes only once.
+    """
+
+    def __init__(self, directory=ARCHIVE_DIR):
+        self.directory = directory
+        self.bodies_dir = os.path.join(directory, "bodies")
+        self.index_path = self.index_path_of(directory)
+        self.entries = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, "r") as file:
+                self.entries = json.load(file)
+        self.added = {}  # entries recorded by this process, merged into the index at the end
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def index_path_of(directory):
+        return os.path.join(directory, "index.json")
+
+    @classmethod
+    def exists(cls, directory=ARCHIVE_DIR):
+        """
+        True if something was recorded into `directory` (checked without reading the index).
+        """
+        return os.path.exists(cls.index_path_of(directory))
+
+    @staticmethod
+    def key(method, url, body=b""):
+        # Requests with a body (e.g. POST) are told apart by the body's hash
+        key = f"{method} {url.split('#', 1)[0]}"
+        return f"{key} #{hashlib.sha256(body).hexdigest()[:16]}" if body else key
+
+    def get(self, key):
+        """
+        Returns:
+            tuple: (status, reason, headers, body bytes), or None when the request was never recorded.
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        body = b""
+        if entry["body"]:
+            try:
+                with gzip.open(os.path.join(self.bodies_dir, entry["body"] + ".gz"), "rb") as file:
+                    body = file.read()
+            except OSError:
+                return None  # body file missing: treat as a miss and record it again
+        return entry["status"], entry["reason"], entry["headers"], body
+
+    def put(self, key, status, reason, headers, body):
+        digest = None
+        if body:
+            digest = hashlib.sha256(body).hexdigest()
+            path = os.path.join(self.bodies_dir, digest + ".gz")
+            if not os.path.exists(path):
+                os.makedirs(self.bodies_dir, exist_ok=True)
+                temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with gzip.open(temp_path, "wb") as file:
+                    file.write(body)
+                os.replace(temp_path, path)
+        entry = {"status": status, "reason": reason, "headers": headers, "body": digest, "size": len(body),
+                 "recorded": time.strftime("%Y-%m-%dT%H:%M:%S")}
+        with self._lock:
+            self.entries[key] = entry
+            self.added[key] = entry
+
+    def save(self, added=None):
+        """
+        Merge recorded entries into index.json (re-read first, so parallel processes do not drop each other's).
+        """
+        added = self.added if added is None else added
+        if not added:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        entries = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, "r") as file:
+                entries = json.load(file)
+        entries.update(added)
+        temp_path = self.index_path + ".tmp"
+        with open(temp_path, "w") as file:
+            json.dump(entries, file, indent=1, sort_keys=True)
+        os.replace(temp_path, self.index_path)
+        self.entries.update(added)
+
+    def sizes(self):
+        """
+        Returns:
+            dict: URL -> recorded body size of every GET response.
+        """
+        return {key.split(" ")[1]: entry["size"] for key, entry in self.entries.items() if key.startswith("GET ")}
+
+    def export_har(self, path):
+        """
+        Write the archive as a HAR 1.2 file, for browser dev tools and HAR viewers.
+        """
+        har_entries = []
+        for key, entry in sorted(self.entries.items()):
+            method, url = key.split(" ")[:2]
+            _, _, headers, body = self.get(key) or (None, None, entry["headers"], b"")
+            content_type = next((value for name, value in headers if name.lower() == "content-type"), "")
+            har_entries.append({
+                "startedDateTime": entry["recorded"],
+                "time": 0,
+                "request": {"method": method, "url": url, "httpVersion": "HTTP/1.1", "headers": [],
+                            "queryString": [], "cookies": [], "headersSize": -1, "bodySize": -1},
+                "response": {"status": entry["status"], "statusText": entry["reason"], "httpVersion": "HTTP/1.1",
+                             "headers": [{"name": name, "value": value} for name, value in headers],
+                             "cookies": [], "redirectURL": "", "headersSize": -1, "bodySize": len(body),
+                             "content": {"size": len(body), "mimeType": content_type, "encoding": "base64",
+                                         "text": base64.b64encode(body).decode("ascii")}},
+                "cache": {},
+                "timings": {"send": 0, "wait": 0, "receive": 0},
+            })
+        with open(path, "w") as file:
+            json.dump({"log": {"version": "1.2", "creator": {"name": "UI_Elements_Project", "version": "1"},
+                               "entries": har_entries}}, file)
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive with the browser
+    disable_nagle_algorithm = True
+
+    # "https://host[:port]" once a CONNECT tunnel has been opened and decrypted
+    _origin = None
+
+    def do_CONNECT(self):
+        host, _, port = self.path.rpartition(":")
+        proxy = self.server.proxy
+        if proxy.blocks(f"https://{host}/", UNKNOWN_PAGE):
+            # Blocked host: refuse the tunnel, nothing is fetched
+            self.send_error(403, "Blocked")
+            self.close_connection = True
+            return
+        if proxy.tls_context is None:
+            proxy.count("tunnelled")
+            self._tunnel(host, int(port))
+            return
+
+        self.send_response(200, "Connection Established")
+        self.end_headers()
+        try:
+            self.connection = proxy.tls_context.wrap_socket(self.connection, server_side=True)
+        except (ssl.SSLError, OSError):
+            self.close_connection = True
+            return
+        self.rfile = self.connection.makefile("rb", self.rbufsize)
+        self.wfile = self.connection.makefile("wb")
+        self._origin = "https://" + (host if port == "443" else self.path)
+        # Keep reading requests, now decrypted, from the same connection
+        self.close_connection = False
+
+    def _tunnel(self, host, port):
+        # No certificate to decrypt with: relay the encrypted bytes untouched
+        try:
+            upstream = socket.create_connection((host, port), timeout=30)
+        except OSError:
+            self.send_error(502)
+            return
+        self.send_response(200, "Connection Established")
+        self.end_headers()
+        self.wfile.flush()
+        with upstream, selectors.DefaultSelector() as selector:
+            selector.register(self.connection, selectors.EVENT_READ, upstream)
+            selector.register(upstream, selectors.EVENT_READ, self.connection)
+            while True:
+                events = selector.select(timeout=60)
+                if not events:
+                    self.close_connection = True
+                    return
+                for key, _ in events:
+                    data = key.fileobj.recv(65536)
+                    if not data:
+                        self.close_connection = True
+                        return
+                    key.data.sendall(data)
+
+    def do_GET(self):
+        self._proxy()
+
+    do_HEAD = do_POST = do_PUT = do_PATCH = do_DELETE = do_OPTIONS = do_GET
+
+    def _proxy(self):
+        url = self._origin + self.path if self._origin else self.path
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        response = self.server.proxy.respond(self.command, url, self.headers, body)
+        if response is None:
+            self.send_error(504, "Not in the traffic archive")
+            return
+        status, reason, headers, content = response
+        self.send_response(status, reason)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        if self.command != "HEAD" and content:
+            self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        # Keep the test output clean
+        pass
+
+
+class ReplayProxy:
+    """
+    Local HTTP(S) proxy that records the browser's traffic into a TrafficArchive
+    and serves it back on later runs, so page loads never leave the machine.
+
+    Modes:
+        record:  every request goes to the network; the responses are (re)recorded.
+        replay:  recorded requests are answered from the archive; misses go to
+                 the network and are recorded for next time.
+        offline: like replay, but misses are answered with 504 instead.
+        live:    plain forwarding, nothing recorded or replayed; HTTPS is tunnelled.
+                 Used to filter requests for browsers without CDP (see requestBlocker).
+
+    With a RequestBlocker, matching requests are answered with 403 without
+    touching the network or the archive.
+
+    HTTPS is decrypted with a self-signed certificate generated by the openssl
+    command line (the browser is started with certificate errors ignored).
+    Without openssl, HTTPS traffic is tunnelled untouched and never recorded.
+
+    Also a pytest plugin: hit rate per run, merged across xdist workers.
+    """
+
+    def __init__(self, archive_dir=ARCHIVE_DIR, mode="replay", host="127.0.0.1", port=0, blocker=None):
+        """
+        Args:
+            archive_dir (str): Directory of the TrafficArchive, created on first record.
+            mode (str): record, replay, offline or live (see above).
+            host (str): Interface to bind.
+            port (int): Port to bind, 0 picks a free one.
+            blocker (RequestBlocker): Requests to refuse, None to let everything through.
+        """
+        if mode not in ("record", "replay", "offline", "live"):
+            raise ValueError(f"Unknown traffic mode: {mode}. Use record, replay, offline or live.")
+        self.archive = TrafficArchive(archive_dir)
+        self.mode = mode
+        self.host = host
+        self.port = port
+        self.blocker = blocker
+        self.tls_context = None
+        self.counts = {"hits": 0, "misses": 0, "recorded": 0, "errors": 0, "tunnelled": 0, "blocked": 0}
+        self._pool = ConnectionPool(timeout=30)
+        self._server = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    # ---------- Server ----------
+    @property
+    def address(self):
+        """
+        "host:port" for the browser's proxy setting, None until started.
+        """
+        if self._server is None:
+            return None
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def start(self):
+        if self._server is not None:
+            return self
+        if self.mode != "live":
+            self.tls_context = _tls_context(os.path.join(self.archive.directory, "certificate"))
+        self._server = ThreadingHTTPServer((self.host, self.port), _ProxyHandler)
+        self._server.daemon_threads = True
+        self._server.proxy = self
+        self._thread = threading.Thread(target=self._server.serve_forever, name="replay-proxy", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._pool.close_all()
+        self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    # ---------- Requests ----------
+    def count(self, name):
+        with self._lock:
+            self.counts[name] += 1
+
+    def blocks(self, url, page):
+        """
+        Whether the blocker refuses `url`; counts it for `page` if so.
+        """
+        if self.blocker is None or not self.blocker.matches(url):
+            return False
+        self.blocker.record(page, url)
+        self.count("blocked")
+        return True
+
+    def respond(self, method, url, request_headers, body):
+        """
+        Answer one proxied request from the archive or the network.
+
+        Returns:
+            tuple: (status, reason, headers, body bytes), or None for an offline miss.
+        """
+        if self.blocks(url, request_headers.get("Referer") or UNKNOWN_PAGE):
+            return 403, "Blocked", [("Content-Type", "text/plain")], b""
+
+        if self.mode == "live":
+            try:
+                return self._fetch(method, url, request_headers, body, record=False)
+            except (OSError, http.client.HTTPException):
+                self.count("errors")
+                return 502, "Bad Gateway", [("Content-Type", "text/plain")], b"Upstream request failed"
+
+        key = TrafficArchive.key(method, url, body)
+        if self.mode != "record":
+            recorded = self.archive.get(key)
+            if recorded is not None:
+                self.count("hits")
+                return recorded
+            self.count("misses")
+            if self.mode == "offline":
+                return None
+
+        try:
+            status, reason, headers, content = self._fetch(method, url, request_headers, body)
+        except (OSError, http.client.HTTPException):
+            self.count("errors")
+            return 502, "Bad Gateway", [("Content-Type", "text/plain")], b"Upstream request failed"
+        self.archive.put(key, status, reason, headers, content)
+        self.count("recorded")
+        return status, reason, headers, content
+
+    def _fetch(self, method, url, request_headers, body, record=True):
+        parts = urlsplit(url)
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        dropped = HOP_BY_HOP | CONDITIONAL if record else HOP_BY_HOP
+        headers = {name: value for name, value in request_headers.items() if name.lower() not in dropped}
+        if body:
+            headers["Content-Length"] = str(len(body))
+
+        connection = self._pool.get(parts.scheme, parts.hostname, port)
+        try:
+            connection.request(method, path, body=body or None, headers=headers)
+            response = connection.getresponse()
+            content = response.read()
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            raise
+        if response.will_close:
+            connection.close()
+        else:
+            self._pool.put(parts.scheme, parts.hostname, port, connection)
+        kept = [(name, value) for name, value in response.getheaders() if name.lower() not in HOP_BY_HOP]
+        return response.status, response.reason, kept, content
+
+    # ---------- Hooks ----------
+    def hit_rate(self):
+        looked_up = self.counts["hits"] + self.counts["misses"]
+        return self.counts["hits"] / looked_up if looked_up else None
+
+    def pytest_sessionfinish(self, session):
+        self.stop()
+        config = session.config
+        if hasattr(config, "workeroutput"):
+            # Running inside an xdist worker: the controller merges the index once for everyone
+            config.workeroutput["traffic_replay"] = {"counts": self.counts, "added": self.archive.added}
+        else:
+            self.archive.save()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        output = getattr(node, "workeroutput", {}).get("traffic_replay")
+        if not output:
+            return
+        for name, value in output["counts"].items():
+            self.counts[name] += value
+        self.archive.save(output["added"])
+
+    def pytest_terminal_summary(self, terminalreporter, config):
+        # In live mode the proxy only filters; the blocker reports what it refused
+        if self.mode == "live" or not any(self.counts.values()):
+            return
+        counts = self.counts
+        hit_rate = self.hit_rate()
+        terminalreporter.section(f"Traffic {self.mode}")
+        terminalreporter.write_line(
+            (f"Hit rate {hit_rate * 100:.1f}%: " if hit_rate is not None else "")
+            + f"{counts['hits']} served from the archive, {counts['misses']} misses, "
+              f"{counts['recorded']} recorded, {counts['errors']} upstream errors"
+        )
+        if counts["tunnelled"]:
+            terminalreporter.write_line(
+                f"{counts['tunnelled']} HTTPS connections tunnelled without recording (openssl not found)"
+            )
+        terminalreporter.write_line(f"Archive: {self.archive.directory} ({len(self.archive.entries)} responses)")
+
+
+def _tls_context(directory):
+    # One self-signed certificate for every host; the browser is told to ignore certificate errors
+    cert_path = os.path.join(directory, "proxy.crt")
+    key_path = os.path.join(directory, "proxy.key")
+    if not (os.path.exists(cert_path) and os.path.exists(key_path)):
+        openssl = shutil.which("openssl")
+        if openssl is None:
+            return None
+        os.makedirs(directory, exist_ok=True)
+        # xdist workers may race here: generate under private names, then move into place
+        suffix = f".{os.getpid()}.tmp"
+        try:
+            subprocess.run([openssl, "req", "-x509", "-newkey", "ec", "-pkeyopt", "ec_paramgen_curve:prime256v1",
+                            "-nodes", "-days", "3650", "-subj", "/CN=localhost", "-keyout", key_path + suffix,
+                            "-out", cert_path + suffix], check=True, capture_output=True)
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        os.replace(key_path + suffix, key_path)
+        os.replace(cert_path + suffix, cert_path)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_path, key_path)
+    return context
+
+
+if __name__ == "__main__":
+    # python -m unititlies.harProxy Reports/traffic Reports/traffic.har
+    archive = TrafficArchive(sys.argv[1] if len(sys.argv) > 1 else ARCHIVE_DIR)
+    har_path = sys.argv[2] if len(sys.argv) > 2 else os.path.join(archive.directory, "traffic.har")
+    archive.export_har(har_path)
+    print(f"{len(archive.entries)} responses written to {har_path}")
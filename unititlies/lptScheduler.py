@@ -0,0 +1,183 @@
+import heapq
+import json
+import os
+import statistics
+
+import pytest
+
+try:
+    from xdist.scheduler import LoadScopeScheduling
+except ImportError:  # pytest-xdist is optional: without it tests run in one process and nothing is scheduled
+    LoadScopeScheduling = None
+
+# Assumed duration of a test that has never run, when there is no history at all
+DEFAULT_TEST_SECONDS = 5.0
+# xdist modes LPTScheduling replaces; every other --dist keeps its own scheduler
+LPT_DIST_MODES = ("load", "loadscope")
+
+
+class DurationScheduler:
+    """
+    pytest plugin that records how long every test takes (setup + call +
+    teardown) and, under xdist, hands out work longest-first (LPT): the
+    slowest remaining unit always goes to the next worker that frees up.
+
+    Tests of one class share the section their setup navigates to, so a
+    class is kept together as one unit; a class that alone would take longer
+    than an even share of the run is split into single tests so it cannot
+    keep one worker busy while the others idle.
+
+    The end of the run reports the makespan predicted from history against
+    the one measured.
+    """
+
+    def __init__(self, durations_path, smoothing=0.5):
+        """
+        Args:
+            durations_path (str): JSON file of per-test durations, created if missing.
+            smoothing (float): Weight of the newest run in the stored duration (exponential average).
+        """
+        self.durations_path = durations_path
+        self.smoothing = smoothing
+        self.durations = {}
+        if os.path.exists(durations_path):
+            with open(durations_path, "r") as file:
+                self.durations = json.load(file)
+        self.measured = {}      # test id -> seconds this run
+        self.worker_busy = {}   # worker id -> seconds spent running tests this run
+        self.predicted_makespan = None
+
+    # ---------- Prediction ----------
+    def predict(self, nodeid):
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        return statistics.median(self.durations.values()) if self.durations else DEFAULT_TEST_SECONDS
+
+    def plan_units(self, nodeids, workers):
+        """
+        Group tests into work units: one per test class, split into single
+        tests when the class is longer than total / workers.
+
+        Returns:
+            dict: test id -> unit name.
+        """
+        classes = {}
+        for nodeid in nodeids:
+            classes.setdefault(nodeid.rsplit("::", 1)[0], []).append(nodeid)
+        share = sum(self.predict(nodeid) for nodeid in nodeids) / max(1, workers)
+
+        units = {}
+        for scope, members in classes.items():
+            split = len(members) > 1 and sum(self.predict(nodeid) for nodeid in members) > share
+            for nodeid in members:
+                units[nodeid] = nodeid if split else scope
+        return units
+
+    @staticmethod
+    def lpt_makespan(unit_seconds, workers):
+        """
+        Makespan of LPT list scheduling: longest unit first, each to the least loaded worker.
+        LPTScheduling hands out work the same way (one unit per idle worker, no prefetch).
+        """
+        loads = [0.0] * max(1, workers)
+        for seconds in sorted(unit_seconds, reverse=True):
+            heapq.heapreplace(loads, loads[0] + seconds)
+        return max(loads)
+
+    # ---------- Hooks ----------
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        if LoadScopeScheduling is None:
+            return None
+        dist = config.getvalue("dist")
+        if dist not in LPT_DIST_MODES:
+            # Other modes (each, loadfile, loadgroup, worksteal) have their own grouping rules: keep them
+            config.issue_config_time_warning(pytest.PytestConfigWarning(
+                f"--lpt-schedule only applies to --dist {' or '.join(LPT_DIST_MODES)}; "
+                f"keeping the xdist scheduler for --dist {dist} (durations are still recorded)"
+            ), stacklevel=2)
+            return None
+        return LPTScheduling(config, log, self)
+
+    def pytest_runtest_logreport(self, report):
+        self.measured[report.nodeid] = self.measured.get(report.nodeid, 0.0) + report.duration
+        node = getattr(report, "node", None)  # set by xdist on the controller
+        worker = node.gateway.id if node is not None else "main"
+        self.worker_busy[worker] = self.worker_busy.get(worker, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(session.config, "workerinput"):
+            return
+        for nodeid, seconds in self.measured.items():
+            previous = self.durations.get(nodeid)
+            new = seconds if previous is None else self.smoothing * seconds + (1 - self.smoothing) * previous
+            self.durations[nodeid] = round(new, 3)
+
+        directory = os.path.dirname(self.durations_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = self.durations_path + ".tmp"
+        with open(temp_path, "w") as file:
+            json.dump(self.durations, file, indent=2, sort_keys=True)
+        os.replace(temp_path, self.durations_path)
+
+    def pytest_terminal_summary(self, terminalreporter, config):
+        if self.predicted_makespan is None or not self.worker_busy:
+            return
+        actual = max(self.worker_busy.values())
+        terminalreporter.section("LPT scheduling")
+        terminalreporter.write_line(
+            f"Makespan predicted: {self.predicted_makespan:.1f}s, actual: {actual:.1f}s "
+            f"({len(self.worker_busy)} workers, {sum(self.worker_busy.values()):.1f}s of test time)"
+        )
+        for worker, seconds in sorted(self.worker_busy.items()):
+            terminalreporter.write_line(f"{worker:>6}  {seconds:8.1f}s busy")
+
+
+if LoadScopeScheduling is not None:
+    class LPTScheduling(LoadScopeScheduling):
+        """
+        xdist scheduler: the work units of DurationScheduler.plan_units, handed
+        out longest predicted unit first, one at a time to whichever worker runs
+        out of work (LoadScopeScheduling would prefetch a second unit per worker).
+
+        Written against pytest-xdist 3.8: it relies on LoadScopeScheduling
+        internals (`workqueue`, `assigned_work`, `_assign_work_unit`,
+        `_reschedule`, `_pending_of`, `_split_scope`) that are not public API,
+        so re-check these overrides when upgrading xdist.
+        """
+
+        def __init__(self, config, log, plugin):
+            super().__init__(config, log)
+            self.plugin = plugin
+            self._units = None
+            self._ordered = False
+
+        def _split_scope(self, nodeid):
+            if self._units is None:
+                self._units = self.plugin.plan_units(self.collection, len(self.nodes))
+            return self._units.get(nodeid, nodeid)
+
+        def _assign_work_unit(self, node):
+            if not self._ordered:
+                # The queue is complete by the first assignment: sort it longest-first once
+                seconds = {scope: sum(self.plugin.predict(nodeid) for nodeid in work_unit)
+                           for scope, work_unit in self.workqueue.items()}
+                ordered = sorted(self.workqueue.items(), key=lambda item: seconds[item[0]], reverse=True)
+                self.workqueue.clear()
+                self.workqueue.update(ordered)
+                self._ordered = True
+                self.plugin.predicted_makespan = self.plugin.lpt_makespan(seconds.values(), len(self.nodes))
+            super()._assign_work_unit(node)
+
+        def _reschedule(self, node):
+            if node.shutting_down:
+                return
+            if not self.workqueue:
+                node.shutdown()
+                return
+            # A worker only runs a test once it knows the next one (or is shut down), so it
+            # holds back the last test of its unit: one pending test means the worker is idle
+            if self._pending_of(self.assigned_work[node]) > 1:
+                return
+            self._assign_work_unit(node)
@@ -0,0 +1,133 @@
+import json
+import os
+import statistics
+
+import pytest
+
+
+class PerformanceBudget:
+    """
+    pytest plugin that enforces per-test performance budgets and watches for slowdowns.
+
+    The budget file maps test node ids to limits for the test body (the call
+    phase, so browser startup and pooling do not count):
+
+        {
+            "default": {"max_seconds": 60},
+            "testCases/test_Handle_Table.py::TestTableHandling::test_search_and_edit":
+                {"max_seconds": 15, "max_commands": 120}
+        }
+
+    A test over its budget fails. Every run's call duration is added to a
+    rolling history; a test is flagged as regressed when the median of its
+    latest runs is more than `threshold` slower than the median before them.
+    """
+
+    def __init__(self, budget_path, history_path, threshold=0.25, window=20, recent=3, profiler=None):
+        """
+        Args:
+            budget_path (str): JSON budget file (see above).
+            history_path (str): JSON file with the rolling duration history, created if missing.
+            threshold (float): Allowed slowdown of the median, e.g. 0.25 for 25%.
+            window (int): Number of past runs kept per test.
+            recent (int): Number of latest runs whose median is compared with the older ones.
+            profiler (CommandProfiler): Source of the call-phase WebDriver command counts, None to skip max_commands.
+        """
+        self.budgets = _load_json(budget_path)
+        self.default = self.budgets.pop("default", {})
+        self.budgets = {_normalize(nodeid): limits for nodeid, limits in self.budgets.items()}
+        self.history_path = history_path
+        self.history = _load_json(history_path)
+        self.threshold = threshold
+        self.window = window
+        self.recent = recent
+        self.profiler = profiler
+        self.violations = {}   # test id -> messages
+        self.regressions = {}  # test id -> (baseline median, recent median)
+
+    def budget_for(self, nodeid):
+        return {**self.default, **self.budgets.get(_normalize(nodeid), {})}
+
+    # ---------- Enforcement (runs where the test runs) ----------
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        report = yield
+        if call.when != "call":
+            return report
+
+        # Only the commands the test body sent: setup navigation and pool resets vary with how it was launched
+        commands = self.profiler.phase_commands.get((item.nodeid, "call"), 0) if self.profiler else None
+        # Travels with the report, so it also reaches the xdist controller
+        if commands is not None:
+            report.user_properties.append(("webdriver_commands", commands))
+
+        if report.passed:
+            budget = self.budget_for(item.nodeid)
+            problems = []
+            if "max_seconds" in budget and report.duration > budget["max_seconds"]:
+                problems.append(f"took {report.duration:.2f}s, budget {budget['max_seconds']}s")
+            if commands is not None and "max_commands" in budget and commands > budget["max_commands"]:
+                problems.append(f"sent {commands} WebDriver commands, budget {budget['max_commands']}")
+            if problems:
+                report.outcome = "failed"
+                report.longrepr = f"Performance budget exceeded: {'; '.join(problems)}"
+        return report
+
+    # ---------- History (runs on the controller) ----------
+    def pytest_runtest_logreport(self, report):
+        if report.when != "call" or report.skipped:
+            return
+        if report.failed and str(report.longrepr).startswith("Performance budget exceeded"):
+            self.violations[report.nodeid] = str(report.longrepr)
+        elif report.failed:
+            return  # a broken test says nothing about speed
+
+        key = _normalize(report.nodeid)
+        runs = self.history.setdefault(key, [])
+        runs.append(round(report.duration, 3))
+        del runs[:-self.window]
+
+        if len(runs) >= self.recent * 2:
+            baseline = statistics.median(runs[:-self.recent])
+            latest = statistics.median(runs[-self.recent:])
+            if baseline > 0 and latest > baseline * (1 + self.threshold):
+                self.regressions[report.nodeid] = (baseline, latest)
+
+    def pytest_sessionfinish(self, session):
+        if not hasattr(session.config, "workerinput"):
+            _save_json(self.history_path, self.history)
+
+    def pytest_terminal_summary(self, terminalreporter, config):
+        if not self.violations and not self.regressions:
+            return
+        terminalreporter.section("Performance budgets")
+        for nodeid, message in sorted(self.violations.items()):
+            terminalreporter.write_line(f"OVER BUDGET  {nodeid}: {message}")
+        for nodeid, (baseline, latest) in sorted(self.regressions.items()):
+            terminalreporter.write_line(
+                f"REGRESSED    {nodeid}: median {latest:.2f}s over the last {self.recent} runs, "
+                f"was {baseline:.2f}s (+{(latest / baseline - 1) * 100:.0f}%)"
+            )
+
+
+def _normalize(nodeid):
+    # Node ids are relative to the rootdir (testCases/ when its pytest.ini is used); accept both forms
+    return nodeid[len("testCases/"):] if nodeid.startswith("testCases/") else nodeid
+
+
+def _save_json(path, data):
+    # Write to a temporary file first so an interrupted run never leaves a half-written history
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as file:
+        json.dump(data, file, indent=2)
+    os.replace(temp_path, path)
+
+
+def _load_json(path):
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, "r") as file:
+        return json.load(file)
@@ -12,8 +12,41 @@ class ReadConfig:
     def get_application_url():
         """
         Retrieves the application base URL from the configuration file.
+        With [REPLICA] Enabled, this is the URL of the local replica server instead
+        (started on first use, one per test process).
 
         Returns:
             str: The base URL of the application.
         """
-        return config.get('COMMON', 'BaseURL', fallback=None)
\ No newline at end of file
+        if ReadConfig.replica_enabled():
+            from unititlies.replicaServer import shared_replica
+            return shared_replica(config.getint('REPLICA', 'Port', fallback=0)).base_url
+        return config.get('COMMON', 'BaseURL', fallback=None)
+
+    @staticmethod
+    def replica_enabled():
+        """
+        Whether the tests run against the local replica server instead of the live site.
+        """
+        return config.getboolean('REPLICA', 'Enabled', fallback=False)
+
+    @staticmethod
+    def localize_url(url):
+        """
+        Maps an expected live-site URL from the test data (e.g. https://demoqa.com/)
+        to the application under test: unchanged live, the replica's URL otherwise.
+        """
+        if not ReadConfig.replica_enabled():
+            return url
+        from unititlies.replicaServer import localize_url
+        return localize_url(url, ReadConfig.get_application_url())
+
+    @staticmethod
+    def get_log_level():
+        """
+        Retrieves the test log level from the configuration file.
+
+        Returns:
+            str: The log level name, INFO when not configured.
+        """
+        return config.get('LOGGING', 'Level', fallback='INFO')
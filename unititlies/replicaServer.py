@@ -0,0 +1,179 @@
+import atexit
+import os
+import struct
+import threading
+import zlib
+from urllib.parse import urljoin
+
+from unititlies.stubServer import StubServer, _StubHandler
+
+REPLICA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "replica")
+
+# Live origins the replica stands in for; URLs on them map to the replica (see localize_url)
+REPLICATED_ORIGINS = ("https://demoqa.com/", "https://the-internet.herokuapp.com/")
+
+# Sidebar groups: heading -> [(item text, path)], as on the live site
+SIDEBAR = {
+    "Elements": [
+        ("Text Box", "/text-box"),
+        ("Check Box", "/checkbox"),
+        ("Radio Button", "/radio-button"),
+        ("Web Tables", "/webtables"),
+        ("Buttons", "/buttons"),
+        ("Links", "/links"),
+        ("Broken Links - Images", "/broken"),
+        ("Upload and Download", "/upload-download"),
+        ("Dynamic Properties", "/dynamic-properties"),
+    ],
+    "Forms": [
+        ("Practice Form", "/automation-practice-form"),
+    ],
+    "Alerts, Frame & Windows": [
+        ("Browser Windows", "/browser-windows"),
+        ("Alerts", "/alerts"),
+        ("Frames", "/frames"),
+        ("Nested Frames", "/nestedframes"),
+        ("Modal Dialogs", "/modal-dialogs"),
+    ],
+    "Widgets": [
+        ("Accordian", "/accordian"),
+        ("Auto Complete", "/auto-complete"),
+    ],
+}
+
+# Category pages opened from the home cards: path -> heading
+SECTIONS = {
+    "/elements": "Elements",
+    "/forms": "Forms",
+    "/alertsWindows": "Alerts, Frame & Windows",
+    "/widgets": "Widgets",
+    "/interaction": "Interactions",
+    "/books": "Book Store",
+}
+
+# Pages opened inside new windows and frames: served as they are, without header and sidebar
+STANDALONE_PAGES = ("sample", "sampleiframe")
+
+
+def _read(name):
+    with open(os.path.join(REPLICA_DIR, name), "r", encoding="utf-8") as file:
+        return file.read()
+
+
+def _read_bytes(name):
+    with open(os.path.join(REPLICA_DIR, name), "rb") as file:
+        return file.read()
+
+
+def _sidebar():
+    groups = []
+    for heading, items in SIDEBAR.items():
+        entries = "".join(f'<li class="btn btn-light" data-path="{path}"><span class="text">{text}</span></li>'
+                          for text, path in items)
+        groups.append(f'<div class="element-group"><div class="header-text">{heading.replace("&", "&amp;")}</div>'
+                      f'<ul class="menu-list">{entries}</ul></div>')
+    return '<div class="left-pannel">' + "".join(groups) + "</div>"
+
+
+def render_pages():
+    """
+    Build every replica page from the fragments in unititlies/replica.
+
+    Returns:
+        dict: URL path -> HTML.
+    """
+    layout = _read("layout.html")
+    sidebar = _sidebar()
+
+    def page(content, with_sidebar=True):
+        return layout.replace("<!-- sidebar -->", sidebar if with_sidebar else "").replace("<!-- content -->", content)
+
+    pages = {"/": page(_read("home.html"), with_sidebar=False)}
+    section = _read("section.html")
+    for path, heading in SECTIONS.items():
+        pages[path] = page(section.replace("<!-- heading -->", heading.replace("&", "&amp;")))
+    for items in SIDEBAR.values():
+        for _, path in items:
+            pages[path] = page(_read(path.lstrip("/") + ".html"))
+    for name in STANDALONE_PAGES:
+        pages["/" + name] = _read(name + ".html")
+    return pages
+
+
+def solid_png(width, height, rgb):
+    """
+    A single-colour PNG, built with the standard library only.
+    """
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    row = b"\x00" + bytes(rgb) * width
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(row * height, 9))
+            + chunk(b"IEND", b""))
+
+
+class _ReplicaHandler(_StubHandler):
+    API_STATUSES = {
+        **_StubHandler.API_STATUSES,
+        "/status_codes/500": 500,  # target of 'Click Here for Broken Link'
+    }
+
+    PAGES = render_pages()
+
+    # The logo decodes (valid image); /images/Toolsqa_1.jpg stays a 404 (broken image).
+    # The download is a committed file, so its SHA-256 in TestData never changes.
+    ASSETS = {
+        "/images/Toolsqa.jpg": (solid_png(347, 100, (0, 122, 204)), "image/png", {}),
+        "/sampleFile.jpeg": (_read_bytes("sampleFile.jpeg"), "application/octet-stream",
+                             {"Content-Disposition": 'attachment; filename="sampleFile.jpeg"'}),
+    }
+
+
+class ReplicaServer(StubServer):
+    """
+    Local HTTP server with deterministic replicas of every demoqa page the page
+    objects touch: the home cards, the Elements, Forms, Alerts/Frames/Windows
+    and Widgets sections, plus the status endpoints behind the Links page.
+
+    Pages are plain HTML fragments in unititlies/replica wrapped in a shared
+    header and sidebar; the widgets (web table, date picker, auto-complete,
+    modals, ...) are small scripts that keep the live ids and classes, so the
+    page objects run unchanged. Enable it with [REPLICA] Enabled in config.ini.
+
+    Usage:
+        with ReplicaServer() as server:
+            Navigator(driver, server.base_url).navigate_to("Web Tables")
+    """
+
+    def __init__(self, host="127.0.0.1", port=0):
+        super().__init__(host, port, handler_class=_ReplicaHandler)
+
+
+# Replica shared by everything in this process (one per xdist worker)
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def shared_replica(port=0):
+    """
+    Start the process-wide replica on first use; it is stopped when the process exits.
+    """
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = ReplicaServer(port=port).start()
+            atexit.register(_shared.stop)
+        return _shared
+
+
+def localize_url(url, base_url):
+    """
+    Map a URL on one of the REPLICATED_ORIGINS to the same path on `base_url`;
+    other URLs are returned unchanged.
+    """
+    for origin in REPLICATED_ORIGINS:
+        if url.startswith(origin) or url == origin.rstrip("/"):
+            return urljoin(base_url, url[len(origin):])
+    return url
@@ -0,0 +1,156 @@
+import json
+import os
+import re
+import threading
+
+import pytest
+from selenium.webdriver.remote.command import Command
+
+BLOCKLIST_PATH = os.path.join(".", "Configuration", "blocklist.txt")
+
+# Page the proxy filter reports a blocked request under when the browser sent no Referer
+UNKNOWN_PAGE = "(unknown page)"
+
+
+def load_patterns(path=BLOCKLIST_PATH):
+    """
+    Read a blocklist: one URL pattern per line, '*' matches any characters,
+    blank lines and lines starting with '#' are ignored.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        return [line.strip() for line in file if line.strip() and not line.lstrip().startswith("#")]
+
+
+class RequestBlocker:
+    """
+    Network-level ad and analytics blocking, replacing the uBlock Origin extension.
+
+    Chromium browsers (Chrome, Edge) get the patterns through CDP
+    Network.setBlockedURLs, so blocked requests never leave the browser.
+    CDP commands only reach the current tab, so blocking is applied again to
+    every window or tab the test switches to. Requests a new tab sends before
+    the test switches to it (its first page load) are not blocked.
+    Other browsers are pointed at the local proxy (see harProxy.ReplayProxy),
+    which answers blocked HTTP requests with 403 and refuses CONNECT to blocked
+    HTTPS hosts.
+
+    Also a pytest plugin: blocked requests per page, and the bytes that saved
+    when their size is known from a recorded traffic archive.
+    """
+
+    def __init__(self, patterns, sizes=None):
+        """
+        Args:
+            patterns (list): URL patterns in the Network.setBlockedURLs format ('*' wildcards).
+            sizes (dict): URL -> response size in bytes, for the bytes-saved figure (e.g. from a
+                TrafficArchive recorded without blocking). Unknown URLs count as blocked only.
+        """
+        self.patterns = patterns
+        self.sizes = sizes or {}
+        # One alternation for all patterns: a single regex search per request
+        self._regex = re.compile("|".join(".*".join(map(re.escape, pattern.split("*"))) for pattern in patterns)) \
+            if patterns else None
+        self.pages = {}  # page URL -> [blocked requests, bytes saved, requests of unknown size]
+        self._lock = threading.Lock()
+
+    def matches(self, url):
+        return self._regex is not None and self._regex.fullmatch(url) is not None
+
+    # ---------- Browser ----------
+    def apply(self, driver):
+        """
+        Turn blocking on in a Chromium browser, for the current window and every
+        window the driver switches to afterwards.
+
+        Returns:
+            bool: True if the browser blocks by itself, False if it needs the proxy filter (e.g. Firefox).
+        """
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return False
+        self._block_current_window(driver)
+        self._follow_windows(driver)
+        return True
+
+    def _block_current_window(self, driver):
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns})
+
+    def _follow_windows(self, driver):
+        # Wrap driver.execute (like CommandProfiler.wrap) to block in each window it switches to
+        if getattr(driver, "_request_blocker", None) is self:
+            return
+        execute = driver.execute
+
+        def execute_and_block(driver_command, params=None):
+            result = execute(driver_command, params)
+            if driver_command == Command.SWITCH_TO_WINDOW:
+                self._block_current_window(driver)
+            return result
+
+        driver.execute = execute_and_block
+        driver._request_blocker = self
+
+    def collect(self, driver):
+        """
+        Count the requests a Chromium browser blocked since the last call, from its
+        performance log (the driver must be started with the network log enabled).
+        """
+        try:
+            entries = driver.get_log("performance")
+        except Exception:
+            return  # no performance log (not Chromium, or not enabled at launch)
+
+        requests = {}  # request id -> (url, page)
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            params = message.get("params", {})
+            if message["method"] == "Network.requestWillBeSent":
+                requests[params["requestId"]] = (params["request"]["url"], params.get("documentURL") or UNKNOWN_PAGE)
+            elif message["method"] == "Network.loadingFailed" and params.get("blockedReason") == "inspector":
+                url, page = requests.get(params["requestId"], (None, UNKNOWN_PAGE))
+                self.record(page, url)
+
+    def record(self, page, url):
+        size = self.sizes.get(url)
+        with self._lock:
+            counts = self.pages.setdefault(page, [0, 0, 0])
+            counts[0] += 1
+            if size is None:
+                counts[2] += 1
+            else:
+                counts[1] += size
+
+    def merge(self, pages):
+        with self._lock:
+            for page, (blocked, saved, unknown) in pages.items():
+                counts = self.pages.setdefault(page, [0, 0, 0])
+                counts[0] += blocked
+                counts[1] += saved
+                counts[2] += unknown
+
+    # ---------- Hooks ----------
+    def pytest_sessionfinish(self, session):
+        config = session.config
+        if hasattr(config, "workeroutput"):
+            # Running inside an xdist worker: hand the counters to the controller
+            config.workeroutput["request_blocker"] = self.pages
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        pages = getattr(node, "workeroutput", {}).get("request_blocker")
+        if pages:
+            self.merge(pages)
+
+    def pytest_terminal_summary(self, terminalreporter, config):
+        if not self.pages:
+            return
+        blocked = sum(counts[0] for counts in self.pages.values())
+        saved = sum(counts[1] for counts in self.pages.values())
+        unknown = sum(counts[2] for counts in self.pages.values())
+        terminalreporter.section("Blocked requests")
+        terminalreporter.write_line(
+            f"{blocked} requests blocked on {len(self.pages)} page(s), {saved / 1024:.0f} KiB saved"
+            + (f" ({unknown} of unknown size)" if unknown else "")
+        )
+        for page, (count, size, _) in sorted(self.pages.items(), key=lambda item: item[1][0], reverse=True)[:10]:
+            terminalreporter.write_line(f"{count:6d} {size / 1024:8.0f} KiB  {page}")
@@ -0,0 +1,252 @@
+import base64
+import hashlib
+import io
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional: without it screenshots are stored as the browser sent them
+    Image = None
+
+SCREENSHOT_DIR = os.path.join(".", "Screenshots")
+# Content-addressed copies; the named screenshots are hard links to these
+STORE_DIR_NAME = ".store"
+
+# Service used by capture_screenshot (set by the pytest plugin registration in conftest)
+_service = None
+
+
+class ScreenshotService:
+    """
+    Failure screenshots without blocking the test.
+
+    capture() only fetches the PNG from the browser (base64, one WebDriver
+    command); decoding, compressing and writing happen on a background thread.
+    Identical images are stored once (by SHA-256 of the browser's PNG) and every
+    requested file name is a hard link to that copy. Total disk usage is capped
+    by evicting the least recently used images, across runs.
+
+    Also a pytest plugin: screenshots taken during a test are attached to its
+    pytest-html report, and the counters and screenshots that could not be
+    saved are reported once at the end of the run (merged from every xdist worker).
+    """
+
+    def __init__(self, directory=SCREENSHOT_DIR, max_bytes=200 * 1024 * 1024, palette=True):
+        """
+        Args:
+            directory (str): Screenshot directory.
+            max_bytes (int): Disk budget for the directory, 0 for no limit.
+            palette (bool): With Pillow, store 256-colour PNGs (much smaller for web pages);
+                otherwise PNGs are only re-encoded losslessly with maximum compression.
+        """
+        self.directory = directory
+        self.store_dir = os.path.join(directory, STORE_DIR_NAME)
+        self.max_bytes = max_bytes
+        self.palette = palette
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshots")
+        self._lock = threading.Lock()
+        self._current_test = None
+        self._by_test = {}  # test id -> screenshot paths taken during it
+        self._pending = []  # (path, Future) of every capture, checked for errors on close
+        self.failures = []  # "path: error" of screenshots that could not be saved
+        self.captured = 0
+        self.deduplicated = 0
+        self.bytes_written = 0
+        self.evicted = 0
+
+    # ---------- Capture ----------
+    def capture(self, driver, path):
+        """
+        Take a screenshot and save it to `path` in the background.
+
+        Returns:
+            Future: Resolves to the path once the file is written.
+        """
+        payload = driver.get_screenshot_as_base64()
+        with self._lock:
+            self.captured += 1
+            if self._current_test is not None:
+                self._by_test.setdefault(self._current_test, []).append(path)
+            future = self._executor.submit(self._store, payload, path)
+            self._pending.append((path, future))
+        return future
+
+    def _store(self, payload, path):
+        png = base64.b64decode(payload)
+        digest = hashlib.sha256(png).hexdigest()
+        os.makedirs(self.store_dir, exist_ok=True)
+        blob = os.path.join(self.store_dir, digest + ".png")
+
+        if os.path.exists(blob):
+            with self._lock:
+                self.deduplicated += 1
+            os.utime(blob)  # mark as recently used for the LRU cap
+        else:
+            data = self._compress(png)
+            # Unique per writer: xdist workers may store the same image at the same time
+            temp_path = f"{blob}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, blob)
+            with self._lock:
+                self.bytes_written += len(data)
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if os.path.exists(path) and os.path.samefile(blob, path):
+            return path  # already linked to this image (same name, same picture)
+        # Link under a temporary name, then replace: an existing file is swapped atomically
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.link(blob, temp_path)
+        except OSError:
+            # File system without hard links: fall back to a copy
+            shutil.copyfile(blob, temp_path)
+        os.replace(temp_path, path)
+        return path
+
+    def _compress(self, png):
+        if Image is None:
+            return png
+        with Image.open(io.BytesIO(png)) as image:
+            if self.palette:
+                image = image.convert("RGB").quantize(colors=256)
+            output = io.BytesIO()
+            image.save(output, format="PNG", optimize=True)
+        data = output.getvalue()
+        return data if len(data) < len(png) else png
+
+    # ---------- Disk cap ----------
+    def enforce_cap(self):
+        """
+        Delete the least recently used images until the directory fits in max_bytes.
+        Every file name linked to an evicted image is removed with it.
+
+        Returns:
+            int: Number of images evicted.
+        """
+        if not self.max_bytes or not os.path.isdir(self.directory):
+            return 0
+
+        images = {}  # inode -> [last used, size, paths]
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                image = images.setdefault((stat.st_dev, stat.st_ino), [0.0, stat.st_size, []])
+                image[0] = max(image[0], stat.st_mtime)
+                image[2].append(path)
+
+        total = sum(size for _, size, _ in images.values())
+        evicted = 0
+        for _, size, paths in sorted(images.values(), key=lambda image: image[0]):
+            if total <= self.max_bytes:
+                break
+            for path in paths:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+            evicted += 1
+        return evicted
+
+    def close(self):
+        """
+        Finish every pending write, record the ones that failed, then apply the disk cap.
+        """
+        self._executor.shutdown(wait=True)
+        for path, future in self._pending:
+            error = future.exception()
+            if error is not None:
+                self.failures.append(f"{path}: {type(error).__name__}: {error}")
+        self._pending = []
+        return self.enforce_cap()
+
+    # ---------- Hooks ----------
+    def pytest_runtest_logstart(self, nodeid, location):
+        self._current_test = nodeid
+
+    def pytest_runtest_logfinish(self, nodeid, location):
+        self._current_test = None
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        report = yield
+        with self._lock:
+            paths = self._by_test.pop(item.nodeid, []) if call.when == "teardown" or report.failed else []
+        pytest_html = item.config.pluginmanager.getplugin("html")
+        if paths and pytest_html is not None:
+            # Link the files instead of embedding them, so the report stays small
+            report_dir = os.path.dirname(os.path.abspath(getattr(item.config.option, "htmlpath", None) or "."))
+            extras = getattr(report, "extras", [])
+            for path in paths:
+                extras.append(pytest_html.extras.image(os.path.relpath(os.path.abspath(path), report_dir)))
+            report.extras = extras
+        return report
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session, exitstatus):
+        self.evicted += self.close()  # workers merged in testnodedown are already counted
+        if hasattr(session.config, "workeroutput"):
+            # Running inside an xdist worker: hand the counters and failures to the controller
+            session.config.workeroutput["screenshots"] = {
+                "captured": self.captured,
+                "deduplicated": self.deduplicated,
+                "bytes_written": self.bytes_written,
+                "evicted": self.evicted,
+                "failures": self.failures,
+            }
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        stats = getattr(node, "workeroutput", {}).get("screenshots")
+        if not stats:
+            return
+        self.captured += stats["captured"]
+        self.deduplicated += stats["deduplicated"]
+        self.bytes_written += stats["bytes_written"]
+        self.evicted += stats["evicted"]
+        self.failures.extend(stats["failures"])
+
+    def pytest_terminal_summary(self, terminalreporter, config):
+        if not self.captured and not self.failures:
+            return
+        terminalreporter.section("Screenshots")
+        terminalreporter.write_line(
+            f"{self.captured} captured, {self.deduplicated} duplicates, "
+            f"{self.bytes_written / 1024:.0f} KiB written, {self.evicted} evicted to stay under the disk cap"
+        )
+        for failure in self.failures:
+            terminalreporter.write_line(f"NOT SAVED  {failure}")
+
+
+def set_service(service):
+    """
+    Make `service` the one used by capture_screenshot.
+    """
+    global _service
+    _service = service
+
+
+def capture_screenshot(driver, path):
+    """
+    Save a screenshot of the browser to `path`: in the background through the
+    configured ScreenshotService, or directly when none is configured.
+    """
+    if _service is None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        driver.save_screenshot(path)
+        return
+    _service.capture(driver, path)
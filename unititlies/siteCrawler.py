@@ -0,0 +1,225 @@
+import json
+import os
+from urllib.parse import urljoin, urldefrag, urlsplit
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from pageObjects.BasePage import BasePage
+from pageObjects.Navigator import Navigator
+from unititlies.linkChecker import LinkChecker
+
+# Targets that are files rather than pages: checked over HTTP but never opened in the browser
+NON_PAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".svg", ".ico", ".pdf", ".zip", ".css", ".js", ".xml", ".txt")
+
+
+class SiteCrawler:
+    """
+    Walks the site starting from the home page and every Navigator section (the
+    pages reachable from the home cards), collects all links of each page with a
+    single script call, and validates the unique targets with a LinkChecker.
+
+    Progress is written to a checkpoint file after every page and every batch of
+    checks, so an interrupted crawl picks up where it stopped. Pages that could
+    not be opened are reported with the broken links rather than dropped.
+    """
+
+    def __init__(self, driver, base_url, checkpoint_path=None, max_pages=100, concurrency=8, rate_limit=5.0,
+                 batch_size=50):
+        """
+        Args:
+            driver (WebDriver): Browser used to render the pages.
+            base_url (str): Site root; only pages on this host are crawled (other hosts are only checked).
+            checkpoint_path (str): JSON file to resume from and save progress to, None to disable.
+            max_pages (int): Maximum number of pages opened in the browser.
+            concurrency (int): Links checked at the same time.
+            rate_limit (float): Maximum requests per second per host.
+            batch_size (int): Links checked between two checkpoint saves.
+        """
+        self.driver = driver
+        self.base_url = base_url
+        self.checkpoint_path = checkpoint_path
+        self.max_pages = max_pages
+        self.concurrency = concurrency
+        self.rate_limit = rate_limit
+        self.batch_size = batch_size
+        self.page = BasePage(driver)
+        self.host = urlsplit(base_url).hostname
+
+        # Crawl state (everything here is saved in the checkpoint)
+        self.queue = []
+        self.visited = []
+        self.links = {}    # target URL -> pages it was found on
+        self.results = {}  # target URL -> LinkChecker result
+        self.crawl_errors = {}  # page URL -> why it could not be crawled
+        self.ignored_checkpoint = None  # base URL of a checkpoint left by a crawl of another site
+        self._load_checkpoint()
+
+    # ---------- Crawl ----------
+    def seed_urls(self):
+        """
+        The home page plus the page of every section in the Navigator route table.
+        """
+        navigator = Navigator(self.driver, self.base_url)
+        return [self.base_url] + [navigator.url_for(section) for section in navigator.ROUTES]
+
+    def crawl(self):
+        """
+        Visit pages, collect their links, then check every unique link.
+        Returns the broken-link report (see broken_links).
+
+        The checkpoint is removed once every link has been checked, so only an
+        unfinished crawl is resumed and the next run starts from scratch.
+        """
+        for url in self.seed_urls():
+            self._enqueue(url)
+
+        while self.queue and len(self.visited) < self.max_pages:
+            url = self.queue.pop(0)
+            self._visit(url)
+            self.visited.append(url)
+            self._save_checkpoint()
+
+        self.check_links()
+        self._clear_checkpoint()
+        return self.broken_links()
+
+    def _visit(self, url):
+        try:
+            self.page.open(url)
+            links = self.page.collect_links()
+        except (TimeoutException, WebDriverException) as e:
+            # Its links were never collected: keep the page in the report instead of skipping it silently
+            self.crawl_errors[url] = f"{type(e).__name__}: {e.msg}"
+            return
+
+        for link in links:
+            target = self._normalize(link["url"], url)
+            if target is None:
+                continue
+            sources = self.links.setdefault(target, [])
+            if url not in sources:
+                sources.append(url)
+            if self._is_crawlable(target):
+                self._enqueue(target)
+
+    def _enqueue(self, url):
+        if url not in self.visited and url not in self.queue:
+            self.queue.append(url)
+
+    def _normalize(self, url, page_url):
+        if not url:
+            return None
+        url, _ = urldefrag(urljoin(page_url, url))
+        if urlsplit(url).scheme not in ("http", "https"):
+            return None  # mailto:, tel:, javascript:
+        return url
+
+    def _is_crawlable(self, url):
+        parts = urlsplit(url)
+        return parts.hostname == self.host and not parts.path.lower().endswith(NON_PAGE_EXTENSIONS)
+
+    # ---------- Link validation ----------
+    def check_links(self):
+        """
+        Check every collected link that has no result yet, saving progress after each batch.
+        """
+        pending = [url for url in self.links if url not in self.results]
+        if not pending:
+            return
+
+        checker = LinkChecker.from_driver(self.driver, max_workers=self.concurrency, rate_limit=self.rate_limit)
+        try:
+            for start in range(0, len(pending), self.batch_size):
+                self.results.update(checker.check(pending[start:start + self.batch_size]))
+                self._save_checkpoint()
+        finally:
+            checker.close()
+
+    def broken_links(self):
+        """
+        Links that failed or answered with an HTTP error (4xx/5xx), with the pages they appear on.
+        """
+        broken = []
+        for url, result in sorted(self.results.items()):
+            if result["status"] is None or result["status"] >= 400:
+                broken.append({"url": url, "status": result["status"], "reason": result["reason"],
+                               "error": result["error"], "found_on": self.links.get(url, [])})
+        return broken
+
+    def write_report(self, path):
+        """
+        Save the broken-link report (plus crawl totals, pages that could not be
+        crawled and any checkpoint ignored at start) as JSON.
+        """
+        report = {
+            "base_url": self.base_url,
+            "pages_crawled": len(self.visited),
+            "links_found": len(self.links),
+            "links_checked": len(self.results),
+            "broken": self.broken_links(),
+            "crawl_errors": [{"url": url, "error": error} for url, error in sorted(self.crawl_errors.items())],
+            "ignored_checkpoint": self.ignored_checkpoint,
+        }
+        _write_json(path, report)
+        return report
+
+    # ---------- Checkpoint ----------
+    def _load_checkpoint(self):
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return
+        with open(self.checkpoint_path, "r") as file:
+            state = json.load(file)
+        if state.get("base_url") != self.base_url:
+            self.ignored_checkpoint = state.get("base_url")
+            return
+        self.queue = state["queue"]
+        self.visited = state["visited"]
+        self.links = state["links"]
+        self.results = state["results"]
+        self.crawl_errors = state.get("crawl_errors", {})
+
+    def _save_checkpoint(self):
+        if not self.checkpoint_path:
+            return
+        _write_json(self.checkpoint_path, {
+            "base_url": self.base_url,
+            "queue": self.queue,
+            "visited": self.visited,
+            "links": self.links,
+            "results": self.results,
+            "crawl_errors": self.crawl_errors,
+        })
+
+    def _clear_checkpoint(self):
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+
+def _write_json(path, data):
+    # Write to a temporary file first so an interrupted run never leaves a half-written file
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as file:
+        json.dump(data, file, indent=2)
+    os.replace(temp_path, path)
+
+
+def format_crawl_report(report):
+    """
+    Builds the summary lines for a report returned by SiteCrawler.write_report.
+    """
+    lines = [
+        f"Pages crawled: {report['pages_crawled']}, links found: {report['links_found']}, "
+        f"checked: {report['links_checked']}, broken: {len(report['broken'])}, "
+        f"not crawled: {len(report['crawl_errors'])}"
+    ]
+    if report["ignored_checkpoint"]:
+        lines.append(f"Ignored checkpoint for another site: {report['ignored_checkpoint']}")
+    for link in report["broken"]:
+        status = link["status"] if link["status"] is not None else link["error"]
+        lines.append(f"{status}  {link['url']}  (found on {len(link['found_on'])} page(s))")
+    for page in report["crawl_errors"]:
+        lines.append(f"NOT CRAWLED  {page['url']}  ({page['error']})")
+    return lines
@@ -0,0 +1,128 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+
+class SleepAuditor:
+    """
+    pytest plugin that measures how long each test spends in time.sleep.
+
+    Only sleeps called from this project's code are counted, so the polling
+    done inside libraries (e.g. WebDriverWait) does not show up. With a
+    budget set, a test whose setup and body sleep longer than the budget fails.
+
+    Only the thread running the test is charged. Sleeps on worker threads the
+    test started (e.g. HostRateLimiter in the link checker and crawler pools)
+    overlap with each other and with the test, so they are reported separately
+    as background time and never count against the budget.
+    """
+
+    def __init__(self, budget=None, project_root=None):
+        """
+        Args:
+            budget (float): Maximum seconds a single test may sleep, None for no limit.
+            project_root (str): Directory whose code is audited; defaults to the repository root.
+        """
+        self.budget = budget
+        self.project_root = project_root or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.totals = {}
+        self.background = {}  # test id -> seconds slept on other threads
+        self._current = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._real_sleep = time.sleep
+
+    # ---------- time.sleep patching ----------
+    def _audited_sleep(self, seconds):
+        caller = sys._getframe(1).f_code.co_filename
+        start = time.perf_counter()
+        try:
+            self._real_sleep(seconds)
+        finally:
+            current = self._current
+            if current is not None and self._is_project_code(caller):
+                totals = self.totals if threading.get_ident() == self._thread else self.background
+                with self._lock:
+                    totals[current] = totals.get(current, 0.0) + time.perf_counter() - start
+
+    def _is_project_code(self, filename):
+        filename = os.path.abspath(filename)
+        return filename.startswith(self.project_root) and "site-packages" not in filename
+
+    def _start(self, item):
+        self._current = item.nodeid
+        self._thread = threading.get_ident()
+        time.sleep = self._audited_sleep
+
+    def _stop(self):
+        time.sleep = self._real_sleep
+        self._current = None
+        self._thread = None
+
+    # ---------- Hooks ----------
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_setup(self, item):
+        self._start(item)
+        try:
+            return (yield)
+        finally:
+            self._stop()
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_call(self, item):
+        self._start(item)
+        try:
+            result = yield
+        finally:
+            self._stop()
+
+        slept = self.totals.get(item.nodeid, 0.0)
+        if self.budget is not None and slept > self.budget:
+            pytest.fail(f"Test spent {slept:.2f}s in time.sleep, over the --sleep-budget of {self.budget:.2f}s",
+                        pytrace=False)
+        return result
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        self._start(item)
+        try:
+            return (yield)
+        finally:
+            self._stop()
+            # Travels with the teardown report, so it also reaches the xdist controller
+            item.user_properties.append(("sleep_seconds", round(self.totals.get(item.nodeid, 0.0), 3)))
+            item.user_properties.append(("background_sleep_seconds", round(self.background.get(item.nodeid, 0.0), 3)))
+
+    def pytest_terminal_summary(self, terminalreporter, config):
+        totals = {}
+        background = {}
+        for reports in terminalreporter.stats.values():
+            for report in reports:
+                for name, value in getattr(report, "user_properties", []):
+                    if name == "sleep_seconds":
+                        totals[report.nodeid] = value
+                    elif name == "background_sleep_seconds" and value > 0:
+                        background[report.nodeid] = value
+
+        sleepers = {nodeid: seconds for nodeid, seconds in totals.items() if seconds > 0}
+        if not sleepers and not background and self.budget is None:
+            return
+
+        terminalreporter.section("Sleep audit")
+        budget = f"{self.budget:.2f}s per test" if self.budget is not None else "none"
+        terminalreporter.write_line(
+            f"Tests: {len(totals)}, sleeping: {len(sleepers)}, "
+            f"total time in time.sleep: {sum(sleepers.values()):.2f}s, budget: {budget}"
+        )
+        for nodeid, seconds in sorted(sleepers.items(), key=lambda entry: entry[1], reverse=True):
+            marker = "  OVER BUDGET" if self.budget is not None and seconds > self.budget else ""
+            terminalreporter.write_line(f"{seconds:8.2f}s  {nodeid}{marker}")
+        if background:
+            terminalreporter.write_line(
+                f"Worker threads (not budgeted): {sum(background.values()):.2f}s in time.sleep across {len(background)} test(s)"
+            )
+            for nodeid, seconds in sorted(background.items(), key=lambda entry: entry[1], reverse=True):
+                terminalreporter.write_line(f"{seconds:8.2f}s  {nodeid}  (background)")
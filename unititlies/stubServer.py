@@ -0,0 +1,154 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# Offline copy of the parts of demoqa's 'Links' page the tests touch.
+# The API links call the stub endpoints below and print the same message as the live site.
+LINKS_PAGE = """<!DOCTYPE html>
+<html>
+<head><title>Links (stub)</title></head>
+<body>
+<h1>Links</h1>
+<h5><strong>Following links will open new tab</strong></h5>
+<p><a id="simpleLink" href="/" target="_blank">Home</a></p>
+<p><a id="dynamicLink" href="/" target="_blank">HomeStub</a></p>
+<h5><strong>Following links will send an api call</strong></h5>
+<p><a id="created" href="javascript:void(0)">Created</a></p>
+<p><a id="no-content" href="javascript:void(0)">No Content</a></p>
+<p><a id="moved" href="javascript:void(0)">Moved</a></p>
+<p><a id="bad-request" href="javascript:void(0)">Bad Request</a></p>
+<p><a id="unauthorized" href="javascript:void(0)">Unauthorized</a></p>
+<p><a id="forbidden" href="javascript:void(0)">Forbidden</a></p>
+<p><a id="invalid-url" href="javascript:void(0)">Not Found</a></p>
+<p id="linkResponse"></p>
+<script>
+document.querySelectorAll('a[href^="javascript"]').forEach(function (link) {
+    link.addEventListener('click', function () {
+        fetch('/' + link.id, {redirect: 'manual'}).then(function (response) {
+            document.getElementById('linkResponse').innerHTML =
+                'Link has responded with staus <b>' + response.status + '</b> and status text <b>' +
+                response.statusText + '</b>';
+        });
+    });
+});
+</script>
+</body>
+</html>
+"""
+
+HOME_PAGE = """<!DOCTYPE html>
+<html><head><title>DEMOQA (stub)</title></head><body><h1>Home</h1></body></html>
+"""
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the live site
+    disable_nagle_algorithm = True  # headers and body are written separately
+
+    # API endpoint path -> status code returned
+    API_STATUSES = {
+        "/created": 201,
+        "/no-content": 204,
+        "/moved": 301,
+        "/bad-request": 400,
+        "/unauthorized": 401,
+        "/forbidden": 403,
+    }
+
+    PAGES = {
+        "/": HOME_PAGE,
+        "/links": LINKS_PAGE,
+    }
+
+    # Non-HTML files: path -> (body bytes, content type, extra headers)
+    ASSETS = {}
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def _respond(self, send_body):
+        path = self.path.split("?", 1)[0]
+        self.server.hits[path] = self.server.hits.get(path, 0) + 1
+
+        if path in self.PAGES:
+            self._send(200, self.PAGES[path].encode("utf-8"), "text/html; charset=utf-8", send_body)
+        elif path in self.ASSETS:
+            body, content_type, headers = self.ASSETS[path]
+            self._send(200, body, content_type, send_body, headers)
+        elif path in self.API_STATUSES:
+            status = self.API_STATUSES[path]
+            headers = {"Location": "/"} if status == 301 else {}
+            self._send(status, b"", "text/plain", send_body, headers)
+        else:
+            self._send(404, b"Not Found", "text/plain", send_body)
+
+    def _send(self, status, body, content_type, send_body, headers=None):
+        if status == 204:
+            body = b""
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if send_body and body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Keep the test output clean
+        pass
+
+
+class StubServer:
+    """
+    Local HTTP server standing in for demoqa.com in offline runs.
+    Serves the 'Links' page and its API endpoints on 127.0.0.1.
+
+    Usage:
+        with StubServer() as server:
+            Navigator(driver, server.base_url).navigate_to("Links")
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, handler_class=_StubHandler):
+        """
+        Args:
+            host (str): Interface to bind.
+            port (int): Port to bind, 0 picks a free one.
+            handler_class (type): Request handler serving the pages (a _StubHandler subclass).
+        """
+        self._server = ThreadingHTTPServer((host, port), handler_class)
+        self._server.daemon_threads = True
+        self._server.hits = {}
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def hits(self):
+        """
+        Request count per path, for checking what the tests actually called.
+        """
+        return dict(self._server.hits)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stub-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()